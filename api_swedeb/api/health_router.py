@@ -0,0 +1,21 @@
+import fastapi
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+from api_swedeb.api.utils.warmup import get_warm_up, is_warm_up_enabled
+
+router = fastapi.APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/live")
+async def get_live() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def get_ready() -> JSONResponse:
+    """Returns 200 when all warm-up components are loaded, otherwise 503 (with per-component status and timings)"""
+    if not is_warm_up_enabled():
+        return JSONResponse({"ready": True, "warmup": "disabled"})
+    data: dict = get_warm_up().status()
+    return JSONResponse(data, status_code=status.HTTP_200_OK if data['ready'] else status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,69 @@
+import fastapi
+from fastapi.responses import PlainTextResponse
+
+from api_swedeb.api.utils.dependencies import get_cwb_corpus_cache
+from api_swedeb.api.utils.execution import get_execution_pool
+from api_swedeb.core import instrumentation
+from api_swedeb.core.cache import get_corpus_cache, get_cursor_cache, get_protocol_cache, get_result_cache
+from api_swedeb.core.instrumentation import Labels, format_gauges
+from api_swedeb.core.utility import init_stats
+
+router = fastapi.APIRouter(tags=["Metrics"])
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _family(name: str, help_text: str, stats: dict[str, dict], key: str, label: str, kind: str = "gauge") -> list[str]:
+    values: dict[Labels, float] = {((label, item),): data[key] for item, data in stats.items() if key in data}
+    return format_gauges(name, help_text, values, kind=kind)
+
+
+def render_metrics() -> str:
+    """Returns histograms of request and span durations, and execution pool, cache and init counters"""
+    lines: list[str] = instrumentation.registry.render()
+
+    execution: dict[str, dict] = get_execution_pool().stats()
+    lines += _family("swedeb_execution_waiting", "Calls waiting for a slot", execution, 'waiting', 'endpoint')
+    lines += _family("swedeb_execution_running", "Calls running", execution, 'running', 'endpoint')
+    lines += _family(
+        "swedeb_execution_completed_total", "Completed calls", execution, 'completed', 'endpoint', "counter"
+    )
+    lines += _family("swedeb_execution_failed_total", "Failed calls", execution, 'failed', 'endpoint', "counter")
+    lines += _family(
+        "swedeb_execution_wait_seconds_total",
+        "Time spent waiting for a slot",
+        execution,
+        'total_wait_time',
+        'endpoint',
+        "counter",
+    )
+
+    caches: dict[str, dict] = {
+        'result': get_result_cache().stats(),
+        'cursor': get_cursor_cache().stats(),
+        'corpus': get_corpus_cache().stats(),
+        'protocol': get_protocol_cache().stats(),
+    }
+    lines += _family("swedeb_cache_items", "Cached items", caches, 'items', 'cache')
+    lines += _family("swedeb_cache_bytes", "Estimated size of cached items", caches, 'nbytes', 'cache')
+    for key in ('hits', 'misses', 'evictions'):
+        lines += _family(f"swedeb_cache_{key}_total", f"Cache {key}", caches, key, 'cache', "counter")
+
+    inits: dict[str, dict] = init_stats()
+    lines += _family("swedeb_init_seconds", "Time spent initializing", inits, 'init_seconds', 'component')
+    lines += _family(
+        "swedeb_init_wait_seconds", "Time spent waiting for initialization", inits, 'wait_seconds', 'component'
+    )
+
+    cwb: dict[str, dict] = {'corpus': get_cwb_corpus_cache().stats()}
+    lines += _family("swedeb_cwb_handles", "Cached CWB corpus handles", cwb, 'handles', 'cache')
+    lines += _family("swedeb_cwb_handles_created_total", "Created handles", cwb, 'created', 'cache', "counter")
+    lines += _family("swedeb_cwb_handles_reused_total", "Reused handles", cwb, 'reused', 'cache', "counter")
+
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Returns metrics in Prometheus text exposition format"""
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
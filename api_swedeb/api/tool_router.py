@@ -1,26 +1,71 @@
 from typing import Annotated, Any
 
 import fastapi
+import pandas as pd
 from fastapi import Body, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from api_swedeb.api.utils.common_params import CommonQueryParams
-from api_swedeb.api.utils.dependencies import get_corpus_decoder, get_cwb_corpus, get_shared_corpus
-from api_swedeb.api.utils.kwic import get_kwic_data
+from api_swedeb.api.utils.corpus import Corpus
+from api_swedeb.api.utils.dependencies import (
+    cwb_corpus_guard,
+    get_corpus_decoder,
+    get_cwb_corpus,
+    get_shared_corpus,
+)
+from api_swedeb.api.utils.execution import run_in_pool
+from api_swedeb.api.utils.kwic import get_kwic_frame
 from api_swedeb.api.utils.ngrams import get_ngrams
-from api_swedeb.api.utils.speech import get_speech_text_by_id, get_speech_zip, get_speeches
-from api_swedeb.api.utils.word_trends import get_search_hit_results, get_word_trend_speeches, get_word_trends
-from api_swedeb.schemas.kwic_schema import KeywordInContextResult
+from api_swedeb.api.utils.serialization import frame_response
+from api_swedeb.api.utils.speech import (
+    get_speech_text_by_id,
+    get_speech_texts_by_ids,
+    get_speech_zip,
+    get_speeches_frame,
+)
+from api_swedeb.api.utils.streaming import stream_frame
+from api_swedeb.api.utils.word_trends import (
+    get_search_hit_results,
+    get_word_trend_speeches,
+    get_word_trend_speeches_frame,
+    get_word_trends,
+)
+from api_swedeb.schemas.kwic_schema import KeywordInContextItem, KeywordInContextResult
 from api_swedeb.schemas.ngrams_schema import NGramResult
-from api_swedeb.schemas.speech_text_schema import SpeechesTextResultItem
-from api_swedeb.schemas.speeches_schema import SpeechesResult, SpeechesResultWT
+from api_swedeb.schemas.response_format import ResponseFormat
+from api_swedeb.schemas.speech_text_schema import SpeechesTextBatchResult, SpeechesTextResultItem
+from api_swedeb.schemas.speeches_schema import (
+    SpeechesResult,
+    SpeechesResultItem,
+    SpeechesResultItemWT,
+    SpeechesResultWT,
+)
 from api_swedeb.schemas.word_trends_schema import SearchHits, WordTrendsResult
 
 CommonParams = Annotated[CommonQueryParams, Depends()]
+FormatParam = Annotated[
+    ResponseFormat,
+    Query(alias="format", description="Response format. Formats other than json stream rows in chunks"),
+]
 
 router = fastapi.APIRouter(prefix="/v1/tools", tags=["Tools"], responses={404: {"description": "Not found"}})
 
 
+def _get_kwic_frame(corpus: Any, commons: CommonQueryParams, **opts) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Resolves the (lazy loaded) speech index in the worker thread before computing KWIC"""
+    return get_kwic_frame(corpus, commons, speech_index=get_shared_corpus().document_index, **opts)
+
+
+def _get_kwic_response(corpus: Any, commons: CommonQueryParams, **opts) -> Response:
+    data, page_info = _get_kwic_frame(corpus, commons, **opts)
+    return frame_response(data, KeywordInContextItem, "kwic_list", **page_info)
+
+
+def _get_speeches_response(commons: CommonQueryParams, corpus: Corpus) -> Response:
+    data, page_info = get_speeches_frame(commons, corpus)
+    return frame_response(data, SpeechesResultItem, "speech_list", **page_info)
+
+
 @router.get(
     "/kwic/{search}",
     response_model=KeywordInContextResult,
@@ -34,24 +79,29 @@ async def get_kwic_results(
     cut_off: int = Query(200000, description="Maximum number of hits to return"),
     corpus: Any = Depends(get_cwb_corpus),
     decoder: Any = Depends(get_corpus_decoder),
+    response_format: FormatParam = ResponseFormat.json,
 ) -> KeywordInContextResult:
     """Get keyword in context"""
 
     if " " in search:
         search = search.split(" ")
 
-    return get_kwic_data(
-        corpus,
-        commons,
-        speech_index=get_shared_corpus().document_index,
-        keywords=search,
-        lemmatized=lemmatized,
-        words_before=words_before,
-        words_after=words_after,
-        cut_off=cut_off,
-        codecs=decoder,
-        p_show="word",
-    )
+    opts: dict[str, Any] = {
+        'keywords': search,
+        'lemmatized': lemmatized,
+        'words_before': words_before,
+        'words_after': words_after,
+        'cut_off': cut_off,
+        'codecs': decoder,
+        'p_show': "word",
+    }
+
+    with cwb_corpus_guard():
+        if response_format == ResponseFormat.json:
+            return await run_in_pool("kwic", _get_kwic_response, corpus, commons, **opts)
+
+        data, page_info = await run_in_pool("kwic", _get_kwic_frame, corpus, commons, **opts)
+    return stream_frame(data, response_format, model=KeywordInContextItem, filename="kwic", total=page_info['total'])
 
 
 @router.get("/word_trends/{search}", response_model=WordTrendsResult)
@@ -61,16 +111,23 @@ async def get_word_trends_result(
     normalize: bool = Query(False, description="Normalize counts by total number of tokens per year"),
 ) -> WordTrendsResult:
     """Get word trends"""
-    return get_word_trends(search, commons, get_shared_corpus(), normalize=normalize)
+    return await run_in_pool("word_trends", get_word_trends, search, commons, get_shared_corpus(), normalize=normalize)
 
 
 @router.get("/word_trend_speeches/{search}", response_model=SpeechesResultWT)
 async def get_word_trend_speeches_result(
     search: str,
     commons: CommonParams,
+    response_format: FormatParam = ResponseFormat.json,
 ) -> SpeechesResultWT:
     """Get word trends"""
-    return get_word_trend_speeches(search, commons, get_shared_corpus())
+    if response_format == ResponseFormat.json:
+        return await run_in_pool("word_trend_speeches", get_word_trend_speeches, search, commons, get_shared_corpus())
+
+    data: pd.DataFrame = await run_in_pool(
+        "word_trend_speeches", get_word_trend_speeches_frame, search, commons, get_shared_corpus()
+    )
+    return stream_frame(data, response_format, model=SpeechesResultItemWT, filename="speeches")
 
 
 @router.get("/word_trend_hits/{search}", response_model=SearchHits)
@@ -78,7 +135,9 @@ async def get_word_hits(
     search: str,
     n_hits: int = Query(5, description="Number of hits to return"),
 ) -> SearchHits:
-    return get_search_hit_results(search=search, n_hits=n_hits, corpus=get_shared_corpus())
+    return await run_in_pool(
+        "word_trend_hits", get_search_hit_results, search=search, n_hits=n_hits, corpus=get_shared_corpus()
+    )
 
 
 @router.get("/ngrams/{search}", response_model=NGramResult)
@@ -93,36 +152,53 @@ async def get_ngram_results(
     """Get ngrams"""
     if isinstance(search, str):
         search = search.split()
-    return get_ngrams(
-        search_term=search,
-        commons=commons,
-        corpus=corpus,
-        n_gram_width=width,
-        search_target=target,
-        display_target=target,
-        mode=mode,
-    )
+    with cwb_corpus_guard():
+        return await run_in_pool(
+            "ngrams",
+            get_ngrams,
+            search_term=search,
+            commons=commons,
+            corpus=corpus,
+            n_gram_width=width,
+            search_target=target,
+            display_target=target,
+            mode=mode,
+        )
 
 
 @router.api_route("/speeches", methods=["GET", "POST"], response_model=SpeechesResult)
 async def get_speeches_result(
     commons: CommonParams,
+    response_format: FormatParam = ResponseFormat.json,
 ) -> SpeechesResult:
-    return get_speeches(commons, get_shared_corpus())
+    if response_format == ResponseFormat.json:
+        return await run_in_pool("speeches", _get_speeches_response, commons, get_shared_corpus())
+
+    data, page_info = await run_in_pool("speeches", get_speeches_frame, commons, get_shared_corpus())
+    return stream_frame(data, response_format, model=SpeechesResultItem, filename="speeches", total=page_info['total'])
 
 
 # FIXME: rename endpoint to /speeches/{speech_id}/text
 @router.get("/speeches/{speech_id}", response_model=SpeechesTextResultItem)
 async def get_speech_by_id_result(speech_id: str) -> SpeechesTextResultItem:
     """eg. i-246211bdfc60c4fd-265"""
-    return get_speech_text_by_id(speech_id, get_shared_corpus())
+    return await run_in_pool("speech_text", get_speech_text_by_id, speech_id, get_shared_corpus())
+
+
+@router.post("/speech_texts", response_model=SpeechesTextBatchResult)
+async def get_speech_texts(ids: list[str] = Body(..., min_length=1, max_length=1000)) -> SpeechesTextBatchResult:
+    """Returns texts, speaker notes and page numbers of speeches (e.g. i-246211bdfc60c4fd-265) in request order"""
+    try:
+        return await run_in_pool("speech_texts", get_speech_texts_by_ids, ids, get_shared_corpus())
+    except ValueError as ex:
+        raise HTTPException(status_code=400, detail=str(ex)) from ex
 
 
 @router.post("/speech_download/")
-async def get_zip(ids: list = Body(..., min_length=1, max_length=100)) -> StreamingResponse:
+async def get_zip(ids: list = Body(..., min_length=1, max_length=10000)) -> StreamingResponse:
     if not ids:
         raise HTTPException(status_code=400, detail="Speech ids are required")
-    return get_speech_zip(ids, get_shared_corpus())
+    return await run_in_pool("speech_download", get_speech_zip, ids, get_shared_corpus())
 
 
 @router.get("/topics")
@@ -1,7 +1,11 @@
 # type: ignore
+import os
+from concurrent.futures import Executor
 from functools import cached_property
+from typing import Iterable, Iterator
 
 import pandas as pd
+from loguru import logger
 
 from api_swedeb.core import codecs as md
 from api_swedeb.core import speech_text as sr
@@ -9,6 +13,8 @@ from api_swedeb.core.configuration import ConfigValue
 from api_swedeb.core.load import load_dtm_corpus, load_speech_index
 from api_swedeb.core.speech import Speech
 from api_swedeb.core.speech_index import get_speeches_by_opts, get_speeches_by_words
+from api_swedeb.core.speech_store import SpeechStore
+from api_swedeb.core.trend_cubes import DEFAULT_DIMENSIONS, TrendCubes
 from api_swedeb.core.utility import Lazy, replace_by_patterns
 from api_swedeb.core.word_trends import compute_word_trends
 from penelope.corpus import IVectorizedCorpus, VectorizedCorpus
@@ -24,36 +30,69 @@ class Corpus:
         self.tagged_corpus_folder: str = opts.get('tagged_corpus_folder') or ConfigValue("vrt.folder").resolve()
 
         self.__vectorized_corpus: IVectorizedCorpus = Lazy(
-            lambda: load_dtm_corpus(folder=self.dtm_folder, tag=self.dtm_tag)
+            lambda: load_dtm_corpus(
+                folder=self.dtm_folder,
+                tag=self.dtm_tag,
+                memory_mapped=ConfigValue("dtm.memory_mapped", default=True).resolve(),
+            ),
+            name="vectorized_corpus",
         )
         self.__lazy_person_codecs: md.PersonCodecs = Lazy(
             lambda: md.PersonCodecs().load(source=self.metadata_filename),
+            name="person_codecs",
         )
         self.__lazy_repository: sr.SpeechTextRepository = Lazy(
             lambda: sr.SpeechTextRepository(
                 source=self.tagged_corpus_folder,
                 person_codecs=self.person_codecs,
                 document_index=self.document_index,
-            )
+                store=self._speech_store(),
+            ),
+            name="repository",
         )
         self.__lazy_document_index: pd.DataFrame = Lazy(
-            lambda: load_speech_index(folder=self.dtm_folder, tag=self.dtm_tag)
+            lambda: load_speech_index(folder=self.dtm_folder, tag=self.dtm_tag), name="document_index"
+        )
+
+        self.__lazy_trend_cubes: TrendCubes = Lazy(
+            lambda: TrendCubes(
+                self.vectorized_corpus,
+                dimensions=ConfigValue("dtm.cubes.dimensions", default=DEFAULT_DIMENSIONS).resolve(),
+                folder=self.dtm_folder,
+                tag=self.dtm_tag,
+            ),
+            name="trend_cubes",
         )
 
         self.__lazy_decoded_persons = Lazy(
-            lambda: self.metadata.decode(self.person_codecs.persons_of_interest, drop=False)
+            lambda: self.metadata.decode(self.person_codecs.persons_of_interest, drop=False), name="decoded_persons"
         )
 
+    def _speech_store(self) -> SpeechStore | None:
+        filename: str = ConfigValue("vrt.speech_store", default=None).resolve()
+        if not filename:
+            return None
+        if not os.path.isfile(filename):
+            logger.warning(f"speech store {filename} not found, speeches are loaded from {self.tagged_corpus_folder}")
+            return None
+        return SpeechStore(filename)
+
     @property
     def vectorized_corpus(self) -> VectorizedCorpus:
         return self.__vectorized_corpus.value
 
     @property
     def document_index(self) -> pd.DataFrame:
-        if self.__vectorized_corpus.is_initialized:  # pylint: disable=using-constant-test
+        if self.__vectorized_corpus.is_initialized():
             return self.vectorized_corpus.document_index
         return self.__lazy_document_index.value
 
+    @property
+    def trend_cubes(self) -> TrendCubes | None:
+        if not ConfigValue("dtm.cubes.enabled", default=True).resolve():
+            return None
+        return self.__lazy_trend_cubes.value
+
     @property
     def metadata(self) -> md.PersonCodecs:
         return self.person_codecs
@@ -89,7 +128,13 @@ class Corpus:
             return pd.DataFrame()
 
         trends: pd.DataFrame = compute_word_trends(
-            self.vectorized_corpus, self.person_codecs, search_terms, filter_opts, normalize
+            self.vectorized_corpus,
+            self.person_codecs,
+            search_terms,
+            filter_opts,
+            normalize,
+            cubes=self.trend_cubes,
+            column_slice=ConfigValue("dtm.column_slice", default=True).resolve(),
         )
 
         trends.columns = replace_by_patterns(trends.columns, ConfigValue("display.headers.translations").resolve())
@@ -176,6 +221,23 @@ class Corpus:
         speech: Speech = self.repository.speech(speech_name=document_name)
         return speech
 
+    def get_speeches_by_ids(
+        self, ids: list[str], executor: Executor | None = None, max_workers: int = 1
+    ) -> Iterator[tuple[str, Speech]]:
+        """Returns (id, speech) for given ids grouped by protocol, see `SpeechTextRepository.speeches`"""
+        return self.repository.speeches(ids, executor=executor, max_workers=max_workers)
+
+    def get_speaker_names(self, ids: Iterable[str]) -> dict[str, str]:
+        """Returns speaker names of speeches `ids` (looked up for all ids at once), see `get_speaker`"""
+        unknown: str = ConfigValue("display.labels.speaker.unknown").resolve()
+        key_indexes: dict[str, int | None] = {speech_id: self.repository.get_key_index(speech_id) for speech_id in ids}
+        person_ids: pd.Series = self.document_index["person_id"].reindex(
+            sorted({key_index for key_index in key_indexes.values() if key_index is not None})
+        )
+        names: pd.Series = person_ids.map(self.person_codecs.persons_of_interest["name"]).where(person_ids != "unknown")
+        speakers: dict[int, str] = names.dropna().to_dict()
+        return {speech_id: speakers.get(key_index, unknown) for speech_id, key_index in key_indexes.items()}
+
     def get_speaker(self, document_name: str) -> str:
         unknown: str = ConfigValue("display.labels.speaker.unknown").resolve()
         try:
@@ -199,14 +261,10 @@ class Corpus:
         return int(self.document_index["year"].max())
 
     def get_word_hits(self, search_term: str, n_hits: int = 5) -> list[str]:
-        if search_term not in self.vectorized_corpus.vocabulary:
+        """Returns (at most) `n_hits` words matching `search_term`, most frequent first"""
+        if search_term not in self.vectorized_corpus.token2id:
             search_term = search_term.lower()
-        # setting descending to False gives most common to least common but reversed
-        # True sorts the same sublist but alphabetically, not in frequency order
-        result = self.vectorized_corpus.find_matching_words({search_term}, n_max_count=n_hits, descending=False)
-        # the results are therefore reversed here
-        result = result[::-1]
-        return result
+        return self.vectorized_corpus.vocabulary_index.find([search_term], n_top=n_hits)
 
 
 def load_corpus(**opts) -> Corpus:
@@ -1,21 +1,20 @@
+import contextlib
 import os
 
 import ccc
 from fastapi import Depends
-from loguru import logger
 
 from api_swedeb.api import parlaclarin as md
 from api_swedeb.api.utils.corpus import Corpus
 from api_swedeb.core.configuration import ConfigValue
+from api_swedeb.core.cwb.handle import CorpusHandleCache
+from api_swedeb.core.utility import Lazy
 
-__shared_corpus: Corpus = None
+__shared_corpus: Lazy = Lazy(Corpus, name="shared_corpus")
 
 
 def get_shared_corpus() -> Corpus:
-    global __shared_corpus
-    if __shared_corpus is None:
-        __shared_corpus = Corpus()
-    return __shared_corpus
+    return __shared_corpus.value
 
 
 def get_cwb_corpus_opts() -> dict[str, str | None]:
@@ -31,13 +30,29 @@ def get_cwb_corpus_opts() -> dict[str, str | None]:
     }
 
 
+__cwb_corpus_cache: Lazy = Lazy(
+    lambda: CorpusHandleCache(check_interval=ConfigValue("cwb.check_interval", default=60.0).resolve()),
+    name="cwb_corpus_cache",
+)
+
+
+def get_cwb_corpus_cache() -> CorpusHandleCache:
+    return __cwb_corpus_cache.value
+
+
 def get_cwb_corpus(opts: dict = None) -> ccc.Corpus:
+    """Returns this worker's (cached) handle to the CWB corpus"""
+    opts: dict = opts or get_cwb_corpus_opts()
+    return get_cwb_corpus_cache().get(
+        registry_dir=opts.get("registry_dir"), corpus_name=opts.get("corpus_name"), data_dir=opts.get("data_dir")
+    )
+
+
+def cwb_corpus_guard(opts: dict = None) -> contextlib.AbstractContextManager[None]:
+    """Returns a context that drops this worker's CWB corpus handle if a query run within it fails"""
     opts: dict = opts or get_cwb_corpus_opts()
-    registry_dir = opts.get("registry_dir")
-    logger.info(f"Registry dir is {registry_dir}")
-    logger.info(f"Exists on disk? {os.path.isdir(registry_dir)}")
-    return ccc.Corpora(registry_dir=registry_dir).corpus(
-        corpus_name=opts.get("corpus_name"), data_dir=opts.get("data_dir")
+    return get_cwb_corpus_cache().guard(
+        registry_dir=opts.get("registry_dir"), corpus_name=opts.get("corpus_name"), data_dir=opts.get("data_dir")
     )
 
 
@@ -47,11 +62,20 @@ def get_decoder_opts() -> dict[str, str | None]:
     }
 
 
-_corpus_codecs: md.Codecs = None
+def _create_corpus_decoder(opts: dict = None) -> md.PersonCodecs:
+    opts = opts or get_decoder_opts()
+    return md.PersonCodecs().load(source=opts.get("metadata_filename"))
+
+
+_corpus_codecs: Lazy = Lazy(_create_corpus_decoder, name="corpus_decoder")
+
+
+def load_corpus_decoder(opts: dict = None) -> md.PersonCodecs:
+    """Returns the shared decoder, `opts` is used only by the first (initializing) call."""
+    return _corpus_codecs.get(opts)
 
 
-async def get_corpus_decoder(opts: dict = Depends(get_decoder_opts)) -> ccc.Corpus:
-    global _corpus_codecs
-    if _corpus_codecs is None:
-        _corpus_codecs = md.PersonCodecs().load(source=opts.get("metadata_filename"))
-    return _corpus_codecs
+def get_corpus_decoder(opts: dict = Depends(get_decoder_opts)) -> md.PersonCodecs:
+    """Plain (sync) dependency so that FastAPI resolves it in the threadpool: the first call loads the decoder,
+    and concurrent calls block on the shared initialization lock (which must not happen on the event loop)."""
+    return load_corpus_decoder(opts)
@@ -0,0 +1,254 @@
+"""Execution layer that runs blocking endpoint work outside of the event loop.
+
+All tool and metadata endpoints are `async`, but the work they do (pandas, scipy, CQP) is blocking.
+`ExecutionPool` dispatches that work to bounded thread pools, and limits the number of concurrently
+running calls per endpoint so that slow queries (e.g. KWIC) cannot starve cheap ones (e.g. metadata
+lookups). Endpoints share in-process state (the corpus, CWB handles and caches), so all work runs in
+threads of the API worker process.
+
+Protocols of batch speech requests (texts and downloads) are loaded by a shared `loader` thread pool,
+so the number of loader threads is bounded regardless of the number of concurrent requests. A streamed
+response produced by `iterate` holds its endpoint's limit until the stream is exhausted.
+
+Configuration (all keys are optional):
+
+    execution:
+      max_threads: 8              # size of thread pool used by tool endpoints
+      max_light_threads: 4        # size of thread pool reserved for light endpoints
+      light_endpoints: [metadata] # endpoints that run in the reserved thread pool
+      download_workers: 4         # size of the shared loader thread pool (speech texts and downloads)
+      limits:                     # max concurrently running calls per endpoint
+        default: 4
+        kwic: 2
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from loguru import logger
+
+from api_swedeb.core.configuration import ConfigValue
+
+DEFAULT_LIMITS: dict[str, int] = {
+    'default': 4,
+    'kwic': 2,
+    'ngrams': 2,
+    'speech_download': 2,
+    'speech_texts': 2,
+    'metadata': 16,
+}
+
+
+@dataclass
+class EndpointStats:
+    """Queue-depth and timing counters for a single endpoint."""
+
+    waiting: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    total_run_time: float = 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            'waiting': self.waiting,
+            'running': self.running,
+            'completed': self.completed,
+            'failed': self.failed,
+            'total_wait_time': self.total_wait_time,
+            'max_wait_time': self.max_wait_time,
+            'total_run_time': self.total_run_time,
+        }
+
+
+class ExecutionPool:
+    """Runs blocking callables in executors with per-endpoint concurrency limits."""
+
+    def __init__(
+        self,
+        *,
+        max_threads: int = 8,
+        max_light_threads: int = 4,
+        limits: dict[str, int] | None = None,
+        light_endpoints: list[str] | None = None,
+        download_workers: int = 4,
+    ):
+        self.max_threads: int = max_threads
+        self.max_light_threads: int = max_light_threads
+        self.download_workers: int = download_workers
+        self.limits: dict[str, int] = DEFAULT_LIMITS | (limits or {})
+        self.light_endpoints: set[str] = set(light_endpoints or ['metadata'])
+
+        self._executors: dict[str, Executor] = {}
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: dict[str, EndpointStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def limit(self, endpoint: str) -> int:
+        return self.limits.get(endpoint, self.limits['default'])
+
+    def lane(self, endpoint: str) -> str:
+        """Returns name of executor that runs `endpoint`: `light` or `threads`."""
+        if endpoint in self.light_endpoints:
+            return 'light'
+        return 'threads'
+
+    def executor(self, lane: str) -> Executor:
+        with self._lock:
+            if lane not in self._executors:
+                self._executors[lane] = self._create_executor(lane)
+            return self._executors[lane]
+
+    def _create_executor(self, lane: str) -> Executor:
+        if lane == 'light':
+            return ThreadPoolExecutor(max_workers=self.max_light_threads, thread_name_prefix="swedeb-light")
+        if lane == 'loader':
+            return ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="swedeb-loader")
+        return ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="swedeb-worker")
+
+    def _semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        """Returns the endpoint's semaphore (semaphores are bound to the running event loop)"""
+        semaphores: dict[str, asyncio.Semaphore] = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if endpoint not in semaphores:
+            semaphores[endpoint] = asyncio.Semaphore(self.limit(endpoint))
+        return semaphores[endpoint]
+
+    def endpoint_stats(self, endpoint: str) -> EndpointStats:
+        with self._lock:
+            if endpoint not in self._stats:
+                self._stats[endpoint] = EndpointStats()
+            return self._stats[endpoint]
+
+    @contextlib.asynccontextmanager
+    async def _running(self, endpoint: str) -> AsyncIterator[None]:
+        """Waits (without blocking the event loop) until fewer than `limit(endpoint)` calls of `endpoint` are
+        running, and updates the endpoint's statistics while the block runs."""
+        stats: EndpointStats = self.endpoint_stats(endpoint)
+        semaphore: asyncio.Semaphore = self._semaphore(endpoint)
+
+        queued_at: float = time.perf_counter()
+        stats.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+
+        started_at: float = time.perf_counter()
+        wait_time: float = started_at - queued_at
+        stats.total_wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
+        stats.running += 1
+        try:
+            yield
+            stats.completed += 1
+        except BaseException:
+            stats.failed += 1
+            raise
+        finally:
+            stats.running -= 1
+            stats.total_run_time += time.perf_counter() - started_at
+            semaphore.release()
+            if wait_time > 1.0:
+                logger.info(f"{endpoint}: waited {wait_time:.2f}s for a free worker")
+
+    async def run(self, endpoint: str, fx: Callable[..., Any], *args, **kwargs) -> Any:
+        """Runs `fx(*args, **kwargs)` in the executor assigned to `endpoint`.
+
+        The call waits (without blocking the event loop) until fewer than `limit(endpoint)`
+        calls of the same endpoint are running."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        async with self._running(endpoint):
+            task: Callable[[], Any] = functools.partial(contextvars.copy_context().run, fx, *args, **kwargs)
+            return await loop.run_in_executor(self.executor(self.lane(endpoint)), task)
+
+    async def iterate(self, endpoint: str, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Yields the items of blocking `iterator`, each item is computed in the executor assigned to `endpoint`.
+
+        The iteration counts as one running call of `endpoint` (see `run`) until the iterator is exhausted
+        or the consumer stops iterating (the iterator is then closed)."""
+        executor: Executor = self.executor(self.lane(endpoint))
+        future: Future | None = None
+        async with self._running(endpoint):
+            try:
+                while True:
+                    future = executor.submit(contextvars.copy_context().run, next, iterator, _EXHAUSTED)
+                    item: Any = await asyncio.wrap_future(future)
+                    if item is _EXHAUSTED:
+                        return
+                    yield item
+            finally:
+                if future is not None and not future.done():
+                    future.add_done_callback(lambda _: _close(iterator))
+                else:
+                    _close(iterator)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        with self._lock:
+            return {
+                endpoint: stats.to_dict() | {'limit': self.limit(endpoint), 'lane': self.lane(endpoint)}
+                for endpoint, stats in self._stats.items()
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executors: list[Executor] = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_EXHAUSTED: object = object()
+
+
+def _close(iterator: Iterator[Any]) -> None:
+    close: Callable[[], None] | None = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+__execution_pool: ExecutionPool = None
+__execution_pool_lock: threading.Lock = threading.Lock()
+
+
+def get_execution_pool() -> ExecutionPool:
+    global __execution_pool
+    if __execution_pool is None:
+        with __execution_pool_lock:
+            if __execution_pool is None:
+                __execution_pool = ExecutionPool(
+                    max_threads=ConfigValue("execution.max_threads", default=8).resolve(),
+                    max_light_threads=ConfigValue("execution.max_light_threads", default=4).resolve(),
+                    limits=ConfigValue("execution.limits", default={}).resolve(),
+                    light_endpoints=ConfigValue("execution.light_endpoints", default=['metadata']).resolve(),
+                    download_workers=ConfigValue("execution.download_workers", default=4).resolve(),
+                )
+    return __execution_pool
+
+
+async def run_in_pool(endpoint: str, fx: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs blocking `fx` in the shared execution pool, see `ExecutionPool.run`."""
+    return await get_execution_pool().run(endpoint, fx, *args, **kwargs)
+
+
+def iterate_in_pool(endpoint: str, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Iterates blocking `iterator` in the shared execution pool, see `ExecutionPool.iterate`."""
+    return get_execution_pool().iterate(endpoint, iterator)
+
+
+def get_loader_executor() -> Executor:
+    """Returns the shared thread pool that loads protocols of batch speech requests."""
+    return get_execution_pool().executor('loader')
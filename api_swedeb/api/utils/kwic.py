@@ -4,14 +4,15 @@ import pandas as pd
 
 from api_swedeb import mappers
 from api_swedeb.api.utils.common_params import CommonQueryParams
+from api_swedeb.api.utils.pagination import paginate
+from api_swedeb.core.cache import get_result_cache, result_key
 from api_swedeb.core.codecs import PersonCodecs
 from api_swedeb.core.kwic import simple
-from api_swedeb.schemas.kwic_schema import KeywordInContextItem, KeywordInContextResult
 
 # pylint: disable=too-many-arguments
 
 
-def get_kwic_data(
+def get_kwic_frame(
     corpus: Any,
     commons: CommonQueryParams,
     *,
@@ -23,8 +24,10 @@ def get_kwic_data(
     words_after: int = 3,
     p_show: str = "word",
     cut_off: int = 200000,
-) -> KeywordInContextResult:
-    """_summary_
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Computes (cached) KWIC result and returns requested page as a data frame.
+
+    The result is sorted and paged according to `sort_by`, `sort_order`, `offset` and `limit` in `commons`.
 
     Args:
         corpus (ccc.Corpus): A CWB corpus object.
@@ -36,22 +39,32 @@ def get_kwic_data(
         p_show (str, optional): What to display, `word` or `lemma`. Defaults to "word".
         cut_off (int, optional): Cut off. Defaults to 200000.
     Returns:
-        KeywordInContextResult: _description_
+        tuple[pd.DataFrame, dict[str, Any]]: KWIC page and page info (total, offset, limit)
     """
     target: str = "lemma" if lemmatized else "word"
     keywords = [keywords] if isinstance(keywords, str) else keywords
     opts: dict[str, Any] = mappers.query_params_to_CQP_opts(commons, [(w, target) for w in keywords])
 
-    data: pd.DataFrame = simple.kwic_with_decode(
-        corpus,
+    key: str = result_key(
+        "kwic",
+        getattr(corpus, "corpus_name", None),
         opts,
-        speech_index=speech_index,
-        codecs=codecs,
         words_before=words_before,
         words_after=words_after,
         p_show=p_show,
         cut_off=cut_off,
     )
-
-    rows: list[KeywordInContextItem] = [KeywordInContextItem(**row) for row in data.to_dict(orient="records")]
-    return KeywordInContextResult(kwic_list=rows)
+    data: pd.DataFrame = get_result_cache().get_or_compute(
+        key,
+        lambda: simple.kwic_with_decode(
+            corpus,
+            opts,
+            speech_index=speech_index,
+            codecs=codecs,
+            words_before=words_before,
+            words_after=words_after,
+            p_show=p_show,
+            cut_off=cut_off,
+        ),
+    )
+    return paginate(data, commons, key=key)
@@ -20,10 +20,15 @@ from api_swedeb.schemas.metadata_schema import (
 )
 
 
-def get_speakers(query_params: SpeakerQueryParams, corpus: Corpus) -> SpeakerResult:
+def get_speakers_frame(query_params: SpeakerQueryParams, corpus: Corpus) -> DataFrame:
+    """Returns speakers matching `query_params` as a data frame (with `SpeakerItem` columns)."""
     selection_params: dict[str, list[int]] = query_params.get_filter_opts(include_year=False)
 
-    df = corpus.get_speakers(selections=selection_params)
+    return corpus.get_speakers(selections=selection_params)
+
+
+def get_speakers(query_params: SpeakerQueryParams, corpus: Corpus) -> SpeakerResult:
+    df: DataFrame = get_speakers_frame(query_params, corpus)
     data = df.to_dict(orient="records")
     speaker_list = [SpeakerItem(**row) for row in data]
     return SpeakerResult(speaker_list=speaker_list)
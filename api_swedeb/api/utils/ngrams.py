@@ -6,6 +6,7 @@ import pandas as pd
 from api_swedeb import mappers, schemas
 from api_swedeb.api.utils.common_params import CommonQueryParams
 from api_swedeb.core import n_grams
+from api_swedeb.core.cache import cached_result
 
 
 def get_ngrams(
@@ -27,8 +28,15 @@ def get_ngrams(
     opts: dict[str, Any] = mappers.query_params_to_CQP_opts(
         commons, word_targets=search_term, search_target=search_target
     )
-    ngrams: pd.DataFrame = n_grams.n_grams(
-        corpus, opts, n=n_gram_width, p_show=display_target, threshold=n_threshold, mode=mode
+    ngrams: pd.DataFrame = cached_result(
+        "ngrams",
+        lambda: n_grams.n_grams(corpus, opts, n=n_gram_width, p_show=display_target, threshold=n_threshold, mode=mode),
+        getattr(corpus, "corpus_name", None),
+        opts,
+        n=n_gram_width,
+        p_show=display_target,
+        threshold=n_threshold,
+        mode=mode,
     )
 
     if len(opts) == 0:
@@ -0,0 +1,51 @@
+from typing import Any
+
+import pandas as pd
+
+from api_swedeb.api.utils.common_params import CommonQueryParams
+from api_swedeb.core.cache import get_cursor_cache, make_key
+
+
+def is_paged(commons: CommonQueryParams) -> bool:
+    return commons.limit is not None or commons.offset is not None
+
+
+def is_sortable(data: pd.DataFrame, commons: CommonQueryParams) -> bool:
+    return bool(commons.sort_by) and commons.sort_by in data.columns
+
+
+def sort_frame(data: pd.DataFrame, sort_by: str, sort_order: str) -> pd.DataFrame:
+    """Stable sort of `data` on `sort_by` (missing values last)"""
+    return data.sort_values(by=sort_by, ascending=sort_order != "desc", kind="stable", na_position="last")
+
+
+def paginate(data: pd.DataFrame, commons: CommonQueryParams, *, key: str) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Sorts and slices a (full) result according to `sort_by`, `sort_order`, `offset` and `limit`.
+
+    The sorted result is kept in the cursor cache under `key` so that subsequent pages
+    are served by slicing. The data is sorted only if `sort_by` is a column in `data`.
+
+    Args:
+        data (pd.DataFrame): Full result.
+        commons (CommonQueryParams): Query parameters.
+        key (str): Cache key that identifies the full result.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, Any]]: Requested page, and page info (`total`, `offset`, `limit`).
+    """
+    if is_sortable(data, commons):
+        data = get_cursor_cache().get_or_compute(
+            make_key(key, commons.sort_by, commons.sort_order),
+            lambda: sort_frame(data, commons.sort_by, commons.sort_order),
+        )
+
+    page_info: dict[str, Any] = {'total': len(data), 'offset': None, 'limit': None}
+
+    if not is_paged(commons):
+        return data, page_info
+
+    offset: int = max(commons.offset or 0, 0)
+    limit: int | None = commons.limit if commons.limit is not None and commons.limit >= 0 else None
+    stop: int | None = offset + limit if limit is not None else None
+
+    return data.iloc[offset:stop], page_info | {'offset': offset, 'limit': limit}
@@ -0,0 +1,80 @@
+"""ASGI middleware that times requests, and optionally adds a `Server-Timing` response header.
+
+Request durations are observed in the histogram `swedeb_request_duration_seconds`, labeled by method,
+route template (e.g. `/v1/tools/kwic/{search}`) and status code. Spans recorded while the request is
+handled (see `api_swedeb.core.instrumentation`) are reported in the `Server-Timing` header:
+
+    metrics:
+      server_timing: false    # true: always add header, "request": only if request has an `X-Server-Timing` header
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api_swedeb.core import instrumentation
+from api_swedeb.core.configuration import ConfigValue
+
+REQUEST_METRIC: str = "swedeb_request_duration_seconds"
+
+
+def route_name(scope: Scope) -> str:
+    """Returns route template of the matched route (bounded label cardinality)"""
+    route: Any = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool | str | None = None):
+        self.app: ASGIApp = app
+        self.server_timing: bool | str = (
+            server_timing
+            if server_timing is not None
+            else ConfigValue("metrics.server_timing", default=False).resolve()
+        )
+
+    def add_header(self, scope: Scope) -> bool:
+        if self.server_timing == "request":
+            return any(key == b"x-server-timing" for key, _ in scope.get("headers", []))
+        return bool(self.server_timing)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start: float = time.perf_counter()
+        token = instrumentation.start_request_timing()
+        add_header: bool = self.add_header(scope)
+        status_code: int = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if add_header:
+                    headers: MutableHeaders = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        instrumentation.server_timing_header(
+                            instrumentation.request_timings(), total=time.perf_counter() - start
+                        ),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            instrumentation.registry.observe(
+                REQUEST_METRIC,
+                time.perf_counter() - start,
+                "Duration of HTTP requests",
+                method=scope.get("method", ""),
+                route=route_name(scope),
+                status=str(status_code),
+            )
+            instrumentation.stop_request_timing(token)
@@ -1,34 +1,48 @@
 import io
 import zipfile
-from typing import List
+from typing import Any, Iterable, Iterator, List, Mapping
 
 from fastapi.responses import StreamingResponse
 from pandas import DataFrame
 
 from api_swedeb.api.utils.common_params import CommonQueryParams
 from api_swedeb.api.utils.corpus import Corpus
+from api_swedeb.api.utils.execution import get_loader_executor, iterate_in_pool
+from api_swedeb.api.utils.pagination import is_paged, paginate
+from api_swedeb.core.cache import get_cursor_cache, result_key
+from api_swedeb.core.configuration import ConfigValue
 from api_swedeb.core.speech import Speech
-from api_swedeb.schemas.speech_text_schema import SpeechesTextResultItem
-from api_swedeb.schemas.speeches_schema import SpeechesResult, SpeechesResultItem
+from api_swedeb.schemas.speech_text_schema import (
+    SpeechesTextBatchItem,
+    SpeechesTextBatchResult,
+    SpeechesTextResultItem,
+)
 
 
-def get_speeches(commons: CommonQueryParams, corpus: Corpus) -> SpeechesResult:
+def get_speeches_frame(commons: CommonQueryParams, corpus: Corpus) -> tuple[DataFrame, dict[str, Any]]:
     """
     Retrieves speeches based on the given query parameters.
 
+    If `limit` or `offset` is given, the full result is kept in the cursor cache and pages are
+    served by slicing the (sorted) result.
+
     Args:
         commons (CommonQueryParams): The query parameters.
         corpus: A corpus object.
 
     Returns:
-        SpeechesResult: The result containing the list of speeches.
+        tuple[DataFrame, dict[str, Any]]: Speeches (requested page) and page info (total, offset, limit).
 
     """
-    df: DataFrame = corpus.get_anforanden(selections=commons.get_filter_opts(True))
+    selections: dict = commons.get_filter_opts(True)
+    key: str = result_key("speeches", selections)
 
-    rows: List[SpeechesResultItem] = [SpeechesResultItem(**row) for row in df.to_dict(orient="records")]
+    if is_paged(commons):
+        df: DataFrame = get_cursor_cache().get_or_compute(key, lambda: corpus.get_anforanden(selections=selections))
+    else:
+        df = corpus.get_anforanden(selections=selections)
 
-    return SpeechesResult(speech_list=rows)
+    return paginate(df, commons, key=key)
 
 
 def get_speech_text_by_id(speech_id: str, corpus: Corpus) -> SpeechesTextResultItem:
@@ -42,25 +56,75 @@ def get_speech_text_by_id(speech_id: str, corpus: Corpus) -> SpeechesTextResultI
     )
 
 
-def get_speech_zip(ids: List[str], corpus: Corpus):
-    file_and_speech = []
-    for protocol_id in ids:
-        speaker = corpus.get_speaker(protocol_id)
-        file_and_speech.append((f"{speaker}_{protocol_id}.txt", corpus.get_speech(protocol_id).text.encode("utf-8")))
-
-    # Create an in-memory buffer for the zip file
-    zip_buffer = io.BytesIO()
-
-    # Create a zip file in memory
-    with zipfile.ZipFile(zip_buffer, "w") as zip_file:
-        for file_name, file_content in file_and_speech:
-            zip_file.writestr(file_name, file_content)
+def get_speech_texts_by_ids(ids: List[str], corpus: Corpus) -> SpeechesTextBatchResult:
+    """Retrieves texts of speeches `ids` (in request order), each distinct id is loaded once.
 
-    # Move to the beginning of the buffer
-    zip_buffer.seek(0)
+    Protocols are loaded by the shared loader threads, each protocol once.
+    Raises ValueError if an id is not a valid speech key."""
+    speeches: Iterator[tuple[str, Speech]] = corpus.get_speeches_by_ids(
+        list(dict.fromkeys(ids)),
+        executor=get_loader_executor(),
+        max_workers=ConfigValue("execution.download_workers", default=4).resolve(),
+    )
+    items: dict[str, SpeechesTextBatchItem] = {
+        speech_id: SpeechesTextBatchItem(
+            speech_id=speech_id,
+            speaker_note=speech.speaker_note,
+            speech_text=speech.text,
+            page_number=speech.page_number,
+        )
+        for speech_id, speech in speeches
+    }
+    return SpeechesTextBatchResult(speech_list=[items[speech_id] for speech_id in ids])
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable sink for `zipfile.ZipFile` that hands over written bytes on demand"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data: bytes = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def zip_speeches(speeches: Iterable[tuple[str, Speech]], speakers: Mapping[str, str]) -> Iterator[bytes]:
+    """Yields a zip archive of speech texts, one chunk per speech (and a final chunk with the central directory)"""
+    stream: _ZipStream = _ZipStream()
+    with zipfile.ZipFile(stream, "w") as zip_file:
+        for speech_id, speech in speeches:
+            zip_file.writestr(f"{speakers[speech_id]}_{speech_id}.txt", speech.text.encode("utf-8"))
+            yield stream.take()
+    yield stream.take()
+
+
+def get_speech_zip(ids: List[str], corpus: Corpus) -> StreamingResponse:
+    """Streams a zip archive of the speech texts of `ids` (duplicate ids are included once).
+
+    The ids are validated (ValueError is raised for an invalid speech key) and the speaker names are looked up
+    before the response is created. Protocols are loaded by the shared loader threads while the archive is
+    streamed, and the stream counts as a running `speech_download` call. Entries are ordered by protocol."""
+    ids = list(dict.fromkeys(ids))
+    speeches: Iterator[tuple[str, Speech]] = corpus.get_speeches_by_ids(
+        ids,
+        executor=get_loader_executor(),
+        max_workers=ConfigValue("execution.download_workers", default=4).resolve(),
+    )
+    speakers: dict[str, str] = corpus.get_speaker_names(ids)
 
-    # Create a StreamingResponse to send the zip file back to the client
-    response = StreamingResponse(iter([zip_buffer.getvalue()]), media_type="application/zip")
+    response = StreamingResponse(
+        iterate_in_pool("speech_download", zip_speeches(speeches, speakers)), media_type="application/zip"
+    )
     response.headers["Content-Disposition"] = "attachment; filename=speeches.zip"
 
     return response
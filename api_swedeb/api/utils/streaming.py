@@ -0,0 +1,152 @@
+"""Streaming of large data frame results as NDJSON, CSV or Arrow IPC stream.
+
+Rows are encoded chunk by chunk directly from the data frame, bypassing construction of
+per-row pydantic models and keeping peak memory proportional to the chunk size.
+"""
+
+from typing import Any, Iterable, Iterator
+
+import pandas as pd
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from api_swedeb.schemas.response_format import ResponseFormat
+
+DEFAULT_CHUNK_SIZE: int = 10000
+
+MEDIA_TYPES: dict[ResponseFormat, str] = {
+    ResponseFormat.ndjson: "application/x-ndjson",
+    ResponseFormat.csv: "text/csv; charset=utf-8",
+    ResponseFormat.arrow: "application/vnd.apache.arrow.stream",
+}
+
+EXTENSIONS: dict[ResponseFormat, str] = {
+    ResponseFormat.ndjson: "ndjson",
+    ResponseFormat.csv: "csv",
+    ResponseFormat.arrow: "arrow",
+}
+
+
+def model_columns(data: pd.DataFrame, model: type[BaseModel]) -> list[str]:
+    """Returns the fields in `model` that exist as columns in `data` (in model order)."""
+    return [name for name in model.model_fields if name in data.columns]
+
+
+def chunks(data: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(data), chunk_size):
+        yield data.iloc[start : start + chunk_size]
+
+
+def ndjson_chunks(data: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    for chunk in chunks(data, chunk_size):
+        text: str = chunk.to_json(orient="records", lines=True, force_ascii=False)
+        yield (text if text.endswith("\n") else text + "\n").encode("utf-8")
+
+
+def csv_chunks(data: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    if len(data) == 0:
+        yield data.to_csv(index=False).encode("utf-8")
+        return
+    for i, chunk in enumerate(chunks(data, chunk_size)):
+        yield chunk.to_csv(index=False, header=i == 0).encode("utf-8")
+
+
+class _DrainableSink:
+    """Minimal writable file-like object that lets encoded bytes be collected as they are written."""
+
+    def __init__(self):
+        self.buffers: list[bytes] = []
+        self.position: int = 0
+        self.closed: bool = False
+
+    def write(self, data: Any) -> int:
+        data = bytes(data)
+        self.buffers.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data: bytes = b"".join(self.buffers)
+        self.buffers.clear()
+        return data
+
+
+def _to_arrow_compatible(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Replaces categorical columns with their values (avoids dictionary batches in the stream)."""
+    categoricals: list[str] = [c for c in chunk.columns if isinstance(chunk[c].dtype, pd.CategoricalDtype)]
+    if not categoricals:
+        return chunk
+    return chunk.assign(**{c: chunk[c].astype(chunk[c].cat.categories.dtype) for c in categoricals})
+
+
+def arrow_chunks(data: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    schema: pa.Schema = pa.Schema.from_pandas(_to_arrow_compatible(data.iloc[:chunk_size]), preserve_index=False)
+    sink: _DrainableSink = _DrainableSink()
+    with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema) as writer:
+        for chunk in chunks(data, chunk_size):
+            batch: pa.RecordBatch = pa.RecordBatch.from_pandas(
+                _to_arrow_compatible(chunk), schema=schema, preserve_index=False
+            )
+            writer.write_batch(batch)
+            yield sink.drain()
+    yield sink.drain()
+
+
+ENCODERS: dict[ResponseFormat, Any] = {
+    ResponseFormat.ndjson: ndjson_chunks,
+    ResponseFormat.csv: csv_chunks,
+    ResponseFormat.arrow: arrow_chunks,
+}
+
+
+def encode_frame(
+    data: pd.DataFrame, response_format: ResponseFormat, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterable[bytes]:
+    """Returns an iterator that encodes `data` in chunks of `chunk_size` rows."""
+    if response_format not in ENCODERS:
+        raise ValueError(f"unsupported streaming format: {response_format}")
+    return ENCODERS[response_format](data, chunk_size)
+
+
+def stream_frame(
+    data: pd.DataFrame,
+    response_format: ResponseFormat,
+    *,
+    model: type[BaseModel] = None,
+    filename: str = "result",
+    total: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamingResponse:
+    """Returns a response that streams `data` in `response_format`.
+
+    Args:
+        data (pd.DataFrame): Result to stream.
+        response_format (ResponseFormat): Streaming format (ndjson, csv or arrow).
+        model (type[BaseModel], optional): Restrict columns to fields in the (item) model. Defaults to None.
+        filename (str, optional): Suggested name (without extension) of downloaded file. Defaults to "result".
+        total (int, optional): Total number of rows in unpaged result, returned as `X-Total-Count`. Defaults to None.
+        chunk_size (int, optional): Number of rows per encoded chunk. Defaults to DEFAULT_CHUNK_SIZE.
+    """
+    if model is not None:
+        data = data[model_columns(data, model)]
+
+    response = StreamingResponse(
+        encode_frame(data, response_format, chunk_size), media_type=MEDIA_TYPES[response_format]
+    )
+    response.headers["Content-Disposition"] = f"inline; filename={filename}.{EXTENSIONS[response_format]}"
+    response.headers["X-Total-Count"] = str(total if total is not None else len(data))
+    return response
@@ -0,0 +1,178 @@
+"""Eager loading of shared corpus components at application startup.
+
+Components are loaded in parallel (respecting dependencies between them) and the load state
+of each component is tracked so that readiness can be reported by `/health/ready`.
+
+Configuration (all keys are optional):
+
+    fastapi:
+      warmup:
+        enabled: true
+        max_workers: 4
+        components: [vectorized_corpus, person_codecs, document_index, decoded_persons, repository, cwb_corpus,
+                     corpus_decoder, trend_cubes, word_completions]
+
+    All components are loaded by default.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal
+
+from loguru import logger
+
+from api_swedeb.api.utils.dependencies import get_cwb_corpus, get_shared_corpus, load_corpus_decoder
+from api_swedeb.core.configuration import ConfigValue
+from api_swedeb.core.utility import init_stats
+
+Status = Literal['pending', 'loading', 'ready', 'failed']
+
+
+def _load_repository() -> Any:
+    repository = get_shared_corpus().repository
+    _ = repository.document_name2id
+    _ = repository.service.speech_utterances
+    _ = repository.service.protocol2names
+    return repository
+
+
+def _build_trend_cubes() -> Any:
+    cubes = get_shared_corpus().trend_cubes
+    return cubes.build() if cubes is not None else None
+
+
+@dataclass
+class Component:
+    name: str
+    loader: Callable[[], Any]
+    depends_on: list[str] = field(default_factory=list)
+
+
+COMPONENTS: dict[str, Component] = {
+    c.name: c
+    for c in [
+        Component('vectorized_corpus', lambda: get_shared_corpus().vectorized_corpus),
+        Component('person_codecs', lambda: get_shared_corpus().person_codecs),
+        Component('document_index', lambda: get_shared_corpus().document_index, ['vectorized_corpus']),
+        Component('decoded_persons', lambda: get_shared_corpus().decoded_persons, ['person_codecs']),
+        Component('repository', _load_repository, ['person_codecs', 'document_index']),
+        Component('cwb_corpus', get_cwb_corpus),
+        Component('corpus_decoder', load_corpus_decoder),
+        Component('trend_cubes', _build_trend_cubes, ['vectorized_corpus']),
+        Component(
+            'word_completions',
+            lambda: get_shared_corpus().vectorized_corpus.vocabulary_index.completions,
+            ['vectorized_corpus'],
+        ),
+    ]
+}
+
+DEFAULT_COMPONENTS: list[str] = list(COMPONENTS.keys())
+
+
+@dataclass
+class ComponentState:
+    status: Status = 'pending'
+    elapsed: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'status': self.status, 'elapsed': self.elapsed, 'error': self.error}
+
+
+class WarmUp:
+    """Loads selected components in parallel and keeps track of their load state."""
+
+    def __init__(self, components: list[str] | None = None, max_workers: int = 4):
+        unknown: set[str] = set(components or []) - set(COMPONENTS)
+        if unknown:
+            raise ValueError(f"unknown warm-up component(s): {', '.join(sorted(unknown))}")
+        self.components: list[str] = components if components is not None else DEFAULT_COMPONENTS
+        self.max_workers: int = max_workers
+        self.states: dict[str, ComponentState] = {name: ComponentState() for name in self.components}
+        self.started: float | None = None
+        self.elapsed: float | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def levels(self) -> list[list[str]]:
+        """Groups selected components into levels so that each component comes after its (selected) dependencies."""
+        remaining: list[str] = list(self.components)
+        done: set[str] = set()
+        levels: list[list[str]] = []
+        while remaining:
+            level: list[str] = [
+                name for name in remaining if all(d in done or d not in remaining for d in COMPONENTS[name].depends_on)
+            ]
+            if not level:
+                raise ValueError(f"cyclic warm-up dependencies: {remaining}")
+            levels.append(level)
+            done.update(level)
+            remaining = [name for name in remaining if name not in done]
+        return levels
+
+    def _load(self, name: str) -> None:
+        state: ComponentState = self.states[name]
+        state.status = 'loading'
+        start: float = time.perf_counter()
+        try:
+            COMPONENTS[name].loader()
+            state.status = 'ready'
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            logger.exception(f"warm-up: failed to load {name}")
+            state.status = 'failed'
+            state.error = str(ex)
+        finally:
+            state.elapsed = time.perf_counter() - start
+        logger.info(f"warm-up: {name} {state.status} in {state.elapsed:.2f}s")
+
+    def run(self) -> WarmUp:
+        with self._lock:
+            self.started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="swedeb-warmup") as executor:
+                for level in self.levels():
+                    list(executor.map(self._load, level))
+            self.elapsed = time.perf_counter() - self.started
+        logger.info(f"warm-up: done in {self.elapsed:.2f}s")
+        return self
+
+    @property
+    def is_ready(self) -> bool:
+        return all(state.status == 'ready' for state in self.states.values())
+
+    def status(self) -> dict[str, Any]:
+        return {
+            'ready': self.is_ready,
+            'elapsed': self.elapsed,
+            'components': {name: state.to_dict() for name, state in self.states.items()},
+            'initialization': init_stats(),
+        }
+
+
+__warm_up: WarmUp = None
+
+
+def get_warm_up() -> WarmUp:
+    global __warm_up
+    if __warm_up is None:
+        __warm_up = WarmUp(
+            components=ConfigValue("fastapi.warmup.components", default=DEFAULT_COMPONENTS).resolve(),
+            max_workers=ConfigValue("fastapi.warmup.max_workers", default=4).resolve(),
+        )
+    return __warm_up
+
+
+def is_warm_up_enabled() -> bool:
+    return bool(ConfigValue("fastapi.warmup.enabled", default=True).resolve())
+
+
+def start_warm_up() -> threading.Thread | None:
+    """Starts warm-up in a background thread (if enabled) so that the server can answer health checks meanwhile."""
+    if not is_warm_up_enabled():
+        return None
+    thread: threading.Thread = threading.Thread(target=get_warm_up().run, name="swedeb-warmup", daemon=True)
+    thread.start()
+    return thread
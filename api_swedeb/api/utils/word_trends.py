@@ -4,6 +4,7 @@ from pandas import DataFrame
 
 from api_swedeb.api.utils.common_params import CommonQueryParams
 from api_swedeb.api.utils.corpus import Corpus
+from api_swedeb.core.cache import cached_result
 from api_swedeb.schemas.speeches_schema import SpeechesResultItemWT, SpeechesResultWT
 from api_swedeb.schemas.word_trends_schema import SearchHits, WordTrendsItem, WordTrendsResult
 
@@ -13,8 +14,16 @@ def get_search_hit_results(search: str, corpus: Corpus, n_hits: int):
 
 
 def get_word_trends(search: str, commons: CommonQueryParams, corpus: Corpus, normalize: bool) -> WordTrendsResult:
-    df: DataFrame = corpus.get_word_trend_results(
-        search_terms=search.split(","), filter_opts=commons.get_filter_opts(include_year=True), normalize=normalize
+    search_terms: list[str] = search.split(",")
+    filter_opts: dict = commons.get_filter_opts(include_year=True)
+    df: DataFrame = cached_result(
+        "word_trends",
+        lambda: corpus.get_word_trend_results(
+            search_terms=search_terms, filter_opts=dict(filter_opts), normalize=normalize
+        ),
+        search_terms,
+        filter_opts,
+        normalize=normalize,
     )
     # FIXME: Add this logic to penelope.VectorizedCorpus so that thses hacks can be removed
     # Remove implicit pivoting by filter columns
@@ -25,8 +34,12 @@ def get_word_trends(search: str, commons: CommonQueryParams, corpus: Corpus, nor
     return WordTrendsResult(wt_list=counts_list)
 
 
+def get_word_trend_speeches_frame(search: str, commons: CommonQueryParams, corpus: Corpus) -> DataFrame:
+    return corpus.get_anforanden_for_word_trends(search.split(','), commons.get_filter_opts(include_year=True))
+
+
 def get_word_trend_speeches(search: str, commons: CommonQueryParams, corpus: Corpus) -> SpeechesResultWT:
-    df: DataFrame = corpus.get_anforanden_for_word_trends(search.split(','), commons.get_filter_opts(include_year=True))
+    df: DataFrame = get_word_trend_speeches_frame(search, commons, corpus)
 
     data: list[dict[Hashable, Any]] = df.to_dict(orient="records")
     rows: list[SpeechesResultItemWT] = [SpeechesResultItemWT(**row) for row in data]
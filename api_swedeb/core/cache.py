@@ -0,0 +1,278 @@
+"""Thread-safe in-memory result cache with LRU, byte-size and TTL eviction."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from api_swedeb.core.configuration import ConfigValue
+
+MISSING: object = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Returns an estimate of number of bytes used by `value`."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage: int | pd.Series = value.memory_usage(deep=True, index=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if hasattr(value, 'nbytes'):
+        nbytes: Any = value.nbytes
+        return int(nbytes() if callable(nbytes) else nbytes)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(x) for x in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def estimate_corpus_size(corpus: Any) -> int:
+    """Returns estimated bytes used by a (grouped) VectorizedCorpus, including the CSC copy built on extraction."""
+    return 2 * estimate_size(corpus) + estimate_size(corpus.document_index)
+
+
+def _canonical(value: Any) -> Any:
+    """Returns a JSON serializable, order independent representation of `value`."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple, set)):
+        values: list[Any] = [_canonical(v) for v in value]
+        return sorted(values, key=str) if isinstance(value, set) else values
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def make_key(*parts: Any, **kwargs: Any) -> str:
+    """Creates a canonical cache key from positional and keyword arguments.
+
+    Dicts are keyed independently of insertion order. Lists keep their order (i.e. the
+    order of search terms is significant)."""
+    data: str = json.dumps(_canonical([list(parts), kwargs]), ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def data_version() -> tuple[str, ...]:
+    """Returns the data release identifiers that all cached results depend on."""
+    return tuple(
+        str(ConfigValue(key).resolve())
+        for key in ("corpus.version", "metadata.version", "dtm.folder", "dtm.tag", "cwb.corpus_name")
+    )
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    nbytes: int
+    expires: float
+
+
+class ResultCache:
+    """LRU cache bounded by number of items and total (estimated) byte size, with per-item TTL.
+
+    Cached values are shared between callers and must be treated as read-only."""
+
+    def __init__(
+        self,
+        *,
+        max_items: int = 256,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: float | None = 3600.0,
+        sizeof: Callable[[Any], int] = estimate_size,
+        name: str = "result",
+    ):
+        self.max_items: int = max_items
+        self.max_bytes: int = max_bytes
+        self.ttl: float | None = ttl
+        self.sizeof: Callable[[Any], int] = sizeof
+        self.name: str = name
+
+        self._data: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._pending: dict[Hashable, threading.Event] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+        self.nbytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_items > 0 and self.max_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, MISSING, count=False) is not MISSING
+
+    def get(self, key: Hashable, default: Any = None, *, count: bool = True) -> Any:
+        with self._lock:
+            entry: _CacheEntry | None = self._data.get(key)
+            if entry is not None and entry.expires < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: Any, *, ttl: float | None = None) -> Any:
+        if not self.enabled:
+            return value
+        nbytes: int = self.sizeof(value)
+        if nbytes > self.max_bytes:
+            return value
+        ttl = ttl if ttl is not None else self.ttl
+        expires: float = time.monotonic() + ttl if ttl else float('inf')
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = _CacheEntry(value=value, nbytes=nbytes, expires=expires)
+            self.nbytes += nbytes
+            while self._data and (len(self._data) > self.max_items or self.nbytes > self.max_bytes):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key: Hashable, fx: Callable[[], Any], *, ttl: float | None = None) -> Any:
+        """Returns cached value for `key`, or computes, stores and returns `fx()`.
+
+        Concurrent requests for the same key wait for the first computation to finish
+        instead of computing the same result in parallel."""
+        if not self.enabled:
+            return fx()
+
+        while True:
+            value: Any = self.get(key, MISSING)
+            if value is not MISSING:
+                return value
+            with self._lock:
+                event: threading.Event | None = self._pending.get(key)
+                if event is None:
+                    event = self._pending[key] = threading.Event()
+                    break
+            event.wait()
+
+        try:
+            return self.put(key, fx(), ttl=ttl)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+
+    def _remove(self, key: Hashable) -> None:
+        entry: _CacheEntry = self._data.pop(key)
+        self.nbytes -= entry.nbytes
+
+    def clear(self) -> None:
+        """Removes all items and resets hit, miss and eviction counters"""
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'items': len(self._data),
+                'nbytes': self.nbytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+__result_cache: ResultCache = None
+__result_cache_lock: threading.Lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Returns the process wide cache for tool results (KWIC, n-grams, word trends)."""
+    global __result_cache
+    if __result_cache is None:
+        with __result_cache_lock:
+            if __result_cache is None:
+                __result_cache = ResultCache(
+                    max_items=ConfigValue("cache.result.max_items", default=256).resolve(),
+                    max_bytes=ConfigValue("cache.result.max_bytes", default=512 * 1024 * 1024).resolve(),
+                    ttl=ConfigValue("cache.result.ttl", default=3600).resolve(),
+                    name="result",
+                )
+    return __result_cache
+
+
+__cursor_cache: ResultCache = None
+
+
+def get_cursor_cache() -> ResultCache:
+    """Returns the process wide, short lived, cache for full (sorted) results that are served page by page."""
+    global __cursor_cache
+    if __cursor_cache is None:
+        with __result_cache_lock:
+            if __cursor_cache is None:
+                __cursor_cache = ResultCache(
+                    max_items=ConfigValue("cache.cursor.max_items", default=64).resolve(),
+                    max_bytes=ConfigValue("cache.cursor.max_bytes", default=256 * 1024 * 1024).resolve(),
+                    ttl=ConfigValue("cache.cursor.ttl", default=300).resolve(),
+                    name="cursor",
+                )
+    return __cursor_cache
+
+
+__corpus_cache: ResultCache = None
+
+
+def get_corpus_cache() -> ResultCache:
+    """Returns the process wide cache for transformed (grouped) word trend corpora."""
+    global __corpus_cache
+    if __corpus_cache is None:
+        with __result_cache_lock:
+            if __corpus_cache is None:
+                __corpus_cache = ResultCache(
+                    max_items=ConfigValue("cache.corpus.max_items", default=16).resolve(),
+                    max_bytes=ConfigValue("cache.corpus.max_bytes", default=512 * 1024 * 1024).resolve(),
+                    ttl=ConfigValue("cache.corpus.ttl", default=3600).resolve(),
+                    sizeof=estimate_corpus_size,
+                    name="corpus",
+                )
+    return __corpus_cache
+
+
+__protocol_cache: ResultCache = None
+
+
+def get_protocol_cache() -> ResultCache:
+    """Returns the process wide cache for parsed (metadata, utterances) of tagged frames protocols."""
+    global __protocol_cache
+    if __protocol_cache is None:
+        with __result_cache_lock:
+            if __protocol_cache is None:
+                __protocol_cache = ResultCache(
+                    max_items=ConfigValue("cache.protocol.max_items", default=128).resolve(),
+                    max_bytes=ConfigValue("cache.protocol.max_bytes", default=256 * 1024 * 1024).resolve(),
+                    ttl=ConfigValue("cache.protocol.ttl", default=3600).resolve(),
+                    name="protocol",
+                )
+    return __protocol_cache
+
+
+def result_key(tool: str, *parts: Any, **kwargs: Any) -> str:
+    """Returns cache key for a tool result, keyed on tool name, arguments and data version."""
+    return make_key(tool, data_version(), *parts, **kwargs)
+
+
+def cached_result(tool: str, fx: Callable[[], Any], *parts: Any, **kwargs: Any) -> Any:
+    """Returns `fx()` from the shared result cache, keyed on tool name, arguments and data version."""
+    return get_result_cache().get_or_compute(result_key(tool, *parts, **kwargs), fx)
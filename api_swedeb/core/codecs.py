@@ -11,6 +11,7 @@ from typing import Any, Callable, Literal, Mapping, Protocol, Self
 import pandas as pd
 
 from api_swedeb.core.configuration.inject import ConfigValue
+from api_swedeb.core.instrumentation import span
 from api_swedeb.core.utility import Registry, assign_primary_key, load_tables, revdict
 
 # pylint: disable=too-many-public-methods
@@ -357,6 +358,7 @@ class PersonCodecs(Codecs):
         page_nrs = page_nrs.astype(str) if isinstance(page_nrs, pd.Series) else str(page_nrs)
         return base_url + year + "/" + base_filename + "#page=" + page_nrs
 
+    @span("codec_decode")
     def decode_speech_index(
         self, speech_index: pd.DataFrame, value_updates: dict = None, sort_values: bool = True
     ) -> pd.DataFrame | Any:
@@ -0,0 +1,124 @@
+"""Per-process cache of cwb-ccc corpus handles.
+
+Constructing a `ccc.Corpus` reads the registry and corpus attributes, so handles are created once per
+(registry_dir, corpus_name, data_dir) and reused by all requests. Using the same handle (and data_dir)
+also means that ccc's on-disk query cache is consistently reused.
+
+A handle is health checked at most every `check_interval` seconds: if the registry file of the corpus
+is missing or has been modified (i.e. the corpus has been re-encoded), the handle is recreated. A handle
+is also dropped when a query run within `guard` fails, so that a broken handle is not served forever.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+import ccc
+from loguru import logger
+
+HandleKey = tuple[str, str, str]
+
+
+def create_corpus(registry_dir: str, corpus_name: str, data_dir: str) -> ccc.Corpus:
+    if not os.path.isdir(registry_dir):
+        raise FileNotFoundError(f"CWB registry directory {registry_dir} not found")
+    return ccc.Corpora(registry_dir=registry_dir).corpus(corpus_name=corpus_name, data_dir=data_dir)
+
+
+def registry_stamp(registry_dir: str, corpus_name: str) -> float | None:
+    """Returns modification time of the corpus' registry file, or None if file doesn't exist"""
+    for name in (corpus_name.lower(), corpus_name):
+        try:
+            return os.stat(os.path.join(registry_dir, name)).st_mtime
+        except OSError:
+            continue
+    return None
+
+
+@dataclass
+class CorpusHandle:
+    corpus: Any
+    stamp: float | None
+    checked_at: float
+
+
+class CorpusHandleCache:
+    def __init__(
+        self,
+        factory: Callable[[str, str, str], Any] = create_corpus,
+        check_interval: float = 60.0,
+    ):
+        self.factory: Callable[[str, str, str], Any] = factory
+        self.check_interval: float = check_interval
+        self._handles: dict[HandleKey, CorpusHandle] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.created: int = 0
+        self.reused: int = 0
+        self.recreated: int = 0
+
+    def _is_healthy(self, key: HandleKey, handle: CorpusHandle, now: float) -> bool:
+        if now - handle.checked_at < self.check_interval:
+            return True
+        stamp: float | None = registry_stamp(key[0], key[1])
+        if stamp is None or stamp != handle.stamp:
+            return False
+        handle.checked_at = now
+        return True
+
+    def get(self, registry_dir: str, corpus_name: str, data_dir: str) -> Any:
+        """Returns a cached handle for the corpus, creates (or recreates an unhealthy) handle if needed"""
+        key: HandleKey = (registry_dir, corpus_name, data_dir)
+        with self._lock:
+            now: float = time.monotonic()
+            handle: CorpusHandle | None = self._handles.get(key)
+            if handle is not None:
+                if self._is_healthy(key, handle, now):
+                    self.reused += 1
+                    return handle.corpus
+                logger.warning(f"CWB corpus {corpus_name}: registry changed or missing, recreating handle")
+                del self._handles[key]
+                self.recreated += 1
+
+            logger.info(f"CWB corpus {corpus_name}: creating handle (registry {registry_dir}, data {data_dir})")
+            corpus: Any = self.factory(registry_dir, corpus_name, data_dir)
+            self._handles[key] = CorpusHandle(
+                corpus=corpus, stamp=registry_stamp(registry_dir, corpus_name), checked_at=now
+            )
+            self.created += 1
+            return corpus
+
+    def invalidate(self, registry_dir: str, corpus_name: str, data_dir: str) -> None:
+        """Drops handle so that it is recreated on next `get` (e.g. after a failing query, see `guard`)"""
+        with self._lock:
+            if self._handles.pop((registry_dir, corpus_name, data_dir), None) is not None:
+                self.recreated += 1
+
+    @contextlib.contextmanager
+    def guard(self, registry_dir: str, corpus_name: str, data_dir: str) -> Iterator[None]:
+        """Invalidates the handle if the block fails. ValueError (an invalid request) leaves the handle as is."""
+        try:
+            yield
+        except ValueError:
+            raise
+        except Exception:
+            logger.warning(f"CWB corpus {corpus_name}: query failed, dropping handle")
+            self.invalidate(registry_dir, corpus_name, data_dir)
+            raise
+
+    def clear(self) -> None:
+        with self._lock:
+            self._handles.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'handles': len(self._handles),
+                'created': self.created,
+                'reused': self.reused,
+                'recreated': self.recreated,
+            }
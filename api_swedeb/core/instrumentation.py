@@ -0,0 +1,200 @@
+"""Named timing spans, latency histograms and Prometheus text exposition.
+
+Stages of a request are wrapped in spans:
+
+    with span("cqp_query"):
+        subcorpus = corpus.query(...)
+
+    @span("codec_decode")
+    def decode(...): ...
+
+Each span observes its duration in the histogram `swedeb_span_duration_seconds{span="<name>"}`. If a
+request is being timed (see `start_request_timing`), the span is also recorded in the request's timings,
+which are used for the `Server-Timing` response header. Timings are kept in a context variable, which
+the execution pool copies into worker threads.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus sense (bucket counts, sum and count)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Returns (upper bound, cumulative count) for each bucket including `+Inf`"""
+        bounds: list[str] = [f"{b:g}" for b in self.buckets] + ["+Inf"]
+        total: int = 0
+        result: list[tuple[str, int]] = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """Thread-safe store of histogram and counter families, each family holds one value per label set."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self._families: dict[str, dict[Labels, Histogram]] = {}
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._help: dict[str, str] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def observe(self, name: str, value: float, help_text: str = "", **labels: str) -> None:
+        key: Labels = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            family: dict[Labels, Histogram] = self._families.setdefault(name, {})
+            if name not in self._help:
+                self._help[name] = help_text
+            if key not in family:
+                family[key] = Histogram(self.buckets)
+            family[key].observe(value)
+
+    def increment(self, name: str, value: float = 1.0, help_text: str = "", **labels: str) -> None:
+        key: Labels = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            family: dict[Labels, float] = self._counters.setdefault(name, {})
+            if name not in self._help:
+                self._help[name] = help_text
+            family[key] = family.get(key, 0.0) + value
+
+    def counters(self) -> dict[str, dict[Labels, float]]:
+        with self._lock:
+            return {name: dict(family) for name, family in self._counters.items()}
+
+    def snapshot(self) -> dict[str, dict[Labels, dict[str, Any]]]:
+        with self._lock:
+            return {
+                name: {
+                    labels: {'buckets': h.cumulative(), 'sum': h.sum, 'count': h.count} for labels, h in family.items()
+                }
+                for name, family in self._families.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._families.clear()
+            self._counters.clear()
+
+    def render(self) -> list[str]:
+        """Returns histograms and counters in Prometheus text exposition format"""
+        lines: list[str] = []
+        for name, family in self.snapshot().items():
+            lines.append(f"# HELP {name} {self._help.get(name) or name}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, data in family.items():
+                for bound, count in data['buckets']:
+                    lines.append(f"{name}_bucket{format_labels(labels + (('le', bound),))} {count}")
+                lines.append(f"{name}_sum{format_labels(labels)} {data['sum']:.6f}")
+                lines.append(f"{name}_count{format_labels(labels)} {data['count']}")
+        for name, values in self.counters().items():
+            lines.extend(format_gauges(name, self._help.get(name) or name, values, kind="counter"))
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def format_gauges(name: str, help_text: str, values: dict[Labels, float], kind: str = "gauge") -> list[str]:
+    """Returns a gauge (or counter) family in Prometheus text exposition format"""
+    if not values:
+        return []
+    lines: list[str] = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{format_labels(labels)} {value:g}" for labels, value in values.items())
+    return lines
+
+
+SPAN_METRIC: str = "swedeb_span_duration_seconds"
+
+registry: MetricsRegistry = MetricsRegistry()
+
+_request_timings: contextvars.ContextVar[list[tuple[str, float]] | None] = contextvars.ContextVar(
+    "swedeb_request_timings", default=None
+)
+
+
+def start_request_timing() -> contextvars.Token:
+    """Starts collecting span timings for the current request (context)"""
+    return _request_timings.set([])
+
+
+def stop_request_timing(token: contextvars.Token) -> None:
+    _request_timings.reset(token)
+
+
+def request_timings() -> list[tuple[str, float]]:
+    """Returns (name, seconds) of spans recorded so far in the current request"""
+    return list(_request_timings.get() or [])
+
+
+def record(name: str, elapsed: float) -> None:
+    registry.observe(SPAN_METRIC, elapsed, "Duration of named processing stages", span=name)
+    timings: list[tuple[str, float]] | None = _request_timings.get()
+    if timings is not None:
+        timings.append((name, elapsed))
+
+
+class span:  # pylint: disable=invalid-name
+    """Times a named stage, usable as context manager or as decorator."""
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self._start: float = 0.0
+
+    def __enter__(self) -> span:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        record(self.name, time.perf_counter() - self._start)
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(self.name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def server_timing_header(timings: list[tuple[str, float]], total: float | None = None) -> str:
+    """Formats timings as a `Server-Timing` header value (durations in milliseconds).
+
+    Repeated spans (e.g. one decode per chunk) are summed."""
+    merged: dict[str, float] = {}
+    for name, elapsed in timings:
+        merged[name] = merged.get(name, 0.0) + elapsed
+    entries: list[str] = [f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in merged.items()]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries)
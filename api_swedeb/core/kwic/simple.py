@@ -7,6 +7,7 @@ from ccc import Corpus, SubCorpus
 
 from api_swedeb.core.codecs import PersonCodecs
 from api_swedeb.core.cwb import to_cqp_exprs
+from api_swedeb.core.instrumentation import span
 from api_swedeb.core.speech_index import get_speeches_by_speech_ids
 
 S_ATTR_RENAMES: dict[str, str] = {
@@ -55,15 +56,17 @@ def kwic(  # pylint: disable=too-many-arguments
     """
     query: str = to_cqp_exprs(opts, within="speech")
 
-    subcorpus: SubCorpus | str = corpus.query(query, context_left=words_before, context_right=words_after)
-
-    segments: pd.DataFrame = subcorpus.concordance(
-        form="kwic",
-        p_show=[p_show],
-        s_show=['speech_id'],
-        order="first",
-        cut_off=cut_off,
-    )
+    with span("cqp_query"):
+        subcorpus: SubCorpus | str = corpus.query(query, context_left=words_before, context_right=words_after)
+
+    with span("concordance"):
+        segments: pd.DataFrame = subcorpus.concordance(
+            form="kwic",
+            p_show=[p_show],
+            s_show=['speech_id'],
+            order="first",
+            cut_off=cut_off,
+        )
 
     if len(segments) == 0:
         return empty_kwic(p_show)
@@ -8,7 +8,10 @@ import pandas as pd
 from loguru import logger
 
 from penelope.corpus import VectorizedCorpus
+from penelope.corpus.dtm.store import store_memory_mapped
 
+from . import instrumentation
+from .cache import ResultCache, get_protocol_cache
 from .utility import time_call
 
 USED_COLUMNS: list[str] = [
@@ -46,6 +49,8 @@ SKIP_COLUMNS = [
 ]
 
 
+PATH_CACHE_METRIC: str = "swedeb_protocol_filename_lookups_total"
+
 SPEECH_INDEX_DTYPES = {
     # 'document_name': object,          # object
     # 'speech_id': object,              # object
@@ -122,13 +127,22 @@ def load_speech_index(folder: str, tag: str, write_feather: bool = True) -> pd.D
 
 
 @time_call
-def load_dtm_corpus(folder: str, tag: str) -> VectorizedCorpus:
-    """Load DTM corpus"""
-    corpus: VectorizedCorpus = VectorizedCorpus.load(folder=folder, tag=tag)
+def load_dtm_corpus(folder: str, tag: str, memory_mapped: bool = True) -> VectorizedCorpus:
+    """Load DTM corpus. If the DTM is stored in memory mapped format, the matrix and vocabulary are memory mapped
+    (when `memory_mapped` is True) so that all worker processes share the same physical pages."""
+    corpus: VectorizedCorpus = VectorizedCorpus.load(folder=folder, tag=tag, memory_mapped=memory_mapped)
     slim_speech_index(corpus.document_index)
+    if not corpus.has_postings:
+        logger.warning(f"DTM {tag}: posting lists not found (run `make dtm-mmap`), words are read from the BoW matrix")
     return corpus
 
 
+def convert_dtm_to_memory_mapped(folder: str, tag: str) -> None:
+    """Adds memory mapped arrays for matrix, vocabulary and posting lists to an existing DTM."""
+    corpus: VectorizedCorpus = VectorizedCorpus.load(folder=folder, tag=tag, memory_mapped=False)
+    store_memory_mapped(tag=tag, folder=folder, bag_term_matrix=corpus.bag_term_matrix, token2id=corpus.token2id)
+
+
 def zero_fill_filename_sequence(name: str) -> str:
     parts: list[str] = name.split('-')
     if parts[-1].isdigit():
@@ -142,29 +156,51 @@ class Loader(abc.ABC):
 
 
 class ZipLoader(Loader):
-    def __init__(self, folder: str):
+    """Loads protocols from the tagged frames archive.
+
+    Parsed protocols are kept in a memory bounded LRU cache (shared by all loaders), and the archive
+    filename that each protocol resolved to is remembered."""
+
+    def __init__(self, folder: str, cache: ResultCache = None):
         self.folder: str = folder
+        self.cache: ResultCache = cache if cache is not None else get_protocol_cache()
+        self._filenames: dict[str, str] = {}
 
     def load(self, protocol_name: str) -> tuple[dict, list[dict]]:
-        """Loads tagged protocol data from archive"""
+        """Loads tagged protocol data from archive (or cache), the returned data is shared and must not be modified"""
+        return self.cache.get_or_compute((self.folder, protocol_name), lambda: self._read(protocol_name))
+
+    def _candidate_files(self, protocol_name: str) -> list[str]:
         parts: list[str] = protocol_name.split('-')
         sub_folder: str = parts[1]
-        candidate_files: list[str] = [
+        return [
             join(self.folder, sub_folder, f"{protocol_name}.zip"),
             join(self.folder, f"{protocol_name}.zip"),
             join(self.folder, '-'.join(parts[:-1] + [parts[-1].zfill(3)]) + ".zip"),
             join(self.folder, '-'.join(parts[:-1] + [parts[-1].zfill(4)]) + ".zip"),
             join(self.folder, '-'.join(parts[:-1] + [parts[-1].lstrip('0')]) + ".zip"),
         ]
-        for filename in candidate_files:
-            if not os.path.isfile(filename):
-                continue
-            with zipfile.ZipFile(filename, "r") as fp:
-                json_str: str = fp.read(f"{protocol_name}.json")
-                metadata_str: str = fp.read("metadata.json")
-            metadata: dict = json.loads(metadata_str)
-            # FIXME: This is a hack to fix the filename sequence number bug, later versions of the corpus should have this fixed
-            metadata['name'] = zero_fill_filename_sequence(metadata.get("name"))
-            utterances: list[dict] = json.loads(json_str)
-            return metadata, utterances
+
+    def _filename(self, protocol_name: str) -> str:
+        filename: str | None = self._filenames.get(protocol_name)
+        instrumentation.registry.increment(
+            PATH_CACHE_METRIC, help_text="Protocol filename lookups", result="miss" if filename is None else "hit"
+        )
+        if filename is not None:
+            return filename
+        for filename in self._candidate_files(protocol_name):
+            if os.path.isfile(filename):
+                self._filenames[protocol_name] = filename
+                return filename
         raise FileNotFoundError(protocol_name)
+
+    @instrumentation.span("protocol_load")
+    def _read(self, protocol_name: str) -> tuple[dict, list[dict]]:
+        with zipfile.ZipFile(self._filename(protocol_name), "r") as fp:
+            json_str: str = fp.read(f"{protocol_name}.json")
+            metadata_str: str = fp.read("metadata.json")
+        metadata: dict = json.loads(metadata_str)
+        # FIXME: This is a hack to fix the filename sequence number bug, later versions of the corpus should have this fixed
+        metadata['name'] = zero_fill_filename_sequence(metadata.get("name"))
+        utterances: list[dict] = json.loads(json_str)
+        return metadata, utterances
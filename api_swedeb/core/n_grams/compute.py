@@ -4,6 +4,7 @@ import pandas as pd
 from ccc import Corpus, SubCorpus
 
 from api_swedeb.core.cwb import to_cqp_exprs
+from api_swedeb.core.instrumentation import span
 
 # pylint: disable=redefined-outer-name
 
@@ -142,11 +143,13 @@ def query_keyword_windows(
         else dict(zip(['context_left', 'context_right'], context_size))
     )
 
-    subcorpus: SubCorpus | str = corpus.query(query, **context)
+    with span("cqp_query"):
+        subcorpus: SubCorpus | str = corpus.query(query, **context)
 
-    windows: pd.DataFrame = subcorpus.concordance(
-        form="simple", p_show=[p_show], s_show=['speech_id'], order="first", cut_off=None
-    ).reset_index(drop=True)
+    with span("concordance"):
+        windows: pd.DataFrame = subcorpus.concordance(
+            form="simple", p_show=[p_show], s_show=['speech_id'], order="first", cut_off=None
+        ).reset_index(drop=True)
 
     if len(windows) == 0:
         return pd.DataFrame(columns=['window', 'count', 'documents'])
@@ -1,7 +1,6 @@
-from typing import Any
-
 import pandas as pd
 
+from api_swedeb.core.instrumentation import span
 from api_swedeb.core.utility import filter_by_opts
 from penelope.corpus import VectorizedCorpus
 from penelope.utility import PropertyValueMaskingOpts
@@ -32,6 +31,7 @@ COLUMNS_OF_INTEREST: list[str] = [
 ]
 
 
+@span("dtm_lookup")
 def _find_documents_with_words(corpus: VectorizedCorpus, terms: list[str], opts: dict) -> pd.DataFrame:
     """Finds documents where words are found.  Returns a dataframe with document_id as index and words
     found in that document as a csv string in the 'words' column.
@@ -42,10 +42,12 @@ def _find_documents_with_words(corpus: VectorizedCorpus, terms: list[str], opts:
         return pd.DataFrame({'words': []}, index=[])
 
     di: pd.DataFrame = filter_by_opts(corpus.document_index, opts)
-    vectors: dict[str, Any] = {word: corpus.get_word_vector(word)[di.index].astype(bool) for word in terms}
+    postings: dict[str, pd.Index] = {word: di.index.intersection(corpus.get_word_postings(word)[0]) for word in terms}
 
     word_document_parts: list[pd.DataFrame] = [
-        di[vec.astype(bool)][['document_id']].assign(words=word) for word, vec in vectors.items() if vec.any()
+        di.loc[document_ids, ['document_id']].assign(words=word)
+        for word, document_ids in postings.items()
+        if len(document_ids) > 0
     ]
 
     if len(word_document_parts) == 0:
@@ -54,6 +56,7 @@ def _find_documents_with_words(corpus: VectorizedCorpus, terms: list[str], opts:
     return pd.concat(word_document_parts).groupby('document_id').agg({"words": ",".join})
 
 
+@span("speech_index_merge")
 def get_speeches_by_speech_ids(
     speech_index: pd.DataFrame, speech_ids: pd.Series | pd.DataFrame | list[str], **join_opts
 ) -> pd.DataFrame:
@@ -0,0 +1,91 @@
+"""Speech level random access store of speech texts, built offline from the tagged frames archive.
+
+Loading a speech from the tagged frames archive opens the protocol's zip file and parses all of the
+protocol's utterances. The store instead keeps each speech (as assembled by `SpeechTextService`) as a
+JSON row in an SQLite file keyed by protocol name and speech number, so that a speech is fetched with a
+single indexed lookup. Build the store with `make speech-store` and enable it in the configuration:
+
+    vrt:
+      speech_store: /data/swedeb/v1.4.1/speeches.db
+
+Speeches that are not found in the store are loaded from the archive.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable
+
+from loguru import logger
+
+SCHEMA: str = """
+    create table speeches (
+        protocol_name text not null,
+        speech_nr integer not null,
+        speech_id text,
+        data text not null,
+        primary key (protocol_name, speech_nr)
+    ) without rowid;
+    create index speeches_speech_id on speeches (speech_id);
+"""
+
+SpeechRow = tuple[str, int, str, dict]
+
+
+class SpeechStore:
+    """Read-only access to speeches stored by `SpeechStore.create` (one connection per thread)"""
+
+    def __init__(self, filename: str):
+        self.filename: str = filename
+        self._local: threading.local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.filename}?mode=ro", uri=True, check_same_thread=False)
+            self._local.connection = connection
+        return connection
+
+    def get(self, protocol_name: str, speech_nr: int) -> dict | None:
+        """Returns speech `speech_nr` (1-based) of `protocol_name`, or None if the speech is not in the store"""
+        row: tuple | None = self.connection.execute(
+            "select data from speeches where protocol_name = ? and speech_nr = ?", (protocol_name, speech_nr)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def __len__(self) -> int:
+        return self.connection.execute("select count(*) from speeches").fetchone()[0]
+
+    @staticmethod
+    def create(filename: str, speeches: Iterable[SpeechRow], batch_size: int = 10000) -> int:
+        """Stores (protocol_name, speech_nr, speech_id, speech) rows in a new store `filename`.
+
+        The store is written to a temporary file that replaces `filename` when complete."""
+        temp_filename: str = f"{filename}.tmp"
+        if os.path.isfile(temp_filename):
+            os.remove(temp_filename)
+
+        n_speeches: int = 0
+        with sqlite3.connect(temp_filename) as db:
+            db.executescript(SCHEMA)
+            batch: list[tuple] = []
+            for protocol_name, speech_nr, speech_id, speech in speeches:
+                batch.append((protocol_name, speech_nr, speech_id, json.dumps(speech, ensure_ascii=False)))
+                if len(batch) >= batch_size:
+                    n_speeches += _insert(db, batch)
+                    batch = []
+            n_speeches += _insert(db, batch)
+        db.close()
+
+        os.replace(temp_filename, filename)
+        logger.info(f"speech store: stored {n_speeches} speeches in {filename}")
+        return n_speeches
+
+
+def _insert(db: sqlite3.Connection, rows: list[tuple]) -> int:
+    db.executemany("insert into speeches (protocol_name, speech_nr, speech_id, data) values (?, ?, ?, ?)", rows)
+    return len(rows)
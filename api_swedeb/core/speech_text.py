@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
 import sqlite3
+from collections import deque
+from concurrent.futures import Executor, Future
 from functools import cached_property
+from typing import Callable, Iterable, Iterator
 
 import numpy as np
 import pandas as pd
@@ -11,6 +15,7 @@ from api_swedeb.core.speech import Speech
 
 from . import codecs as md
 from .load import Loader, ZipLoader
+from .speech_store import SpeechRow, SpeechStore
 from .utility import fix_whitespace, read_sql_table
 
 # pylint: disable=unused-argument
@@ -28,32 +33,35 @@ class SpeechTextService:
         self.id_name: str = "speaker_note_id" if "speaker_note_id" in self.speech_index.columns else "speaker_hash"
 
     @cached_property
-    def name2info(self) -> dict[str, dict]:
-        """Create a map from protocol name to list of dict of relevant properties"""
-        si: pd.DataFrame = self.speech_index.set_index("protocol_name", drop=True)[
-            ["speech_id", "speech_index", self.id_name, "n_utterances"]
-        ]
-        return si.assign(data=si.to_dict("records")).groupby(si.index).agg(list)["data"].to_dict()
+    def speech_utterances(self) -> dict[str, tuple[str, int, int]]:
+        """Create a map from speech name to (protocol name, utterance start, utterance end) in the protocol"""
+        si: pd.DataFrame = self.speech_index
+        lengths: pd.Series = si["n_utterances"].fillna(0).astype(np.int64)
+        ends: pd.Series = lengths.groupby(si["protocol_name"], sort=False).cumsum()
+        starts: pd.Series = ends - lengths
+        return dict(zip(si["document_name"], zip(si["protocol_name"], starts.tolist(), ends.tolist())))
+
+    @cached_property
+    def protocol2names(self) -> dict[str, list[str]]:
+        """Create a map from protocol name to names of its speeches (in speech order)"""
+        return self.speech_index.groupby("protocol_name", sort=False)["document_name"].agg(list).to_dict()
 
     def speeches(self, *, metadata: dict, utterances: list[dict]) -> list[dict]:
         """Create list of speeches for all speeches in protocol"""
-        speech_infos: dict = self.name2info.get(metadata.get("name"))
-        speech_lengths: np.ndarray = np.array([s.get("n_utterances", 0) for s in speech_infos])
-        speech_starts: np.ndarray = np.append([0], np.cumsum(speech_lengths))
-        speeches = [
-            self._create_speech(
-                metadata=metadata,
-                utterances=utterances[speech_starts[i] : speech_starts[i + 1]],
-            )
-            for i in range(0, len(speech_infos))
+        return [
+            self.speech(speech_name=speech_name, metadata=metadata, utterances=utterances)
+            for speech_name in self.protocol2names[metadata.get("name")]
         ]
-        return speeches
 
     def nth(self, *, metadata: dict, utterances: list[dict], n: int) -> dict:
-        # speech_infos: dict = self.name2info.get(metadata.get("name"))
-        # u_idx: int = [u['u_id'] for u in utterances].index(speech_infos['u_id'])
-        # self._create_speech(metadata, utterances[u_idx:u_idx+speech_infos['n_utterances']])
-        return self.speeches(metadata=metadata, utterances=utterances)[n]
+        """Create the n:th (0-based) speech in protocol"""
+        speech_name: str = self.protocol2names[metadata.get("name")][n]
+        return self.speech(speech_name=speech_name, metadata=metadata, utterances=utterances)
+
+    def speech(self, *, speech_name: str, metadata: dict, utterances: list[dict]) -> dict:
+        """Create speech `speech_name` from the utterances of its protocol"""
+        _, start, end = self.speech_utterances[speech_name]
+        return self._create_speech(metadata=metadata, utterances=utterances[start:end])
 
     def _create_speech(self, *, metadata: dict, utterances: list[dict]) -> dict:
         return (
@@ -82,11 +90,13 @@ class SpeechTextRepository:
         person_codecs: md.PersonCodecs,
         document_index: pd.DataFrame,
         service: SpeechTextService = None,
+        store: SpeechStore = None,
     ):
         self.source: Loader = source if isinstance(source, Loader) else ZipLoader(source)
         self.person_codecs: md.PersonCodecs = person_codecs
         self.document_index: pd.DataFrame = document_index
         self.service: SpeechTextService = service or SpeechTextService(self.document_index)
+        self.store: SpeechStore = store
 
     @cached_property
     def document_name2id(self) -> dict[str, int]:
@@ -155,6 +165,42 @@ class SpeechTextRepository:
             return {}
 
     def speech(self, speech_name: str) -> Speech:
+        return self._speech(speech_name, self.source.load)
+
+    def speeches(
+        self, keys: Iterable[int | str], *, executor: Executor | None = None, max_workers: int = 1
+    ) -> Iterator[tuple[int | str, Speech]]:
+        """Returns an iterator of (key, speech) for given document ids, speech ids or document names.
+
+        Speeches are yielded grouped by protocol, and each protocol is loaded once. If `executor` is given,
+        protocols are loaded by the executor, up to `max_workers` of them concurrently. Raises ValueError
+        (before any speech is loaded) if a key is not a valid speech key."""
+        groups: dict[str | None, list[tuple[int | str, str | None]]] = {}
+        for key in keys:
+            document_name: str | None = self._document_name(key)
+            groups.setdefault(document_name.split("_")[0] if document_name else None, []).append((key, document_name))
+
+        tasks: list[Callable[[], list[tuple[int | str, Speech]]]] = [
+            functools.partial(self._protocol_speeches, group) for group in groups.values()
+        ]
+        return _run_tasks(tasks, executor=executor, max_workers=max_workers)
+
+    def _document_name(self, key: int | str) -> str | None:
+        """Returns document name of speech `key`, or None if key is not found. Raises ValueError if key is invalid."""
+        if isinstance(key, str) and key.startswith("prot-"):
+            return key
+        key_index: int | None = self.get_key_index(key)
+        try:
+            return self.document_index.loc[key_index]["document_name"]
+        except KeyError:
+            return None
+
+    def _protocol_speeches(self, items: list[tuple[int | str, str | None]]) -> list[tuple[int | str, Speech]]:
+        """Creates speeches for (key, document name) items of the same protocol (which is loaded at most once)"""
+        load: Callable[[str], tuple[dict, list[dict]]] = functools.lru_cache(maxsize=1)(self.source.load)
+        return [(key, self._speech(document_name or str(key), load)) for key, document_name in items]
+
+    def _speech(self, speech_name: str, load: Callable[[str], tuple[dict, list[dict]]]) -> Speech:
         try:
             """Load speech data from speech corpus"""
             if not speech_name.startswith("prot-"):
@@ -165,13 +211,11 @@ class SpeechTextRepository:
             protocol_name: str = speech_name.split("_")[0]
             speech_nr: int = int(speech_name.split("_")[1])
 
-            metadata, utterances = self.source.load(protocol_name)
-            speech: dict = self.service.nth(metadata=metadata, utterances=utterances, n=speech_nr - 1)
-
+            speech, has_utterances = self._load_speech(protocol_name, speech_nr, load)
             speech_info: dict = self.get_speech_info(speech_name)
             speech.update(**speech_info)
             speech.update(protocol_name=protocol_name)
-            speech.update(page_number=speech.get("page_number", 1) if utterances else None)
+            speech.update(page_number=speech.get("page_number", 1) if has_utterances else None)
 
             speech["office_type"] = self.person_codecs.get_mapping("office_type_id", "office").get(
                 speech["office_type_id"], "Okänt"
@@ -194,7 +238,58 @@ class SpeechTextRepository:
 
         return Speech(speech)
 
+    def _load_speech(
+        self, protocol_name: str, speech_nr: int, load: Callable[[str], tuple[dict, list[dict]]] = None
+    ) -> tuple[dict, bool]:
+        """Returns speech `speech_nr` (1-based) from the speech store if available, otherwise from the protocol
+        (loaded by `load`). Also returns False if the protocol has no utterances."""
+        if self.store is not None:
+            speech: dict | None = self.store.get(protocol_name, speech_nr)
+            if speech is not None:
+                return speech, bool(speech)
+        metadata, utterances = (load or self.source.load)(protocol_name)
+        return self.service.nth(metadata=metadata, utterances=utterances, n=speech_nr - 1), bool(utterances)
+
     def to_text(self, speech: dict) -> str:
         paragraphs: list[str] = speech.get("paragraphs", [])
         text: str = fix_whitespace("\n".join(paragraphs))
         return text
+
+
+def _run_tasks(tasks: list[Callable[[], list]], *, executor: Executor | None, max_workers: int) -> Iterator:
+    """Yields items of the lists returned by `tasks` in task order. If `executor` is given, up to `max_workers`
+    tasks are submitted ahead of the consumer (tasks not yet started are cancelled if the consumer stops)."""
+    if executor is None or max_workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield from task()
+        return
+
+    pending: deque[Future] = deque()
+    try:
+        for task in tasks:
+            pending.append(executor.submit(task))
+            if len(pending) >= max_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def build_speech_store(filename: str, *, source: str | Loader, document_index: pd.DataFrame) -> int:
+    """Builds a `SpeechStore` of all speeches in `document_index` from the tagged frames archive `source`"""
+    service: SpeechTextService = SpeechTextService(document_index.copy())
+    loader: Loader = source if isinstance(source, Loader) else ZipLoader(source)
+
+    def speeches() -> Iterable[SpeechRow]:
+        for protocol_name in service.protocol2names:
+            try:
+                metadata, utterances = loader.load(protocol_name)
+            except FileNotFoundError:
+                logger.warning(f"speech store: protocol {protocol_name} not found")
+                continue
+            for i, speech in enumerate(service.speeches(metadata=metadata, utterances=utterances)):
+                yield protocol_name, i + 1, speech.get("u_id"), speech
+
+    return SpeechStore.create(filename, speeches())
@@ -0,0 +1,153 @@
+"""Precomputed year × pivot key aggregates ("cubes") of the speech level DTM, used by word trends.
+
+Word trends group the DTM by year and by the keys that the request filters on. Grouping ~1M speech rows on
+each request is slow, so instead the DTM is grouped once by year and each subset of `dimensions`, e.g.
+
+    year, year × party_id, year × gender_id, ..., year × party_id × gender_id × chamber_abbrev
+
+A request is then answered by regrouping (and filtering) the cube having exactly the request's keys, which
+has a few thousand rows. Cubes are either loaded from disk (stored by `store_trend_cubes`, see
+`make trend-cubes`) or built (once) in memory, each cube from the smallest complete cube that covers it.
+
+Configuration (all keys are optional):
+
+    dtm:
+      cubes:
+        enabled: true
+        dimensions: [party_id, gender_id, chamber_abbrev]
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+from os.path import join as jj
+from typing import Iterable
+
+import pandas as pd
+import scipy.sparse as sp
+from loguru import logger
+
+from api_swedeb.core.utility import Lazy
+from penelope.corpus import VectorizedCorpus
+from penelope.utility import PropertyValueMaskingOpts
+
+DEFAULT_DIMENSIONS: tuple[str, ...] = ('party_id', 'gender_id', 'chamber_abbrev')
+
+CubeKey = frozenset[str]
+
+
+def build_cube(source: VectorizedCorpus, keys: Iterable[str]) -> VectorizedCorpus:
+    """Sums rows of `source` by year and `keys`"""
+    return source.group_by_pivot_keys(
+        temporal_key='year',
+        pivot_keys=list(keys),
+        filter_opts=None,
+        document_namer=None,
+        fill_gaps=False,
+        aggregate='sum',
+    )
+
+
+class TrendCubes:
+    """Year × pivot key aggregates of a DTM, shared between requests."""
+
+    def __init__(
+        self,
+        corpus: VectorizedCorpus,
+        dimensions: Iterable[str] = DEFAULT_DIMENSIONS,
+        folder: str = None,
+        tag: str = None,
+    ):
+        self.corpus: VectorizedCorpus = corpus
+        self.dimensions: tuple[str, ...] = tuple(d for d in dimensions if d in corpus.document_index.columns)
+        self.folder: str = folder
+        self.tag: str = tag
+        self._cubes: dict[CubeKey, Lazy] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def name(self, keys: Iterable[str]) -> str:
+        return '.'.join(['year'] + [d for d in self.dimensions if d in set(keys)])
+
+    @property
+    def keys(self) -> list[CubeKey]:
+        """All subsets of dimensions, largest first"""
+        return [
+            frozenset(keys)
+            for n in range(len(self.dimensions), -1, -1)
+            for keys in itertools.combinations(self.dimensions, n)
+        ]
+
+    def find_keys(
+        self, pivot_keys: Iterable[str], filter_opts: PropertyValueMaskingOpts | dict | None
+    ) -> CubeKey | None:
+        """Returns keys of the (smallest) cube that can answer a query, or None if no cube can"""
+        props: dict = filter_opts.props if isinstance(filter_opts, PropertyValueMaskingOpts) else filter_opts or {}
+        keys: set[str] = (set(pivot_keys or []) | set(props.keys())) - {'year'}
+        return frozenset(keys) if keys <= set(self.dimensions) else None
+
+    def get(self, keys: CubeKey) -> VectorizedCorpus:
+        with self._lock:
+            if keys not in self._cubes:
+                self._cubes[keys] = Lazy(lambda: self._create(keys), name=f"trend_cube.{self.name(keys)}")
+            cube: Lazy = self._cubes[keys]
+        return cube.value
+
+    def build(self) -> TrendCubes:
+        """Builds (or loads) all cubes, largest first so that smaller cubes are derived from larger ones"""
+        for keys in self.keys:
+            self.get(keys)
+        return self
+
+    def is_complete(self, cube: VectorizedCorpus) -> bool:
+        """Cubes that dropped rows (speeches with missing key values) cannot be used to derive other cubes"""
+        return int(cube.document_index['n_documents'].sum()) == self.corpus.n_docs
+
+    def _built(self) -> list[tuple[CubeKey, VectorizedCorpus]]:
+        with self._lock:
+            lazies: list[tuple[CubeKey, Lazy]] = list(self._cubes.items())
+        return [(keys, lazy.value) for keys, lazy in lazies if lazy.is_initialized()]
+
+    def _create(self, keys: CubeKey) -> VectorizedCorpus:
+        cube: VectorizedCorpus = self._load(keys)
+        if cube is not None:
+            return cube
+
+        sources: list[VectorizedCorpus] = [
+            cube for built_keys, cube in self._built() if keys < built_keys and self.is_complete(cube)
+        ]
+        source: VectorizedCorpus = min(sources, key=lambda c: c.n_docs, default=self.corpus)
+        logger.info(f"trend cubes: building {self.name(keys)} from {source.n_docs} rows")
+        return build_cube(source, [d for d in self.dimensions if d in keys])
+
+    def _filename(self, keys: CubeKey, extension: str) -> str:
+        return jj(self.folder, f"{self.tag}_cube.{self.name(keys)}.{extension}")
+
+    def _load(self, keys: CubeKey) -> VectorizedCorpus | None:
+        if not (self.folder and self.tag and os.path.isfile(self._filename(keys, 'feather'))):
+            return None
+        cube: VectorizedCorpus = VectorizedCorpus(
+            bag_term_matrix=sp.load_npz(self._filename(keys, 'npz')),
+            token2id=self.corpus.token2id,
+            document_index=pd.read_feather(self._filename(keys, 'feather')),
+        )
+        if cube.n_tokens != self.corpus.n_tokens or cube.document_index['n_documents'].sum() > self.corpus.n_docs:
+            logger.warning(f"trend cubes: ignoring stored cube {self.name(keys)} (does not match DTM)")
+            return None
+        return cube
+
+    def store(self, folder: str = None, tag: str = None) -> None:
+        """Stores all cubes as `{tag}_cube.{name}.[npz|feather]`"""
+        folder, tag = folder or self.folder, tag or self.tag
+        for keys in self.keys:
+            cube: VectorizedCorpus = self.get(keys)
+            name: str = self.name(keys)
+            sp.save_npz(jj(folder, f"{tag}_cube.{name}.npz"), cube.bag_term_matrix, compressed=True)
+            cube.document_index.reset_index(drop=True).to_feather(jj(folder, f"{tag}_cube.{name}.feather"))
+
+
+def store_trend_cubes(folder: str, tag: str, dimensions: Iterable[str] = DEFAULT_DIMENSIONS) -> None:
+    """Builds trend cubes for the DTM `tag` in `folder` and stores them next to the DTM."""
+    corpus: VectorizedCorpus = VectorizedCorpus.load(folder=folder, tag=tag)
+    TrendCubes(corpus, dimensions=dimensions).build().store(folder=folder, tag=tag)
@@ -4,8 +4,10 @@ import copy
 import os
 import re
 import sqlite3
+import threading
 import time
 import types
+from dataclasses import asdict, dataclass
 from functools import wraps
 from os.path import basename, dirname, splitext
 from typing import Any, Callable, ItemsView, Iterator, KeysView, Type, TypeVar, ValuesView
@@ -15,6 +17,7 @@ import pandas as pd
 import requests
 from loguru import logger
 
+from api_swedeb.core import instrumentation
 from penelope.utility import PropertyValueMaskingOpts
 
 try:
@@ -42,6 +45,7 @@ class Registry:
         register(**args): Decorator to register a function or class with an optional key and type.
         is_registered(key): Check if a key is registered.
     """
+
     items: dict = {}
 
     @classmethod
@@ -89,34 +93,102 @@ def flatten(lst: list[list[Any]]) -> list[Any]:
     return [item for sublist in lst for item in sublist]
 
 
+@dataclass
+class InitStats:
+    """Metrics for once-only initializations sharing the same name."""
+
+    name: str
+    initializations: int = 0
+    failures: int = 0
+    init_seconds: float = 0.0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+_init_stats: dict[str, InitStats] = {}
+_init_stats_lock: threading.Lock = threading.Lock()
+
+
+def _record_init(name: str, *, elapsed: float = None, waited: float = None, failed: bool = False) -> None:
+    with _init_stats_lock:
+        stats: InitStats = _init_stats.setdefault(name, InitStats(name=name))
+        if failed:
+            stats.failures += 1
+        elif elapsed is not None:
+            stats.initializations += 1
+            stats.init_seconds += elapsed
+        if waited is not None:
+            stats.waits += 1
+            stats.wait_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+
+def init_stats() -> dict[str, dict[str, Any]]:
+    """Returns initialization metrics (including time spent by threads waiting for another thread's init)."""
+    with _init_stats_lock:
+        return {name: stats.to_dict() for name, stats in _init_stats.items()}
+
+
 class Lazy:
-    """Implements Lazy evaluation of a value."""
+    """Implements thread-safe Lazy evaluation of a value.
 
-    def __init__(self, factory: Callable[[], Any]) -> None:
+    The factory is called at most once (unless it fails). Threads that request the value while
+    another thread is calling the factory block until the value is available."""
+
+    def __init__(self, factory: Callable[[], Any], name: str = None) -> None:
         self._factory: Callable[[], Any] = factory
         self._is_initialized: bool = False
         self._value: Any = None
+        self._lock: threading.RLock = threading.RLock()
+        self.name: str = name or getattr(factory, "__qualname__", "lazy")
 
     @property
     def value(self) -> Any | None:
-        if not self._is_initialized:
-            self._value = self._factory()
+        return self.get()
+
+    def get(self, *args, **kwargs) -> Any | None:
+        """Returns the value, arguments are passed to the factory if the value is not yet initialized."""
+        if self._is_initialized:
+            return self._value
+        start: float = time.perf_counter()
+        with self._lock:
+            if self._is_initialized:
+                _record_init(self.name, waited=time.perf_counter() - start)
+                return self._value
+            try:
+                self._value = self._factory(*args, **kwargs)
+            except Exception:
+                _record_init(self.name, failed=True)
+                raise
             self._is_initialized = True
+            _record_init(self.name, elapsed=time.perf_counter() - start)
         return self._value
 
     def is_initialized(self) -> bool:
         return self._is_initialized
 
+    def reset(self) -> None:
+        with self._lock:
+            self._is_initialized = False
+            self._value = None
+
 
 def lazy_property(fn) -> property:
-    """Decorator that makes a property lazy-evaluated."""
+    """Decorator that makes a property lazy-evaluated (thread-safe, evaluated once per instance)."""
     attr_name = "_lazy_" + fn.__name__
+    guard: threading.Lock = threading.Lock()
 
     @property
     def _lazy_property(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, fn(self))
-        return getattr(self, attr_name)
+        lazy: Lazy = self.__dict__.get(attr_name)
+        if lazy is None:
+            with guard:
+                lazy = self.__dict__.setdefault(attr_name, Lazy(lambda: fn(self), name=fn.__qualname__))
+        return lazy.value
 
     return _lazy_property
 
@@ -437,13 +509,15 @@ def format_protocol_id(selected_protocol: str) -> str:
 
 
 def time_call(func):
+    """Records call duration as a span named after the function (see `instrumentation`)."""
+
     @wraps(func)
     def timeit_wrapper(*args, **kwargs):
         start_time: float = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time: float = time.perf_counter()
-        total_time: float = end_time - start_time
-        logger.info(f'Method {func.__name__}{args} {kwargs} ended in {total_time:.4f} seconds')
+        total_time: float = time.perf_counter() - start_time
+        instrumentation.record(func.__name__, total_time)
+        logger.debug(f'{func.__name__} ended in {total_time:.4f} seconds')
         return result
 
     return timeit_wrapper
@@ -9,6 +9,9 @@ from penelope.common import word_trends as wt  # type: ignore
 from penelope.common.keyness import KeynessMetric
 
 from . import codecs as md
+from .cache import ResultCache, get_corpus_cache, result_key
+from .instrumentation import span
+from .trend_cubes import TrendCubes
 
 # These two class are currently identical to the ones in welfare_state_analytics.notebookd...word_trends.py
 
@@ -32,9 +35,16 @@ class SweDebComputeOpts(wt.TrendsComputeOpts):
 
 
 class SweDebTrendsData(wt.TrendsService):
-    def __init__(self, corpus: pc.VectorizedCorpus, person_codecs: md.PersonCodecs, n_top: int = 100000):
+    def __init__(
+        self,
+        corpus: pc.VectorizedCorpus,
+        person_codecs: md.PersonCodecs,
+        n_top: int = 100000,
+        cubes: TrendCubes = None,
+    ):
         super().__init__(corpus, n_top=n_top)
         self.person_codecs: md.PersonCodecs = person_codecs
+        self.cubes: TrendCubes = cubes
         self._compute_opts: SweDebComputeOpts = SweDebComputeOpts(
             normalize=False,
             keyness=KeynessMetric.TF,
@@ -43,7 +53,44 @@ class SweDebTrendsData(wt.TrendsService):
             words=None,
         )
 
+    def _source_corpus(self, opts: SweDebComputeOpts) -> pc.VectorizedCorpus:
+        """Returns the smallest precomputed cube that can answer the query (TF only), otherwise the corpus"""
+        if self.cubes is None or self.cubes.corpus is not self.corpus or opts.keyness != KeynessMetric.TF:
+            return self.corpus
+        keys: frozenset[str] | None = self.cubes.find_keys(opts.pivot_keys_id_names, opts.filter_opts)
+        return self.corpus if keys is None else self.cubes.get(keys)
+
     def _transform_corpus(self, opts: SweDebComputeOpts) -> pc.VectorizedCorpus:
+        """Returns the grouped corpus from the shared corpus cache (computed if missing)
+
+        The cache is keyed on the (folder, tag) the corpus was loaded from (and the data version), corpora that
+        were not loaded from a stored DTM are not cached. If `opts.column_slice` is set, the columns of the
+        requested words are sliced before grouping and their (sorted) indices are part of the key. The cached
+        corpus is shared between requests and must not be modified."""
+        source: tuple[str, str] | None = getattr(self.corpus, "source", None)
+        cache: ResultCache = get_corpus_cache()
+        if source is None or not cache.enabled:
+            return self._group_corpus(opts)
+        key: str = result_key(
+            "trends_corpus",
+            source,
+            self.corpus.shape,
+            opts.normalize,
+            opts.keyness,
+            opts.temporal_key,
+            list(opts.pivot_keys_id_names or []),
+            opts.filter_opts.props if opts.filter_opts is not None else {},
+            opts.fill_gaps,
+            opts.keyness_source,
+            self._column_indices(opts) if opts.column_slice and opts.words else None,
+        )
+        return cache.get_or_compute(key, lambda: self._group_corpus(opts))
+
+    def _column_indices(self, opts: SweDebComputeOpts) -> list[int]:
+        """Returns sorted indices of terms matching `opts.words`"""
+        return sorted(super()._column_indices(opts))
+
+    def _group_corpus(self, opts: SweDebComputeOpts) -> pc.VectorizedCorpus:
         corpus: pc.VectorizedCorpus = super()._transform_corpus(opts)
         if len(corpus.document_index) == 0:
             return corpus
@@ -96,11 +143,13 @@ def compute_word_trends(
     search_terms: list[str],
     filter_opts: dict[str, Any],
     normalize: bool = False,
+    cubes: TrendCubes = None,
+    column_slice: bool = True,
 ) -> pd.DataFrame:
     start_year, end_year = filter_opts.pop('year') if 'year' in filter_opts else (None, None)
 
     trends_data: SweDebTrendsData = SweDebTrendsData(
-        corpus=vectorized_corpus, person_codecs=person_codecs, n_top=1000000
+        corpus=vectorized_corpus, person_codecs=person_codecs, n_top=1000000, cubes=cubes
     )
     pivot_keys: list[str] = list(filter_opts.keys()) if filter_opts else []
 
@@ -115,9 +164,11 @@ def compute_word_trends(
         top_count=100000,
         unstack_tabular=False,
         words=search_terms,
+        column_slice=column_slice,
     )
 
-    trends_data.transform(opts)
+    with span("dtm_grouping"):
+        trends_data.transform(opts)
 
     trends: pd.DataFrame = trends_data.extract(indices=trends_data.find_word_indices(opts))
 
@@ -27,6 +27,9 @@ class KeywordInContextItem(BaseModel):
 
 class KeywordInContextResult(BaseModel):
     kwic_list: List[KeywordInContextItem]
+    total: Optional[int] = Field(None, description="Total number of rows in (unpaged) result")
+    offset: Optional[int] = Field(None, description="Offset of returned page")
+    limit: Optional[int] = Field(None, description="Max number of rows in returned page")
 
 
 class SortBy(Enum):
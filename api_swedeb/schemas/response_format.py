@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ResponseFormat(Enum):
+    json = "json"
+    ndjson = "ndjson"
+    csv = "csv"
+    arrow = "arrow"
@@ -5,3 +5,11 @@ class SpeechesTextResultItem(BaseModel):
     speaker_note: str = Field(None, description="Speaker note")
     speech_text: str = Field(None, description="Speech text")
     page_number: int = Field(None, description="Page number")
+
+
+class SpeechesTextBatchItem(SpeechesTextResultItem):
+    speech_id: str = Field(None, description="Speech id (as requested)")
+
+
+class SpeechesTextBatchResult(BaseModel):
+    speech_list: list[SpeechesTextBatchItem] = Field(default_factory=list, description="Speech texts in request order")
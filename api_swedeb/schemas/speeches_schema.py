@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +22,9 @@ class SpeechesResultItem(BaseModel):
 
 class SpeechesResult(BaseModel):
     speech_list: List[SpeechesResultItem]
+    total: Optional[int] = Field(None, description="Total number of rows in (unpaged) result")
+    offset: Optional[int] = Field(None, description="Offset of returned page")
+    limit: Optional[int] = Field(None, description="Max number of rows in returned page")
 
 
 class SpeechesResultItemWT(SpeechesResultItem):
@@ -0,0 +1,138 @@
+"""Benchmark fixtures and options.
+
+Usage:
+
+    make benchmark BENCHMARK_SIZE=small
+    pytest benchmarks --corpus-size=medium --rounds=20 --benchmark-baseline=benchmarks/results/baseline.json
+
+Results (latency percentiles and peak memory per benchmark) are written as JSON to `--benchmark-output`.
+If `--benchmark-baseline` is given, the session fails if any benchmark's p50 latency or peak memory
+exceeds the baseline by more than `--benchmark-tolerance`.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api_swedeb.core.configuration import ConfigStore
+from api_swedeb.core.configuration.config import Config
+from benchmarks.harness import BenchmarkSession, Measurement, measure
+from benchmarks.synthetic import SIZES, SyntheticCorpus, build_synthetic_corpus
+
+# pylint: disable=redefined-outer-name
+
+SESSION: BenchmarkSession = BenchmarkSession()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('benchmark')
+    group.addoption('--corpus-size', default='small', choices=list(SIZES), help='Size of synthetic corpus')
+    group.addoption('--corpus-folder', default=None, help='Folder where synthetic corpus is built (and reused)')
+    group.addoption('--rounds', type=int, default=10, help='Timed rounds per benchmark')
+    group.addoption('--benchmark-output', default=None, help='JSON file to write results to')
+    group.addoption('--benchmark-baseline', default=None, help='JSON result file to compare with')
+    group.addoption('--benchmark-tolerance', type=float, default=0.25, help='Allowed relative regression')
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    SESSION.context.update(corpus_size=config.getoption('--corpus-size'), rounds=config.getoption('--rounds'))
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:  # pylint: disable=unused-argument
+    config: pytest.Config = session.config
+    if not SESSION.measurements:
+        return
+
+    output: str = config.getoption('--benchmark-output') or os.path.join(
+        'benchmarks', 'results', f"{time.strftime('%Y%m%dT%H%M%S')}_{config.getoption('--corpus-size')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    SESSION.save(output)
+
+    reporter = config.pluginmanager.get_plugin('terminalreporter')
+    if reporter:
+        reporter.write_line('')
+        for line in SESSION.report():
+            reporter.write_line(line)
+        reporter.write_line(f"benchmark results written to {output}")
+
+    baseline_filename: str = config.getoption('--benchmark-baseline')
+    if baseline_filename:
+        with open(baseline_filename, encoding='utf-8') as fp:
+            regressions: list[str] = SESSION.regressions(json.load(fp), config.getoption('--benchmark-tolerance'))
+        for regression in regressions:
+            if reporter:
+                reporter.write_line(f"REGRESSION {regression}", red=True)
+        if regressions:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.fixture(scope='session')
+def synthetic_corpus(request: pytest.FixtureRequest) -> SyntheticCorpus:
+    size: str = request.config.getoption('--corpus-size')
+    folder: str = request.config.getoption('--corpus-folder') or os.path.join(
+        tempfile.gettempdir(), f'swedeb-benchmark-{size}'
+    )
+    corpus: SyntheticCorpus = build_synthetic_corpus(folder, SIZES[size])
+
+    base: dict[str, Any] = dict(Config.load(source='config/config.yml').data)
+    base['fastapi'] = base.get('fastapi', {}) | {'warmup': {'enabled': False}}
+    ConfigStore.configure_context(source=corpus.config(base))
+
+    return corpus
+
+
+@pytest.fixture(scope='session')
+def fastapi_client(synthetic_corpus: SyntheticCorpus) -> TestClient:  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from api_swedeb.api import health_router, metadata_router, tool_router
+
+    app: FastAPI = FastAPI()
+    app.include_router(tool_router.router)
+    app.include_router(metadata_router.router)
+    app.include_router(health_router.router)
+    return TestClient(app)
+
+
+@pytest.fixture(scope='session')
+def api_corpus(synthetic_corpus: SyntheticCorpus):  # pylint: disable=unused-argument
+    """The shared corpus with all components loaded (so that load time is not included in timings)"""
+    from api_swedeb.api.utils.dependencies import get_shared_corpus  # pylint: disable=import-outside-toplevel
+
+    corpus = get_shared_corpus()
+    _ = corpus.vectorized_corpus, corpus.document_index, corpus.person_codecs, corpus.decoded_persons
+    _ = corpus.repository
+    return corpus
+
+
+def clear_caches() -> None:
+    # pylint: disable=import-outside-toplevel
+    from api_swedeb.core.cache import get_corpus_cache, get_cursor_cache, get_protocol_cache, get_result_cache
+
+    get_result_cache().clear()
+    get_cursor_cache().clear()
+    get_corpus_cache().clear()
+    get_protocol_cache().clear()
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Callable[..., Measurement]:
+    """Returns a function that measures a callable and adds the result to the session.
+
+    Result caches are cleared before each call (unless `cold=False`) so that timings reflect computation.
+    Benchmarks are grouped by module, e.g. `core` for `test_core.py`."""
+    rounds: int = request.config.getoption('--rounds')
+    group: str = request.module.__name__.rsplit('.', maxsplit=1)[-1].removeprefix('test_')
+
+    def run(name: str, fx: Callable[[], Any], *, cold: bool = True, **kwargs) -> Measurement:
+        kwargs.setdefault('rounds', rounds)
+        kwargs.setdefault('group', group)
+        return SESSION.add(measure(name, fx, setup=clear_caches if cold else None, **kwargs))
+
+    return run
@@ -0,0 +1,143 @@
+"""Minimal benchmark harness: latency percentiles and peak (Python heap) memory of a callable.
+
+Timings are measured without memory tracing. Peak memory is measured in a separate, traced call
+using `tracemalloc`, and covers allocations made by Python and numpy (but not by e.g. CQP subprocesses).
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Returns the `q`th percentile (0-100) of `values` using linear interpolation"""
+    data: list[float] = sorted(values)
+    if not data:
+        return float('nan')
+    k: float = (len(data) - 1) * q / 100.0
+    lo: int = int(k)
+    hi: int = min(lo + 1, len(data) - 1)
+    return data[lo] + (data[hi] - data[lo]) * (k - lo)
+
+
+@dataclass
+class Measurement:
+    name: str
+    group: str
+    timings: list[float] = field(default_factory=list)
+    peak_memory: int = 0
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'group': self.group,
+            'rounds': len(self.timings),
+            'min': min(self.timings),
+            'max': max(self.timings),
+            'mean': statistics.fmean(self.timings),
+            'p50': percentile(self.timings, 50),
+            'p90': percentile(self.timings, 90),
+            'p99': percentile(self.timings, 99),
+            'peak_memory': self.peak_memory,
+        }
+
+
+def measure(
+    name: str,
+    fx: Callable[[], Any],
+    *,
+    group: str = 'default',
+    rounds: int = 10,
+    warmup: int = 1,
+    setup: Callable[[], Any] | None = None,
+    trace_memory: bool = True,
+) -> Measurement:
+    """Calls `fx` `warmup` + `rounds` times, `setup` (if any) is called before each call and is not timed."""
+    measurement: Measurement = Measurement(name=name, group=group)
+
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fx()
+
+    for _ in range(rounds):
+        if setup:
+            setup()
+        gc.collect()
+        start: float = time.perf_counter()
+        fx()
+        measurement.timings.append(time.perf_counter() - start)
+
+    if trace_memory:
+        if setup:
+            setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fx()
+            _, measurement.peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return measurement
+
+
+@dataclass
+class BenchmarkSession:
+    """Collects measurements and compares them with a baseline."""
+
+    context: dict[str, Any] = field(default_factory=dict)
+    measurements: list[Measurement] = field(default_factory=list)
+
+    def add(self, measurement: Measurement) -> Measurement:
+        self.measurements.append(measurement)
+        return measurement
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'context': self.context | {'python': platform.python_version(), 'machine': platform.machine()},
+            'benchmarks': [m.summary for m in self.measurements],
+        }
+
+    def save(self, filename: str) -> None:
+        with open(filename, 'w', encoding='utf-8') as fp:
+            json.dump(self.to_dict(), fp, indent=2)
+
+    def regressions(self, baseline: dict[str, Any], tolerance: float) -> list[str]:
+        """Returns descriptions of benchmarks with p50 latency or peak memory `tolerance` (fraction) above baseline"""
+        previous: dict[tuple[str, str], dict[str, Any]] = {
+            (b['group'], b['name']): b for b in baseline.get('benchmarks', [])
+        }
+        regressions: list[str] = []
+        for measurement in self.measurements:
+            current: dict[str, Any] = measurement.summary
+            before: dict[str, Any] | None = previous.get((measurement.group, measurement.name))
+            if not before:
+                continue
+            for metric in ('p50', 'peak_memory'):
+                if before[metric] and current[metric] > before[metric] * (1.0 + tolerance):
+                    regressions.append(
+                        f"{measurement.group}/{measurement.name}: {metric} {current[metric]:.4g} > {before[metric]:.4g}"
+                    )
+        return regressions
+
+    def report(self) -> list[str]:
+        header: str = (
+            f"{'group':<10} {'name':<36} {'rounds':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'peak MB':>8}"
+        )
+        lines: list[str] = [header, '-' * len(header)]
+        for measurement in self.measurements:
+            s: dict[str, Any] = measurement.summary
+            lines.append(
+                f"{s['group']:<10} {s['name'][:36]:<36} {s['rounds']:>6} {s['p50'] * 1000:>9.2f}"
+                f" {s['p90'] * 1000:>9.2f} {s['p99'] * 1000:>9.2f} {s['peak_memory'] / 1024**2:>8.1f}"
+            )
+        return lines
@@ -0,0 +1,350 @@
+"""Synthetic corpus of configurable size used by the benchmarks.
+
+The corpus mimics the layout of the real data:
+
+    metadata/riksprot_metadata.db               Code tables, persons and speaker notes (SQLite)
+    dtm/{tag}_*                                 Vectorized corpus (DTM), document (speech) index
+    tagged_frames/{year}/{protocol_name}.zip    Protocol utterances (speech text)
+    registry/, cwb/                             CWB corpus (only if `cwb-encode` and `cwb-makeall` are installed)
+
+Token frequencies are Zipf distributed, and a few common Swedish words are placed at the top
+of the vocabulary so that benchmarks can search for words that are known to exist.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import zipfile
+from dataclasses import asdict, dataclass
+from os.path import join as jj
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import scipy
+
+from penelope.corpus import VectorizedCorpus
+
+COMMON_WORDS: list[str] = ['debatt', 'skatt', 'sverige', 'riksdagen', 'regeringen', 'försvar', 'arbete', 'skola']
+SYLLABLES: list[str] = ['ar', 'be', 'da', 'ek', 'fo', 'gri', 'hal', 'is', 'ko', 'lun', 'mo', 'nä', 'ol', 'på', 'rö']
+
+CHAMBERS: list[tuple[int, str, str]] = [(0, '', ''), (1, 'Första kammaren', 'fk'), (2, 'Andra kammaren', 'ak')]
+GENDERS: list[tuple[int, str, str]] = [(0, 'unknown', '?'), (1, 'man', 'M'), (2, 'woman', 'K')]
+PARTIES: list[tuple[int, str, str, str]] = [
+    (0, 'Okänt', '?', '#999999'),
+    (1, 'Socialdemokraterna', 'S', '#E8112d'),
+    (2, 'Moderaterna', 'M', '#52BDEC'),
+    (3, 'Centerpartiet', 'C', '#009933'),
+    (4, 'Liberalerna', 'L', '#006AB3'),
+    (5, 'Partilös', 'X', '#555555'),
+]
+OFFICE_TYPES: list[tuple[int, str]] = [(0, 'unknown'), (1, 'Ledamot'), (2, 'Minister'), (3, 'Talman')]
+SUB_OFFICE_TYPES: list[tuple[int, int, str]] = [(0, 0, 'unknown'), (1, 1, 'ledamot'), (2, 2, 'statsråd')]
+
+
+@dataclass
+class SyntheticCorpusSpec:
+    n_protocols: int = 100
+    speeches_per_protocol: int = 20
+    utterances_per_speech: int = 2
+    tokens_per_utterance: int = 60
+    vocabulary_size: int = 20000
+    n_persons: int = 300
+    start_year: int = 1920
+    end_year: int = 2020
+    seed: int = 42
+
+    @property
+    def n_speeches(self) -> int:
+        return self.n_protocols * self.speeches_per_protocol
+
+
+SIZES: dict[str, SyntheticCorpusSpec] = {
+    'tiny': SyntheticCorpusSpec(n_protocols=10, speeches_per_protocol=5, vocabulary_size=2000, n_persons=30),
+    'small': SyntheticCorpusSpec(),
+    'medium': SyntheticCorpusSpec(n_protocols=1000, vocabulary_size=100000, n_persons=2000),
+    'large': SyntheticCorpusSpec(n_protocols=5000, speeches_per_protocol=30, vocabulary_size=500000, n_persons=5000),
+}
+
+
+@dataclass
+class SyntheticCorpus:
+    folder: str
+    spec: SyntheticCorpusSpec
+    metadata_filename: str
+    dtm_folder: str
+    dtm_tag: str
+    tagged_corpus_folder: str
+    registry_dir: str | None
+    corpus_name: str | None
+    cwb_data_dir: str | None
+
+    @property
+    def has_cwb(self) -> bool:
+        return self.registry_dir is not None
+
+    def config(self, base: dict[str, Any]) -> dict[str, Any]:
+        """Returns `base` configuration with data paths pointing at the synthetic corpus"""
+        return base | {
+            'metadata': base.get('metadata', {}) | {'filename': self.metadata_filename},
+            'dtm': base.get('dtm', {}) | {'folder': self.dtm_folder, 'tag': self.dtm_tag},
+            'vrt': base.get('vrt', {}) | {'folder': self.tagged_corpus_folder},
+            'cwb': base.get('cwb', {})
+            | {
+                'registry_dir': self.registry_dir or jj(self.folder, 'registry'),
+                'corpus_name': self.corpus_name or 'SYNTHETIC',
+                'data_dir': self.cwb_data_dir or jj(self.folder, 'ccc'),
+            },
+        }
+
+
+def create_vocabulary(size: int, rng: np.random.Generator) -> list[str]:
+    vocabulary: list[str] = list(COMMON_WORDS)
+    seen: set[str] = set(vocabulary)
+    while len(vocabulary) < size:
+        word: str = ''.join(rng.choice(SYLLABLES, size=rng.integers(2, 5)))
+        if word not in seen:
+            seen.add(word)
+            vocabulary.append(word)
+    return vocabulary
+
+
+def create_persons(spec: SyntheticCorpusSpec, rng: np.random.Generator) -> pd.DataFrame:
+    n: int = spec.n_persons
+    year_of_birth: np.ndarray = rng.integers(spec.start_year - 70, spec.end_year - 25, size=n)
+    return pd.DataFrame(
+        {
+            'person_id': [f'i-{hashlib.md5(str(i).encode()).hexdigest()[:16]}' for i in range(n)],
+            'pid': np.arange(n),
+            'wiki_id': [f'Q{1000000 + i}' for i in range(n)],
+            'name': [f'Person {i}' for i in range(n)],
+            'gender_id': rng.integers(1, len(GENDERS), size=n),
+            'party_id': rng.integers(1, len(PARTIES), size=n),
+            'year_of_birth': year_of_birth,
+            'year_of_death': np.where(year_of_birth + 80 < 2024, year_of_birth + 80, 0),
+        }
+    )
+
+
+def create_metadata_database(filename: str, persons: pd.DataFrame, speaker_note_ids: list[str]) -> None:
+    tables: dict[str, pd.DataFrame] = {
+        'chamber': pd.DataFrame(CHAMBERS, columns=['chamber_id', 'chamber', 'chamber_abbrev']),
+        'gender': pd.DataFrame(GENDERS, columns=['gender_id', 'gender', 'gender_abbrev']),
+        'government': pd.DataFrame({'government_id': [1], 'government': ['Synthetic government']}),
+        'office_type': pd.DataFrame(OFFICE_TYPES, columns=['office_type_id', 'office']),
+        'party': pd.DataFrame(PARTIES, columns=['party_id', 'party', 'party_abbrev', 'party_color']).assign(
+            sort_order=lambda df: df.party_id
+        ),
+        'sub_office_type': pd.DataFrame(
+            SUB_OFFICE_TYPES, columns=['sub_office_type_id', 'office_type_id', 'identifier']
+        ).assign(sub_office_type=lambda df: df.identifier),
+        'persons_of_interest': persons,
+        'person_party': pd.DataFrame(
+            {
+                'person_party_id': np.arange(len(persons)),
+                'person_id': persons.person_id,
+                'party_id': persons.party_id,
+            }
+        ),
+        'speaker_notes': pd.DataFrame(
+            {'speaker_note_id': speaker_note_ids, 'speaker_note': [f'Note {x}' for x in speaker_note_ids]}
+        ),
+    }
+    if os.path.isfile(filename):
+        os.unlink(filename)
+    with sqlite3.connect(filename) as db:
+        for name, table in tables.items():
+            table.to_sql(name, db, index=False)
+
+
+def protocol_name(year: int, chamber_abbrev: str, nr: int) -> str:
+    return f"prot-{year}--{chamber_abbrev}--{nr:03d}"
+
+
+def create_speech_index(spec: SyntheticCorpusSpec, persons: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    n_speeches: int = spec.n_speeches
+    years: np.ndarray = np.sort(rng.integers(spec.start_year, spec.end_year + 1, size=spec.n_protocols))
+    chambers: np.ndarray = rng.choice(['fk', 'ak'], size=spec.n_protocols)
+    protocols: list[str] = [protocol_name(y, c, i + 1) for i, (y, c) in enumerate(zip(years, chambers))]
+
+    protocol_idx: np.ndarray = np.repeat(np.arange(spec.n_protocols), spec.speeches_per_protocol)
+    speech_nr: np.ndarray = np.tile(np.arange(1, spec.speeches_per_protocol + 1), spec.n_protocols)
+    person_idx: np.ndarray = rng.integers(0, len(persons), size=n_speeches)
+    n_tokens: int = spec.utterances_per_speech * spec.tokens_per_utterance
+
+    return pd.DataFrame(
+        {
+            'document_id': np.arange(n_speeches),
+            'document_name': [f"{protocols[p]}_{s:03d}" for p, s in zip(protocol_idx, speech_nr)],
+            'filename': [f"{protocols[p]}_{s:03d}.csv" for p, s in zip(protocol_idx, speech_nr)],
+            'speech_id': [f"i-{hashlib.md5(str(i).encode()).hexdigest()[:16]}-1" for i in range(n_speeches)],
+            'speech_index': speech_nr,
+            'speech_name': [f"{protocols[p]}_{s:03d}" for p, s in zip(protocol_idx, speech_nr)],
+            'year': years[protocol_idx],
+            'chamber_abbrev': chambers[protocol_idx],
+            'who': persons.person_id.values[person_idx],
+            'gender_id': persons.gender_id.values[person_idx],
+            'party_id': persons.party_id.values[person_idx],
+            'speaker_note_id': [f"n-{i}" for i in range(n_speeches)],
+            'office_type_id': rng.integers(1, len(OFFICE_TYPES), size=n_speeches),
+            'sub_office_type_id': rng.integers(1, len(SUB_OFFICE_TYPES), size=n_speeches),
+            'n_utterances': spec.utterances_per_speech,
+            'n_tokens': n_tokens,
+            'n_raw_tokens': n_tokens,
+            'page_number': 1 + speech_nr // 4,
+        }
+    )
+
+
+def create_token_ids(spec: SyntheticCorpusSpec, rng: np.random.Generator) -> np.ndarray:
+    """Returns Zipf distributed token ids, one row per utterance"""
+    n_utterances: int = spec.n_speeches * spec.utterances_per_speech
+    ids: np.ndarray = rng.zipf(1.3, size=(n_utterances, spec.tokens_per_utterance)) - 1
+    return np.where(ids < spec.vocabulary_size, ids, rng.integers(0, spec.vocabulary_size, size=ids.shape))
+
+
+def create_dtm(
+    spec: SyntheticCorpusSpec, token_ids: np.ndarray, vocabulary: list[str], speech_index: pd.DataFrame
+) -> VectorizedCorpus:
+    rows: np.ndarray = np.repeat(np.arange(spec.n_speeches), spec.utterances_per_speech * spec.tokens_per_utterance)
+    bag_term_matrix: scipy.sparse.csr_matrix = scipy.sparse.csr_matrix(
+        (np.ones(rows.size, dtype=np.int32), (rows, token_ids.ravel())),
+        shape=(spec.n_speeches, spec.vocabulary_size),
+    )
+    bag_term_matrix.sum_duplicates()
+    return VectorizedCorpus(
+        bag_term_matrix=bag_term_matrix,
+        token2id={w: i for i, w in enumerate(vocabulary)},
+        document_index=speech_index,
+    )
+
+
+def create_tagged_frames(
+    folder: str, spec: SyntheticCorpusSpec, token_ids: np.ndarray, vocabulary: list[str], speech_index: pd.DataFrame
+) -> None:
+    words: np.ndarray = np.array(vocabulary, dtype=object)
+    u: int = 0
+    for protocol, speeches in speech_index.groupby(speech_index.document_name.str.split('_').str[0], sort=False):
+        utterances: list[dict] = []
+        for speech in speeches.itertuples():
+            for k in range(spec.utterances_per_speech):
+                text: str = ' '.join(words[token_ids[u]])
+                utterances.append(
+                    {
+                        'u_id': speech.speech_id if k == 0 else f"{speech.speech_id[:-2]}-{k + 1}",
+                        'who': speech.who,
+                        'speaker_note_id': speech.speaker_note_id,
+                        'prev_id': None,
+                        'next_id': None,
+                        'paragraphs': [text],
+                        'annotation': '',
+                        'page_number': int(speech.page_number),
+                        'num_tokens': spec.tokens_per_utterance,
+                        'num_words': spec.tokens_per_utterance,
+                    }
+                )
+                u += 1
+        year: str = protocol.split('-')[1]
+        os.makedirs(jj(folder, year), exist_ok=True)
+        with zipfile.ZipFile(jj(folder, year, f"{protocol}.zip"), 'w', compression=zipfile.ZIP_DEFLATED) as fp:
+            fp.writestr(f"{protocol}.json", json.dumps(utterances))
+            fp.writestr("metadata.json", json.dumps({'name': protocol, 'date': f"{year}-01-01"}))
+
+
+def has_cwb_tools() -> bool:
+    return shutil.which('cwb-encode') is not None and shutil.which('cwb-makeall') is not None
+
+
+def create_cwb_corpus(
+    folder: str, corpus_name: str, token_ids: np.ndarray, vocabulary: list[str], speech_index: pd.DataFrame
+) -> str:
+    """Encodes speeches as a CWB corpus, returns registry folder."""
+    registry_dir, data_dir = jj(folder, 'registry'), jj(folder, 'cwb', corpus_name.lower())
+    os.makedirs(registry_dir, exist_ok=True)
+    os.makedirs(data_dir, exist_ok=True)
+
+    tokens_per_speech: int = token_ids.shape[1] * (token_ids.shape[0] // len(speech_index))
+    speech_tokens: np.ndarray = token_ids.reshape(len(speech_index), tokens_per_speech)
+    vrt_filename: str = jj(folder, f"{corpus_name.lower()}.vrt")
+    with open(vrt_filename, 'w', encoding='utf-8') as fp:
+        for year, speeches in speech_index.groupby('year', sort=True):
+            fp.write(f'<year year="{year}">\n')
+            for speech in speeches.itertuples():
+                fp.write(
+                    f'<protocol title="{speech.document_name.split("_")[0]}" chamber="{speech.chamber_abbrev}">\n'
+                    f'<speech id="{speech.speech_id}" title="{speech.document_name}" who="{speech.who}"'
+                    f' party_id="{speech.party_id}" gender_id="{speech.gender_id}" date="{year}-01-01"'
+                    f' office_type_id="{speech.office_type_id}" sub_office_type_id="{speech.sub_office_type_id}">\n'
+                )
+                for token_id in speech_tokens[speech.Index]:
+                    word: str = vocabulary[token_id]
+                    fp.write(f"{word}\t{word}\tNN\n")
+                fp.write('</speech>\n</protocol>\n')
+            fp.write('</year>\n')
+
+    attributes: list[str] = [
+        '-S',
+        'year:0+year',
+        '-S',
+        'protocol:0+title+chamber',
+        '-S',
+        'speech:0+id+title+who+party_id+gender_id+date+office_type_id+sub_office_type_id',
+    ]
+    subprocess.run(
+        ['cwb-encode', '-c', 'utf8', '-x', '-s', '-B', '-d', data_dir, '-f', vrt_filename]
+        + ['-R', jj(registry_dir, corpus_name.lower()), '-P', 'lemma', '-P', 'pos']
+        + attributes,
+        check=True,
+    )
+    subprocess.run(['cwb-makeall', '-r', registry_dir, '-V', corpus_name.upper()], check=True, capture_output=True)
+    return registry_dir
+
+
+def build_synthetic_corpus(folder: str, spec: SyntheticCorpusSpec, *, with_cwb: bool = None) -> SyntheticCorpus:
+    """Builds (or reuses a previously built) synthetic corpus in `folder`."""
+    os.makedirs(folder, exist_ok=True)
+    with_cwb = has_cwb_tools() if with_cwb is None else with_cwb
+    corpus_name: str = 'SYNTHETIC'
+    corpus: SyntheticCorpus = SyntheticCorpus(
+        folder=folder,
+        spec=spec,
+        metadata_filename=jj(folder, 'metadata', 'riksprot_metadata.db'),
+        dtm_folder=jj(folder, 'dtm'),
+        dtm_tag='text',
+        tagged_corpus_folder=jj(folder, 'tagged_frames'),
+        registry_dir=jj(folder, 'registry') if with_cwb else None,
+        corpus_name=corpus_name if with_cwb else None,
+        cwb_data_dir=jj(folder, 'ccc') if with_cwb else None,
+    )
+
+    spec_filename: str = jj(folder, 'spec.json')
+    if os.path.isfile(spec_filename):
+        with open(spec_filename, encoding='utf-8') as fp:
+            if json.load(fp) == asdict(spec) | {'cwb': with_cwb}:
+                return corpus
+
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    for sub_folder in ['metadata', 'dtm', 'tagged_frames']:
+        os.makedirs(jj(folder, sub_folder), exist_ok=True)
+
+    vocabulary: list[str] = create_vocabulary(spec.vocabulary_size, rng)
+    persons: pd.DataFrame = create_persons(spec, rng)
+    speech_index: pd.DataFrame = create_speech_index(spec, persons, rng)
+    token_ids: np.ndarray = create_token_ids(spec, rng)
+
+    create_metadata_database(corpus.metadata_filename, persons, speech_index.speaker_note_id.tolist())
+    create_dtm(spec, token_ids, vocabulary, speech_index).dump(tag=corpus.dtm_tag, folder=corpus.dtm_folder)
+    create_tagged_frames(corpus.tagged_corpus_folder, spec, token_ids, vocabulary, speech_index)
+
+    if with_cwb:
+        create_cwb_corpus(folder, corpus_name, token_ids, vocabulary, speech_index)
+
+    with open(spec_filename, 'w', encoding='utf-8') as fp:
+        json.dump(asdict(spec) | {'cwb': with_cwb}, fp)
+
+    return corpus
@@ -0,0 +1,125 @@
+"""Benchmarks of the core functions behind each endpoint (without HTTP and serialization overhead)."""
+
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from api_swedeb.api.utils.dependencies import get_cwb_corpus
+from api_swedeb.core.kwic.simple import kwic_with_decode
+from api_swedeb.core.load import load_dtm_corpus, load_speech_index
+from api_swedeb.core.n_grams import n_grams
+from api_swedeb.core.speech_index import get_speeches_by_opts, get_speeches_by_words
+from api_swedeb.core.word_trends import compute_word_trends
+from benchmarks.synthetic import COMMON_WORDS, SyntheticCorpus
+from penelope.common.word_trends import TabularCompiler
+from penelope.corpus import VectorizedCorpus
+
+# pylint: disable=redefined-outer-name,unused-argument
+
+
+@pytest.fixture(scope='module')
+def cwb_corpus(synthetic_corpus: SyntheticCorpus) -> Any:
+    if not synthetic_corpus.has_cwb:
+        pytest.skip("CWB tools (cwb-encode, cwb-makeall) not installed")
+    return get_cwb_corpus()
+
+
+def test_load_dtm_corpus(benchmark, synthetic_corpus: SyntheticCorpus):
+    benchmark(
+        'load_dtm_corpus',
+        lambda: load_dtm_corpus(folder=synthetic_corpus.dtm_folder, tag=synthetic_corpus.dtm_tag),
+        rounds=3,
+    )
+
+
+def test_load_speech_index(benchmark, synthetic_corpus: SyntheticCorpus):
+    benchmark(
+        'load_speech_index',
+        lambda: load_speech_index(folder=synthetic_corpus.dtm_folder, tag=synthetic_corpus.dtm_tag),
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize(
+    'name,filter_opts',
+    [
+        ('word_trends', {}),
+        ('word_trends_by_party', {'party_id': [1, 2]}),
+        ('word_trends_by_gender_years', {'gender_id': [1, 2], 'year': (1950, 2000)}),
+    ],
+)
+def test_compute_word_trends(benchmark, api_corpus, name: str, filter_opts: dict):
+    benchmark(
+        name,
+        lambda: compute_word_trends(
+            api_corpus.vectorized_corpus, api_corpus.person_codecs, COMMON_WORDS[:3], dict(filter_opts)
+        ),
+    )
+
+
+@pytest.fixture(scope='module')
+def yearly_corpus(api_corpus) -> VectorizedCorpus:
+    return api_corpus.vectorized_corpus.group_by_year(fill_gaps=False)
+
+
+@pytest.mark.parametrize('n_terms', [1, 10, 100, 1000])
+def test_tabular_compile(benchmark, yearly_corpus: VectorizedCorpus, n_terms: int):
+    indices: list[int] = list(range(min(n_terms, yearly_corpus.n_tokens)))
+    benchmark(
+        f'tabular_compile_{n_terms}',
+        lambda: TabularCompiler().compile(
+            corpus=yearly_corpus, temporal_key='year', pivot_keys_id_names=[], indices=indices
+        ),
+    )
+
+
+def test_get_speeches_by_opts(benchmark, api_corpus):
+    benchmark('speeches_by_opts', lambda: get_speeches_by_opts(api_corpus.document_index, {'year': (1950, 2000)}))
+
+
+def test_get_speeches_by_words(benchmark, api_corpus):
+    benchmark(
+        'speeches_by_words',
+        lambda: get_speeches_by_words(api_corpus.vectorized_corpus, terms=COMMON_WORDS[:2], filter_opts={}),
+    )
+
+
+def test_decode_speech_index(benchmark, api_corpus):
+    speeches: pd.DataFrame = get_speeches_by_opts(api_corpus.document_index, {})
+    benchmark('decode_speech_index', lambda: api_corpus.person_codecs.decode_speech_index(speeches.copy()))
+
+
+def test_get_speakers(benchmark, api_corpus):
+    benchmark('get_speakers', lambda: api_corpus.get_speakers(selections={'party_id': [1]}))
+
+
+def test_get_word_hits(benchmark, api_corpus):
+    benchmark('word_hits', lambda: api_corpus.get_word_hits('sk*', n_hits=10))
+
+
+def test_get_speech(benchmark, api_corpus):
+    document_names: list[str] = api_corpus.document_index.document_name.sample(20, random_state=1).tolist()
+    benchmark('get_speech', lambda: [api_corpus.get_speech(name) for name in document_names])
+
+
+def test_kwic(benchmark, api_corpus, cwb_corpus):
+    opts: list[dict] = [{'prefix': 'a', 'target': 'lemma', 'value': COMMON_WORDS[0], 'criterias': []}]
+    benchmark(
+        'kwic_with_decode',
+        lambda: kwic_with_decode(
+            cwb_corpus,
+            opts,
+            speech_index=api_corpus.document_index,
+            codecs=api_corpus.person_codecs,
+            words_before=2,
+            words_after=2,
+            p_show='word',
+            cut_off=200000,
+        ),
+    )
+
+
+def test_n_grams(benchmark, cwb_corpus):
+    opts: list[dict] = [{'prefix': 'a', 'target': 'word', 'value': COMMON_WORDS[1], 'criterias': []}]
+    benchmark('n_grams', lambda: n_grams(cwb_corpus, opts, n=3, p_show='word', threshold=2, mode='sliding'))
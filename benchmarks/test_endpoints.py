@@ -0,0 +1,101 @@
+"""Benchmarks of every public endpoint, called through the FastAPI test client."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from fastapi import status
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from api_swedeb.api import health_router, metadata_router, tool_router
+from benchmarks.synthetic import COMMON_WORDS, SyntheticCorpus
+
+# pylint: disable=redefined-outer-name,unused-argument
+
+
+@dataclass
+class Endpoint:
+    route: str
+    url: str
+    method: str = 'GET'
+    body: Any = None
+    requires_cwb: bool = False
+    name: str = None
+    speech_ids: int = 0
+
+    @property
+    def id(self) -> str:
+        return self.name or self.url.removeprefix('/v1/').lstrip('/').split('?')[0].rstrip('/').replace('/', '_')
+
+
+WORD: str = COMMON_WORDS[0]
+
+ENDPOINTS: list[Endpoint] = [
+    Endpoint('/v1/metadata/start_year', '/v1/metadata/start_year'),
+    Endpoint('/v1/metadata/end_year', '/v1/metadata/end_year'),
+    Endpoint('/v1/metadata/parties', '/v1/metadata/parties'),
+    Endpoint('/v1/metadata/genders', '/v1/metadata/genders'),
+    Endpoint('/v1/metadata/chambers', '/v1/metadata/chambers'),
+    Endpoint('/v1/metadata/office_types', '/v1/metadata/office_types'),
+    Endpoint('/v1/metadata/sub_office_types', '/v1/metadata/sub_office_types'),
+    Endpoint('/v1/metadata/speakers', '/v1/metadata/speakers'),
+    Endpoint('/v1/metadata/speakers', '/v1/metadata/speakers?party_id=1', name='metadata_speakers_party'),
+    Endpoint('/v1/tools/kwic/{search}', f'/v1/tools/kwic/{WORD}', requires_cwb=True),
+    Endpoint(
+        '/v1/tools/kwic/{search}', f'/v1/tools/kwic/{WORD}?limit=100&offset=0', requires_cwb=True, name='kwic_page'
+    ),
+    Endpoint('/v1/tools/word_trends/{search}', f'/v1/tools/word_trends/{WORD}'),
+    Endpoint(
+        '/v1/tools/word_trends/{search}',
+        f'/v1/tools/word_trends/{WORD}?party_id=1&party_id=2',
+        name='word_trends_party',
+    ),
+    Endpoint('/v1/tools/word_trend_speeches/{search}', f'/v1/tools/word_trend_speeches/{WORD}'),
+    Endpoint('/v1/tools/word_trend_hits/{search}', '/v1/tools/word_trend_hits/sk*'),
+    Endpoint('/v1/tools/ngrams/{search}', f'/v1/tools/ngrams/{WORD}', requires_cwb=True),
+    Endpoint('/v1/tools/speeches', '/v1/tools/speeches'),
+    Endpoint('/v1/tools/speeches', '/v1/tools/speeches?limit=100&offset=0', name='speeches_page'),
+    Endpoint('/v1/tools/speeches', '/v1/tools/speeches?format=ndjson', name='speeches_ndjson'),
+    Endpoint('/v1/tools/speeches/{speech_id}', '/v1/tools/speeches/{speech_id}', speech_ids=1, name='speech_text'),
+    Endpoint('/v1/tools/speech_download/', '/v1/tools/speech_download/', method='POST', speech_ids=50),
+    Endpoint('/v1/tools/speech_texts', '/v1/tools/speech_texts', method='POST', speech_ids=50),
+    Endpoint('/v1/tools/topics', '/v1/tools/topics'),
+    Endpoint('/health/live', '/health/live'),
+    Endpoint('/health/ready', '/health/ready'),
+]
+
+
+def public_routes() -> set[str]:
+    return {
+        route.path
+        for router in (tool_router.router, metadata_router.router, health_router.router)
+        for route in router.routes
+        if isinstance(route, APIRoute)
+    }
+
+
+def test_all_endpoints_are_benchmarked():
+    assert public_routes() <= {e.route for e in ENDPOINTS}
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS, ids=lambda e: e.id)
+def test_endpoint(benchmark, fastapi_client: TestClient, api_corpus, synthetic_corpus: SyntheticCorpus, endpoint):
+    if endpoint.requires_cwb and not synthetic_corpus.has_cwb:
+        pytest.skip("CWB tools (cwb-encode, cwb-makeall) not installed")
+
+    url: str = endpoint.url
+    body: Any = endpoint.body
+    if endpoint.speech_ids:
+        speech_ids: list[str] = api_corpus.document_index.speech_id.head(endpoint.speech_ids).tolist()
+        if endpoint.method == 'POST':
+            body = speech_ids
+        else:
+            url = url.format(speech_id=speech_ids[0])
+
+    def call() -> None:
+        response = fastapi_client.request(endpoint.method, url, json=body)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        _ = response.content
+
+    benchmark(endpoint.id, call)
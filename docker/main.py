@@ -6,7 +6,10 @@ from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from api_swedeb.api import metadata_router, tool_router
+from api_swedeb.api import health_router, metadata_router, metrics_router, tool_router
+from api_swedeb.api.utils.execution import get_execution_pool
+from api_swedeb.api.utils.server_timing import ServerTimingMiddleware
+from api_swedeb.api.utils.warmup import start_warm_up
 from api_swedeb.core.configuration import ConfigStore
 
 ConfigStore.configure_context(source=os.environ.get("SWEDEB_CONFIG_PATH", "config/config.yml"))
@@ -18,7 +21,9 @@ shared_data: dict = multiprocessing.Manager().dict()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     shared_data["tools-payload"] = None
+    start_warm_up()
     yield
+    get_execution_pool().shutdown(wait=False)
     shared_data.clear()
 
 app = FastAPI(lifespan=lifespan)
@@ -31,6 +36,9 @@ app.add_middleware(
     allow_headers=[],
     allow_credentials=True,
 )
+app.add_middleware(ServerTimingMiddleware)
 
 app.include_router(tool_router.router)
 app.include_router(metadata_router.router)
+app.include_router(health_router.router)
+app.include_router(metrics_router.router)
@@ -1,12 +1,24 @@
 from fastapi import FastAPI
+from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
-from api_swedeb.api import metadata_router, tool_router
+from api_swedeb.api import health_router, metadata_router, metrics_router, tool_router
+from api_swedeb.api.utils.execution import get_execution_pool
+from api_swedeb.api.utils.server_timing import ServerTimingMiddleware
+from api_swedeb.api.utils.warmup import start_warm_up
 from api_swedeb.core.configuration import ConfigStore, ConfigValue
 
 ConfigStore.configure_context(source='config/config.yml')
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    start_warm_up()
+    yield
+    get_execution_pool().shutdown(wait=False)
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,6 +27,9 @@ app.add_middleware(
     allow_headers=[],
     allow_credentials=True,
 )
+app.add_middleware(ServerTimingMiddleware)
 
 app.include_router(tool_router.router)
 app.include_router(metadata_router.router)
+app.include_router(health_router.router)
+app.include_router(metrics_router.router)
@@ -2,6 +2,7 @@ import abc
 from dataclasses import dataclass, field
 from typing import Sequence, overload
 
+import numpy as np
 import pandas as pd
 
 from api_swedeb.core.utility import deep_clone
@@ -27,6 +28,8 @@ class TrendsComputeOpts:
     words: list[str] = None
     descending: bool = False
     keyness_source: pk.KeynessMetricSource = pk.KeynessMetricSource.Full
+    # Group only the DTM columns of terms matching `words` (cost scales with number of terms, not vocabulary size)
+    column_slice: bool = False
 
     @property
     def clone(self) -> "TrendsComputeOpts":
@@ -44,6 +47,11 @@ class TrendsComputeOpts:
             or self.filter_opts != other.filter_opts
             or self.fill_gaps != other.fill_gaps
             or self.keyness_source != other.keyness_source
+            or self.column_slice != other.column_slice
+        ):
+            return True
+        if self.column_slice and (
+            self.words != other.words or self.top_count != other.top_count or self.descending != other.descending
         ):
             return True
         return False
@@ -57,15 +65,17 @@ class TabularCompiler:
     def compile(
         self, *, corpus: pc.VectorizedCorpus, temporal_key: str, pivot_keys_id_names: list[str], indices: Sequence[int]
     ) -> pd.DataFrame:
-        """Extracts trend vectors for tokens ´indices` and returns a pd.DataFrame."""
+        """Extracts trend vectors for tokens ´indices` and returns a pd.DataFrame.
+
+        All columns are sliced in one operation, see `VectorizedCorpus.get_columns`."""
+
+        token_ids: list[int] = list(dict.fromkeys(indices))
+        vectors: np.ndarray = corpus.get_columns(token_ids)
 
         data: dict = {
             **{temporal_key: corpus.document_index[temporal_key]},
             **{key: corpus.document_index[key] for key in pivot_keys_id_names},
-            **{
-                corpus.id2token[token_id]: corpus.bag_term_matrix.getcol(token_id).toarray().ravel()
-                for token_id in indices
-            },
+            **{corpus.id2token[token_id]: vectors[:, i] for i, token_id in enumerate(token_ids)},
         }
 
         return pd.DataFrame(data=data)
@@ -241,15 +251,25 @@ class TrendsService(TrendsServiceBase):
     def __init__(self, corpus: pc.VectorizedCorpus = None, n_top: int = 100000):
         super().__init__(corpus=corpus, n_top=n_top)
 
+    def _source_corpus(self, opts: TrendsComputeOpts) -> pc.VectorizedCorpus:  # pylint: disable=unused-argument
+        """Returns the corpus to group, subclasses may return a (smaller) pre-aggregated corpus"""
+        return self.corpus
+
+    def _column_indices(self, opts: TrendsComputeOpts) -> list[int]:
+        """Returns indices of terms matching `opts.words` (source corpora share the vocabulary of `corpus`)"""
+        return list(self.corpus.find_matching_words_indices(opts.words, opts.top_count, descending=opts.descending))
+
     def _transform_corpus(self, opts: TrendsComputeOpts) -> pc.VectorizedCorpus:
+        source: pc.VectorizedCorpus = self._source_corpus(opts)
         corpus: pc.VectorizedCorpus = (
-            self.corpus.tf_idf()
+            source.tf_idf()
             if opts.keyness == pk.KeynessMetric.TF_IDF
-            else (
-                self.corpus.normalize_by_raw_counts() if opts.keyness == pk.KeynessMetric.TF_normalized else self.corpus
-            )
+            else (source.normalize_by_raw_counts() if opts.keyness == pk.KeynessMetric.TF_normalized else source)
         )
 
+        if opts.column_slice and opts.words:
+            corpus = corpus.slice_by_indices(self._column_indices(opts))
+
         corpus = corpus.group_by_pivot_keys(
             temporal_key=opts.temporal_key,
             pivot_keys=list(opts.pivot_keys_id_names),
@@ -3,6 +3,8 @@ from __future__ import annotations
 import contextlib
 import fnmatch
 import re
+import sys
+import threading
 import warnings
 from typing import Any, Callable, Iterable, Optional, Sequence, Set, Tuple, Union
 
@@ -22,6 +24,7 @@ from .interface import IVectorizedCorpus, VectorizedCorpusError
 from .slice import SliceMixIn
 from .stats import StatsMixIn
 from .store import StoreMixIn
+from .vocabulary import VocabularyIndex
 
 try:
     import sklearn.preprocessing
@@ -41,6 +44,7 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
         token2id: dict[str, int],
         document_index: DocumentIndex,
         overridden_term_frequency: Optional[dict[int, int]] = None,
+        postings: Optional[scipy.sparse.csc_matrix] = None,
         **kwargs,
     ):
         """Class that encapsulates a bag-of-word matrix
@@ -50,6 +54,7 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
             token2id (dict[str, int]): Token to token/column index translation
             document_index (DocumentIndex): Corpus document/row metadata
             overridden_term_frequency (np.ndarrys, optional): Supplied if source TF
+            postings (scipy.sparse.csc_matrix, optional): CSC copy of `bag_term_matrix` (computed if needed)
         """
         self._class_name: str = "penelope.corpus.dtm.corpus.VectorizedCorpus"
 
@@ -60,6 +65,7 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
             bag_term_matrix = bag_term_matrix.tocsr()
 
         self._bag_term_matrix: scipy.sparse.csr_matrix = bag_term_matrix
+        self._derived_stats: dict[str, Any] = {}
         self._token2id: dict[str, int] = (
             token2id
             if isinstance(token2id, (dict, type(None)))
@@ -68,6 +74,11 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
         self._id2token: Optional[dict[int, str]] = None
         self._document_index: DocumentIndex = self._ingest_document_index(document_index=document_index)
         self._overridden_term_frequency: Optional[np.ndarray] = overridden_term_frequency
+        self._postings: Optional[scipy.sparse.csc_matrix] = postings
+        self._vocabulary_index: Optional[VocabularyIndex] = None
+        self.source: Optional[tuple[str, str]] = None  # (folder, tag) of the stored DTM the corpus was loaded from
+        self._postings_lock: threading.Lock = threading.Lock()
+        self._vocabulary_index_lock: threading.Lock = threading.Lock()
         self._payload: dict = dict(**kwargs)
 
     def _ingest_document_index(self, document_index: DocumentIndex):
@@ -100,13 +111,12 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
     @property
     def id2token(self) -> dict[int, str]:
         if self._id2token is None and self.token2id is not None:
-            self._id2token = {i: t for t, i in self.token2id.items()}
+            self._id2token = getattr(self.token2id, 'id2token', None) or {i: t for t, i in self.token2id.items()}
         return self._id2token
 
     @property
     def vocabulary(self) -> list[str]:
-        vocab = [self.id2token[i] for i in range(0, self.data.shape[1])]
-        return vocab
+        return self._derived('vocabulary', lambda: [self.id2token[i] for i in range(0, self.data.shape[1])])
 
     def word_exists(self, word: str, ignore_case: bool = True) -> bool:
         return self.token2id.get(word.lower() if ignore_case else word) is not None
@@ -126,7 +136,7 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
     @property
     def term_frequency(self) -> np.ndarray:
         """Global TF (absolute term count)"""
-        return self._bag_term_matrix.sum(axis=0).A1.ravel()
+        return self._derived('term_frequency', lambda: self._bag_term_matrix.sum(axis=0).A1.ravel())
 
     @property
     def overridden_term_frequency(self) -> np.ndarray:
@@ -146,7 +156,42 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
     @property
     def document_token_counts(self) -> np.ndarray:
         """Number of tokens per document"""
-        return self._bag_term_matrix.sum(axis=1).A1
+        return self._derived('document_token_counts', lambda: self._bag_term_matrix.sum(axis=1).A1)
+
+    @property
+    def document_frequency(self) -> np.ndarray:
+        """Global DF (number of documents where each term occurs)"""
+        return self._derived('document_frequency', self._compute_document_frequency)
+
+    def _compute_document_frequency(self) -> np.ndarray:
+        dtm: Any = self._bag_term_matrix
+        if not scipy.sparse.issparse(dtm):
+            return (np.asarray(dtm) != 0).sum(axis=0)
+        return np.bincount(dtm.indices[dtm.data != 0], minlength=dtm.shape[1])
+
+    def _derived(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Returns statistic `name` derived from the BoW matrix, computed on first access"""
+        value: Any = self._derived_stats.get(name)
+        if value is None:
+            value = self._derived_stats[name] = compute()
+        return value
+
+    def _reset_derived(self) -> None:
+        """Drops data derived from the BoW matrix and vocabulary, must be called when any of these is replaced"""
+        self._derived_stats = {}
+        self._postings = None
+        self._vocabulary_index = None
+        self.source = None
+
+    def derived_stats_info(self) -> dict[str, int]:
+        """Returns bytes used by each derived statistic (and posting lists) currently cached on the corpus"""
+        info: dict[str, int] = {
+            name: value.nbytes if isinstance(value, np.ndarray) else sys.getsizeof(value)
+            for name, value in self._derived_stats.items()
+        }
+        if self._postings is not None:
+            info['postings'] = self._postings.data.nbytes + self._postings.indices.nbytes + self._postings.indptr.nbytes
+        return info
 
     @property
     def data(self) -> scipy.sparse.csr_matrix:
@@ -201,6 +246,7 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
             dtm = np.asarray(dtm)
 
         self._bag_term_matrix = dtm
+        self._reset_derived()
 
         return self
 
@@ -216,8 +262,67 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
         np.array
             BoW matrix column values found in column `token2id[word]`
         """
+        if self._postings is not None:
+            document_ids, counts = self.get_word_postings(word)
+            vector: np.ndarray = np.zeros(self.n_docs, dtype=counts.dtype)
+            vector[document_ids] = counts
+            return vector
         return self._bag_term_matrix[:, self.token2id[word]].todense().A1  # x.A1 == np.asarray(x).ravel()
 
+    @property
+    def has_postings(self) -> bool:
+        """True if posting lists are available (stored with the DTM, or built by accessing `postings`)"""
+        return self._postings is not None
+
+    @property
+    def postings(self) -> scipy.sparse.csc_matrix:
+        """CSC copy of BoW matrix, i.e. for each word the ids of documents where the word occurs.
+
+        Built (as an in-memory copy of the full matrix) on first access unless stored with the DTM."""
+        if self._postings is None:
+            with self._postings_lock:
+                if self._postings is None:
+                    postings: scipy.sparse.csc_matrix = self._bag_term_matrix.tocsc()
+                    postings.sort_indices()
+                    self._postings = postings
+        return self._postings
+
+    @property
+    def vocabulary_index(self) -> VocabularyIndex:
+        """Index for wildcard and regular expression lookups in the vocabulary (built on first access)"""
+        if self._vocabulary_index is None:
+            with self._vocabulary_index_lock:
+                if self._vocabulary_index is None:
+                    self._vocabulary_index = VocabularyIndex.create(self)
+        return self._vocabulary_index
+
+    def get_columns(self, indices: Sequence[int]) -> np.ndarray:
+        """Returns BoW matrix columns `indices` as a dense (n_docs, len(indices)) array.
+
+        Sliced from the posting lists if available, otherwise directly from the (CSR) BoW matrix, i.e. the
+        matrix is never converted to CSC just to extract a few columns."""
+        if len(indices) == 0:
+            return np.zeros((self.n_docs, 0), dtype=self._bag_term_matrix.dtype)
+        matrix: scipy.sparse.spmatrix = self._postings if self._postings is not None else self._bag_term_matrix
+        return matrix[:, indices].toarray()
+
+    def get_word_postings(self, word: str) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (sorted) ids of documents where `word` occurs, and the word's count in each document.
+
+        Read from the posting lists if available, otherwise from the word's column in the BoW matrix."""
+        token_id: int = self.token2id[word]
+        if self._postings is not None:
+            postings: scipy.sparse.csc_matrix = self._postings
+            start, end = postings.indptr[token_id], postings.indptr[token_id + 1]
+            document_ids: np.ndarray = np.asarray(postings.indices[start:end])
+            counts: np.ndarray = np.asarray(postings.data[start:end])
+        else:
+            column: scipy.sparse.coo_matrix = self._bag_term_matrix[:, [token_id]].tocoo()
+            document_ids, counts = column.row.astype(np.int64), column.data
+        if not counts.all():
+            document_ids, counts = document_ids[counts != 0], counts[counts != 0]
+        return document_ids, counts
+
     # def __iter__(self) -> Iterable[Tuple[int,int|float]]:
     #     """Return rows as a list of (token_id, count)
     #     Kudos: https://stackoverflow.com/a/52299730/12383895
@@ -414,9 +519,9 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
         return term_term_matrix
 
     def find_matching_words(self, word_or_regexp: Set[str], n_max_count: int, descending: bool = False) -> list[str]:
-        """Returns words in corpus that matches candidate tokens"""
+        """Returns words in corpus that matches candidate tokens (using the vocabulary index if it is built)"""
         words = self.pick_n_top_words(
-            find_matching_words_in_vocabulary(self.token2id, word_or_regexp),
+            find_matching_words_in_vocabulary(self.token2id, word_or_regexp, index=self._vocabulary_index),
             n_max_count,
             descending=descending,
         )
@@ -427,8 +532,6 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
     ) -> list[int]:
         """Returns `tokens´ indices` in corpus that matches candidate tokens"""
 
-        # FIXME: Use https://github.com/WojciechMula/pyahocorasick to search for words
-
         indices: list[int] = [
             self.token2id[token]
             for token in self.find_matching_words(word_or_regexp, n_max_count, descending=descending)
@@ -522,6 +625,7 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
         data.eliminate_zeros()
 
         self._bag_term_matrix = data
+        self._reset_derived()
         return indices
 
     # def zero_out_by_indices(self, indices: Sequence[int]) -> None:
@@ -533,7 +637,12 @@ class VectorizedCorpus(StoreMixIn, GroupByMixIn, SliceMixIn, StatsMixIn, IVector
     #     self.data.eliminate_zeros()
 
 
-def find_matching_words_in_vocabulary(token2id: dict[str], candidate_words: Set[str]) -> Set[str]:
+def find_matching_words_in_vocabulary(
+    token2id: dict[str], candidate_words: Set[str], index: VocabularyIndex = None
+) -> Set[str]:
+    if index is not None:
+        return set(index.find(candidate_words))
+
     words = {w for w in candidate_words if w in token2id}
 
     remaining_words = [w for w in candidate_words if w not in words and len(w) > 0]
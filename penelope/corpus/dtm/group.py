@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, List, Literal, Mapping, Sequence, Tuple, TypeVar, Union
+from typing import Callable, List, Literal, Mapping, Sequence, TypeVar, Union
 
 import numpy as np
 import pandas as pd
@@ -151,7 +151,7 @@ class GroupByMixIn:
         target_column_name: str = 'time_period',
     ) -> IVectorizedCorpus:
         """Groups corpus by specified temporal_key_specifier.
-        Uses scipy sparse lil format during construction.
+        Rows are summed by a sparse indicator matrix product (see `aggregate_rows`).
         Args:
             temporal_key_specifier (Union[str, dict]): [description]
             aggregate (str, optional): [description]. Defaults to 'sum'.
@@ -322,20 +322,17 @@ def group_DTM_by_category_indices_mapping(
     aggregate: str,
     document_index: pd.DataFrame,
     pivot_column_name: str,
-):
+) -> sp.csr_matrix:
     shape = (len(document_index), bag_term_matrix.shape[1])
     dtype = np.int32 if np.issubdtype(bag_term_matrix.dtype, np.integer) and aggregate == 'sum' else np.float64
-    matrix: scipy.sparse.lil_matrix = scipy.sparse.lil_matrix(shape, dtype=dtype)
-
-    for document_id, category_value in document_index[pivot_column_name].to_dict().items():
-        indices = category_indices.get(category_value, [])
-        if len(indices) == 0:
-            continue
-        matrix[document_id, :] = (
-            bag_term_matrix[indices, :].mean(axis=0) if aggregate == 'mean' else bag_term_matrix[indices, :].sum(axis=0)
-        )
 
-    return matrix
+    group_indices: dict[int, List[int]] = {
+        document_id: category_indices.get(category_value, [])
+        for document_id, category_value in document_index[pivot_column_name].to_dict().items()
+    }
+    rows, columns = group_coordinates(group_indices)
+
+    return aggregate_rows(bag_term_matrix, rows, columns, n_groups=shape[0], aggregate=aggregate, dtype=dtype)
 
 
 def create_category_series(category_series: pd.Series, fill_gaps: bool = True, fill_steps: int = 1):
@@ -377,13 +374,52 @@ def fill_temporal_gaps_in_group_document_index(
     return di
 
 
+def group_coordinates(group_indices: Mapping[int, Sequence[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """Returns (group, row) coordinates for each row index in `group_indices` (group => row indices)"""
+    groups: list[tuple[int, Sequence[int]]] = [(g, indices) for g, indices in group_indices.items() if len(indices) > 0]
+    if not groups:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    rows: np.ndarray = np.repeat(np.array([g for g, _ in groups], dtype=np.int64), [len(x) for _, x in groups])
+    columns: np.ndarray = np.concatenate([np.asarray(x, dtype=np.int64) for _, x in groups])
+    return rows, columns
+
+
+def aggregate_rows(
+    bag_term_matrix: sp.spmatrix,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    *,
+    n_groups: int,
+    aggregate: str,
+    dtype: np.dtype,
+) -> sp.csr_matrix:
+    """Sums (or averages) rows of `bag_term_matrix` into `n_groups` groups.
+
+    The grouping is done as a single sparse product G @ DTM, where G is a (n_groups x n_docs) indicator matrix
+    with G[rows[k], columns[k]] = 1 (or 1/group size if `aggregate` is `mean`)."""
+    assert aggregate in {'sum', 'mean'}
+
+    if aggregate == 'mean':
+        values: np.ndarray = 1.0 / np.bincount(rows, minlength=n_groups)[rows]
+    else:
+        values = np.ones(len(rows), dtype=np.int32)
+
+    indicator: sp.csr_matrix = sp.csr_matrix((values, (rows, columns)), shape=(n_groups, bag_term_matrix.shape[0]))
+
+    matrix: sp.spmatrix | np.ndarray = indicator @ bag_term_matrix
+    if not sp.issparse(matrix):
+        matrix = sp.csr_matrix(matrix)
+
+    return matrix.astype(dtype, copy=False).tocsr()
+
+
 def group_DTM_by_category_series(
     bag_term_matrix: scipy.sparse.csr_matrix,
     *,
     category_series: pd.Series,
     categories: List[Union[int, str]],
     aggregate: str,
-) -> np.ndarray:
+) -> sp.csr_matrix:
     """Returns a new DTM where rows having same values (as specified by category_series) are grouped.
 
     Args:
@@ -393,23 +429,23 @@ def group_DTM_by_category_series(
         aggregate (str):                            How to reduce rows in category group, `sum` (default) or mean
 
     Returns:
-        np.ndarray: Reduced matrix
+        sp.csr_matrix: Reduced matrix
     """
     assert aggregate in {'sum', 'mean'}
 
-    shape = (len(categories), bag_term_matrix.shape[1])
     dtype = np.int64 if np.issubdtype(bag_term_matrix.dtype, np.integer) and aggregate == 'sum' else np.float64
-    matrix = np.zeros(shape=shape, dtype=dtype)
-    for i, value in enumerate(categories):
-        indices = category_series[category_series == value].index.tolist()
-        if len(indices) == 0:
-            continue
-        if aggregate == 'mean':
-            matrix[i, :] = bag_term_matrix[indices, :].mean(axis=0)
-        else:
-            matrix[i, :] = bag_term_matrix[indices, :].sum(axis=0)
 
-    return matrix
+    codes: np.ndarray = pd.Categorical(category_series, categories=categories).codes.astype(np.int64)
+    mask: np.ndarray = codes >= 0
+
+    return aggregate_rows(
+        bag_term_matrix,
+        codes[mask],
+        np.asarray(category_series.index)[mask].astype(np.int64),
+        n_groups=len(categories),
+        aggregate=aggregate,
+        dtype=dtype,
+    )
 
 
 def group_DTM_by_indices_mapping(
@@ -418,20 +454,9 @@ def group_DTM_by_indices_mapping(
     category_indices: Mapping[int, List[int]],
     aggregate: str = 'sum',
     dtype: np.dtype = None,
-):
-    shape: Tuple[int, int] = (n_docs, dtm.shape[1])
-
+) -> sp.csr_matrix:
     dtype: np.dtype = dtype or (np.int32 if np.issubdtype(dtm.dtype, np.integer) and aggregate == 'sum' else np.float64)
 
-    matrix: sp.lil_matrix = sp.lil_matrix(shape, dtype=dtype)
-
-    if aggregate == 'mean':
-        for document_id, indices in category_indices.items():
-            if len(indices) > 0:
-                matrix[document_id, :] = dtm[indices, :].mean(axis=0)
-    else:
-        for document_id, indices in category_indices.items():
-            if len(indices) > 0:
-                matrix[document_id, :] = dtm[indices, :].sum(axis=0)
+    rows, columns = group_coordinates(category_indices)
 
-    return matrix
+    return aggregate_rows(dtm, rows, columns, n_groups=n_docs, aggregate=aggregate, dtype=dtype)
@@ -124,7 +124,7 @@ class SliceMixIn:
 
     # @autojit
     def slice_by_indices(self: ISlicedCorpusProtocol, indices: Sequence[int], inplace=False) -> IVectorizedCorpus:
-        """Create (or modifies inplace) a subset corpus from given `indices`"""
+        """Create (or modifies inplace) a subset corpus from given `indices` (sliced from the postings if built)"""
 
         if indices is None:
             indices = []
@@ -134,7 +134,11 @@ class SliceMixIn:
 
         indices.sort()
 
-        bag_term_matrix = self.bag_term_matrix[:, indices]
+        bag_term_matrix = (
+            self._postings[:, indices].tocsr()
+            if getattr(self, '_postings', None) is not None
+            else self.bag_term_matrix[:, indices]
+        )
         token2id = {self.id2token[indices[i]]: i for i in range(0, len(indices))}
 
         overridden_term_frequency = (
@@ -148,6 +152,7 @@ class SliceMixIn:
         self._bag_term_matrix = bag_term_matrix
         self._token2id = token2id
         self._id2token = None
+        self._reset_derived()
         self._overridden_term_frequency = overridden_term_frequency
 
         return self
@@ -195,6 +200,7 @@ class SliceMixIn:
         self._bag_term_matrix = new_dtm
         self._token2id = token2id
         self._id2token = None
+        self._reset_derived()
         self._overridden_term_frequency = o_tf
 
         return self
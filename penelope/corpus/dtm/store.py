@@ -7,7 +7,7 @@ import os
 import time
 from collections import defaultdict
 from os.path import join as jj
-from typing import Callable, Literal, Optional
+from typing import Callable, Literal, Mapping, Optional
 
 import numpy as np
 import pandas as pd
@@ -16,23 +16,32 @@ import scipy
 from penelope.utility import read_json, strip_paths, write_json
 
 from .interface import IVectorizedCorpus, IVectorizedCorpusProtocol
+from .vocabulary import MemoryMappedVocabulary
 
-DATA_SUFFIXES: list[str] = ['_vector_data.npz', '_vector_data.npy', '_vectorizer_data.pickle']
+MMAP_SUFFIX: str = '_vector_data.indptr.npy'
+
+DATA_SUFFIXES: list[str] = ['_vector_data.npz', MMAP_SUFFIX, '_vector_data.npy', '_vectorizer_data.pickle']
 
 BASENAMES: list[str] = [
     'vector_data',
     'vectorizer_data',
     'document_index',
     'token2id',
+    'vocabulary',
+    'postings',
     'overridden_term_frequency',
 ]
 
+MMAP_MATRIX_PARTS: list[str] = ['data', 'indices', 'indptr']
+MMAP_VOCABULARY_PARTS: list[str] = ['buffer', 'offsets', 'order']
+
 
 def create_corpus_instance(
     bag_term_matrix: scipy.sparse.csr_matrix,
     token2id: dict[str, int],
     document_index: pd.DataFrame,
     overridden_term_frequency: dict[str, int] = None,
+    postings: scipy.sparse.csc_matrix = None,
 ) -> "IVectorizedCorpus":
     """Creates a corpus instance using importlib to avoid cyclic references"""
     module = importlib.import_module(name="penelope.corpus.dtm.corpus")
@@ -42,16 +51,18 @@ def create_corpus_instance(
         token2id=token2id,
         document_index=document_index,
         overridden_term_frequency=overridden_term_frequency,
+        postings=postings,
     )
 
 
-def load_metadata(*, tag: str, folder: str) -> dict:
-    """Loads metadata from disk."""
+def load_metadata(*, tag: str, folder: str, token2id: Mapping[str, int] = None) -> dict:
+    """Loads metadata from disk. Vocabulary is read from disk only if `token2id` is not given."""
 
     document_index: pd.DataFrame = load_document_index(tag, folder)
 
-    with gzip.open(jj(folder, f"{tag}_token2id.json.gz"), 'r') as fp:
-        token2id: dict = json.loads(fp.read().decode('utf-8'))
+    if token2id is None:
+        with gzip.open(jj(folder, f"{tag}_token2id.json.gz"), 'r') as fp:
+            token2id: dict = json.loads(fp.read().decode('utf-8'))
 
     term_frequency = (
         np.load(jj(folder, f"{tag}_overridden_term_frequency.npy"), allow_pickle=True)
@@ -66,6 +77,93 @@ def load_metadata(*, tag: str, folder: str) -> dict:
     }
 
 
+def memory_mapped_exists(*, tag: str, folder: str) -> bool:
+    """Checks if DTM with tag `tag` exists in memory mapped format in folder `folder`"""
+    return os.path.isfile(jj(folder, f"{tag}{MMAP_SUFFIX}"))
+
+
+def store_memory_mapped(
+    *, tag: str, folder: str, bag_term_matrix: scipy.sparse.spmatrix, token2id: Mapping[str, int]
+) -> None:
+    """Stores DTM and vocabulary as raw .npy arrays that can be memory mapped by `load_memory_mapped`.
+
+        {tag}_vector_data.[data|indices|indptr].npy   CSR arrays of the document-term matrix
+        {tag}_vector_data.shape.json                   Shape of the document-term matrix
+        {tag}_vocabulary.[buffer|offsets|order].npy   Vocabulary (see `MemoryMappedVocabulary`)
+        {tag}_vocabulary.reversed.npy                  Token ids sorted by reversed token (suffix lookups)
+        {tag}_postings.[data|indices|indptr].npy      CSC arrays, i.e. word to document posting lists
+
+    The `indptr` file of the matrix is written last, since its existence marks a complete dump."""
+    matrix: scipy.sparse.csr_matrix = scipy.sparse.csr_matrix(bag_term_matrix)
+    matrix.sort_indices()
+
+    vocabulary: MemoryMappedVocabulary = (
+        token2id
+        if isinstance(token2id, MemoryMappedVocabulary)
+        else MemoryMappedVocabulary.create(t for t, _ in sorted(token2id.items(), key=lambda x: x[1]))
+    )
+    for part, array in vocabulary.arrays.items():
+        np.save(jj(folder, f"{tag}_vocabulary.{part}.npy"), np.asarray(array), allow_pickle=False)
+
+    store_postings(tag=tag, folder=folder, bag_term_matrix=matrix)
+
+    write_json(jj(folder, f"{tag}_vector_data.shape.json"), list(matrix.shape))
+    for part in MMAP_MATRIX_PARTS:
+        np.save(jj(folder, f"{tag}_vector_data.{part}.npy"), getattr(matrix, part), allow_pickle=False)
+
+
+def load_memory_mapped(
+    *, tag: str, folder: str, mmap_mode: Literal['r', 'c'] = 'c'
+) -> tuple[scipy.sparse.csr_matrix, MemoryMappedVocabulary]:
+    """Loads a DTM stored by `store_memory_mapped`, arrays are memory mapped and not read into memory.
+
+    The default mode `c` (copy-on-write) shares pages between processes until a page is modified."""
+
+    def _load(name: str) -> np.ndarray:
+        return np.load(jj(folder, f"{tag}_{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+
+    shape: tuple[int, int] = tuple(read_json(jj(folder, f"{tag}_vector_data.shape.json")))
+    data, indices, indptr = (_load(f"vector_data.{part}") for part in MMAP_MATRIX_PARTS)
+
+    # Assign arrays directly, the csr_matrix constructor might copy (and read) the arrays to change index dtype
+    bag_term_matrix: scipy.sparse.csr_matrix = scipy.sparse.csr_matrix(shape, dtype=data.dtype)
+    bag_term_matrix.data, bag_term_matrix.indices, bag_term_matrix.indptr = data, indices, indptr
+    bag_term_matrix.has_sorted_indices = True
+
+    vocabulary: MemoryMappedVocabulary = MemoryMappedVocabulary(
+        *(_load(f"vocabulary.{part}") for part in MMAP_VOCABULARY_PARTS)
+    )
+    if os.path.isfile(jj(folder, f"{tag}_vocabulary.reversed.npy")):
+        vocabulary.reversed_order = _load("vocabulary.reversed")
+    return bag_term_matrix, vocabulary
+
+
+def postings_exist(*, tag: str, folder: str) -> bool:
+    return os.path.isfile(jj(folder, f"{tag}_postings.indptr.npy"))
+
+
+def store_postings(*, tag: str, folder: str, bag_term_matrix: scipy.sparse.spmatrix) -> None:
+    """Stores the DTM in CSC format, i.e. for each word the (sorted) ids of documents where it occurs."""
+    postings: scipy.sparse.csc_matrix = scipy.sparse.csc_matrix(bag_term_matrix)
+    postings.sort_indices()
+    for part in MMAP_MATRIX_PARTS:
+        np.save(jj(folder, f"{tag}_postings.{part}.npy"), getattr(postings, part), allow_pickle=False)
+
+
+def load_postings(
+    *, tag: str, folder: str, shape: tuple[int, int], mmap_mode: Literal['r', 'c'] = 'c'
+) -> scipy.sparse.csc_matrix:
+    """Loads (memory mapped) posting lists stored by `store_postings`"""
+    data, indices, indptr = (
+        np.load(jj(folder, f"{tag}_postings.{part}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+        for part in MMAP_MATRIX_PARTS
+    )
+    postings: scipy.sparse.csc_matrix = scipy.sparse.csc_matrix(shape, dtype=data.dtype)
+    postings.data, postings.indices, postings.indptr = data, indices, indptr
+    postings.has_sorted_indices = True
+    return postings
+
+
 def load_document_index(tag: str, folder: str) -> pd.DataFrame:
 
     probes: list[tuple[str, Callable[[str], pd.DataFrame]]] = [
@@ -81,7 +179,7 @@ def load_document_index(tag: str, folder: str) -> pd.DataFrame:
 
 def store_metadata(*, tag: str, folder: str, mode: Literal['bundle', 'files'] = 'files', **data) -> None:
     """Stores metadata to disk."""
-    if isinstance(data.get('token2id'), defaultdict):
+    if isinstance(data.get('token2id'), (defaultdict, MemoryMappedVocabulary)):
         data['token2id'] = dict(data.get('token2id', {}))
 
     if mode.startswith('bundle'):
@@ -120,6 +218,7 @@ class StoreMixIn:
         folder: str,
         compressed: bool = True,
         mode: Literal['bundle', 'files'] = 'files',
+        memory_mapped: bool = False,
     ) -> IVectorizedCorpus:
         """Store corpus to disk.
 
@@ -131,6 +230,8 @@ class StoreMixIn:
             {tag}_term_frequency.npy             Term frequency to use, overrides TF sums in DTM (if mode is `files`)
             {tag}_vector_data.[npz|npy]          The document-term matrix (numpy or sparse format)
 
+        If `memory_mapped` is True, the matrix and the vocabulary are (also) stored as raw arrays that
+        can be memory mapped on load, see `store_memory_mapped`.
 
         Parameters
         ----------
@@ -142,13 +243,18 @@ class StoreMixIn:
             Specifies if matrix is stored as .npz or .npy, by default .npz
         mode : str, optional, values 'bundle' or 'files'
             Specifies if metadata should be bundled in a pickle file or stored as individual compressed files.
+        memory_mapped : bool, optional
+            Store matrix and vocabulary as memory mappable arrays (instead of .npz/.npy), by default False
 
         """
         tag = tag or time.strftime("%Y%m%d_%H%M%S")
 
         store_metadata(tag=tag, folder=folder, mode=mode, **self.metadata)
 
-        if compressed:
+        if memory_mapped:
+            assert scipy.sparse.issparse(self.bag_term_matrix)
+            store_memory_mapped(tag=tag, folder=folder, bag_term_matrix=self.bag_term_matrix, token2id=self.token2id)
+        elif compressed:
             assert scipy.sparse.issparse(self.bag_term_matrix)
             scipy.sparse.save_npz(jj(folder, f"{tag}_vector_data"), self.bag_term_matrix, compressed=True)
         else:
@@ -202,7 +308,9 @@ class StoreMixIn:
                     os.unlink(filename)
 
     @staticmethod
-    def load(*, tag: str = None, folder: str = None, filename: str = None) -> IVectorizedCorpus:
+    def load(
+        *, tag: str = None, folder: str = None, filename: str = None, memory_mapped: bool = True
+    ) -> IVectorizedCorpus:
         """Loads corpus with tag `tag` in folder `folder`
 
         Raises `FileNotFoundError` if any of the two files containing metadata and matrix doesn't exist.
@@ -212,6 +320,8 @@ class StoreMixIn:
             {tag}_vectorizer_data.pickle         Contains metadata `token2id`, `document_index` and `overridden_term_frequency`
             {tag}_vector_data.[npz|npy]          Contains the document-term matrix (numpy or sparse format)
 
+        If the corpus has been stored in memory mapped format, then the matrix and vocabulary are memory mapped
+        (unless `memory_mapped` is False), so that processes loading the same corpus share the same physical pages.
 
         Parameters
         ----------
@@ -219,6 +329,8 @@ class StoreMixIn:
             Corpus identifier (prefixed to filename)
         folder : str, optional
             Corpus folder to look in, by default './output'
+        memory_mapped : bool, optional
+            Use memory mapped format if it exists, by default True
 
         Returns
         -------
@@ -238,7 +350,20 @@ class StoreMixIn:
         if not StoreMixIn.dump_exists(tag=tag, folder=folder):
             raise FileNotFoundError(f"DTM file with tag {tag} not found in folder {folder}")
 
-        data: dict = load_metadata(tag=tag, folder=folder)
+        bag_term_matrix: scipy.sparse.spmatrix = None
+        vocabulary: MemoryMappedVocabulary = None
+        postings: scipy.sparse.csc_matrix = None
+
+        if memory_mapped_exists(tag=tag, folder=folder):
+            has_matrix_file: bool = any(os.path.isfile(jj(folder, f"{tag}_vector_data.{x}")) for x in ['npz', 'npy'])
+            if memory_mapped or not has_matrix_file:
+                bag_term_matrix, vocabulary = load_memory_mapped(tag=tag, folder=folder)
+                if not memory_mapped:
+                    bag_term_matrix, vocabulary = bag_term_matrix.copy(), None
+                elif postings_exist(tag=tag, folder=folder):
+                    postings = load_postings(tag=tag, folder=folder, shape=bag_term_matrix.shape)
+
+        data: dict = load_metadata(tag=tag, folder=folder, token2id=vocabulary)
 
         token2id: dict = data.get("token2id")
 
@@ -254,17 +379,22 @@ class StoreMixIn:
             overridden_term_frequency = np.array([overridden_term_frequency[fg(i)] for i in range(0, len(token2id))])
 
         """Document-term-matrix"""
-        if os.path.isfile(jj(folder, f"{tag}_vector_data.npz")):
+        if bag_term_matrix is not None:
+            pass
+        elif os.path.isfile(jj(folder, f"{tag}_vector_data.npz")):
             bag_term_matrix = scipy.sparse.load_npz(jj(folder, f"{tag}_vector_data.npz"))
         else:
             bag_term_matrix = np.load(jj(folder, f"{tag}_vector_data.npy"), allow_pickle=True).item()
 
-        return create_corpus_instance(
+        corpus: IVectorizedCorpus = create_corpus_instance(
             bag_term_matrix,
             token2id=token2id,
             document_index=data.get("document_index"),
             overridden_term_frequency=overridden_term_frequency,
+            postings=postings,
         )
+        corpus.source = (folder, tag)
+        return corpus
 
     @staticmethod
     def dump_options(*, tag: str, folder: str, options: dict):
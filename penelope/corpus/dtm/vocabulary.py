@@ -0,0 +1,434 @@
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import re
+import threading
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse  # type: ignore
+
+REGEXP_DELIMITER: str = '|'
+WILDCARDS: str = '*?['
+MAX_CHAR: str = chr(0x10FFFF)
+
+
+def encode_vocabulary(tokens: Iterable[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Encodes tokens (in id order) as a flat UTF-8 byte buffer, offsets into the buffer, and ids in byte-sorted order.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (buffer [uint8], offsets [int64, n+1], order [int64, n])
+    """
+    encoded: list[bytes] = [token.encode('utf-8') for token in tokens]
+    offsets: np.ndarray = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in encoded], out=offsets[1:])
+    buffer: np.ndarray = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    order: np.ndarray = np.array(sorted(range(len(encoded)), key=encoded.__getitem__), dtype=np.int64)
+    return buffer, offsets, order
+
+
+def reversed_order(tokens: Sequence[str]) -> np.ndarray:
+    """Returns token ids sorted by reversed token (used for suffix lookups)"""
+    reversed_tokens: list[str] = [tokens[i][::-1] for i in range(len(tokens))]
+    return np.array(sorted(range(len(reversed_tokens)), key=reversed_tokens.__getitem__), dtype=np.int64)
+
+
+class Id2TokenView(Mapping[int, str]):
+    """Read-only id to token mapping backed by a `MemoryMappedVocabulary`"""
+
+    def __init__(self, vocabulary: MemoryMappedVocabulary):
+        self._vocabulary: MemoryMappedVocabulary = vocabulary
+
+    def __getitem__(self, token_id: int) -> str:
+        if not 0 <= token_id < len(self._vocabulary):
+            raise KeyError(token_id)
+        return self._vocabulary.token(token_id)
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self._vocabulary)))
+
+
+class MemoryMappedVocabulary(Mapping[str, int]):
+    """Read-only token to id mapping backed by (memory mapped) numpy arrays.
+
+    Tokens are stored as a single UTF-8 byte buffer with offsets, and lookups are done by binary search
+    over the ids sorted by token bytes. No per-token Python objects are created when the vocabulary is
+    loaded, so the arrays can be shared (via the page cache) by all processes that map the same files.
+    The ids sorted by reversed token (`reversed_order`, optional) are used by `VocabularyIndex` for suffix
+    lookups.
+    """
+
+    def __init__(
+        self, buffer: np.ndarray, offsets: np.ndarray, order: np.ndarray, reversed_order: np.ndarray | None = None
+    ):
+        self._buffer: np.ndarray = buffer
+        self._offsets: np.ndarray = offsets
+        self._order: np.ndarray = order
+        self.reversed_order: np.ndarray | None = reversed_order
+
+    @staticmethod
+    def create(tokens: Iterable[str]) -> MemoryMappedVocabulary:
+        vocabulary: MemoryMappedVocabulary = MemoryMappedVocabulary(*encode_vocabulary(tokens))
+        vocabulary.reversed_order = reversed_order(vocabulary.id2token)
+        return vocabulary
+
+    @property
+    def order(self) -> np.ndarray:
+        """Token ids sorted by token"""
+        return self._order
+
+    @property
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Arrays to store, the reversed order is computed if missing"""
+        if self.reversed_order is None:
+            self.reversed_order = reversed_order(self.id2token)
+        return {'buffer': self._buffer, 'offsets': self._offsets, 'order': self._order, 'reversed': self.reversed_order}
+
+    def token_bytes(self, token_id: int) -> bytes:
+        return self._buffer[self._offsets[token_id] : self._offsets[token_id + 1]].tobytes()
+
+    def token(self, token_id: int) -> str:
+        return self.token_bytes(token_id).decode('utf-8')
+
+    def find(self, token: str) -> int | None:
+        """Returns id of `token` or None if token is not in vocabulary"""
+        key: bytes = token.encode('utf-8')
+        lo, hi = 0, len(self._order)
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if self.token_bytes(int(self._order[mid])) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._order) and self.token_bytes(int(self._order[lo])) == key:
+            return int(self._order[lo])
+        return None
+
+    def __getitem__(self, token: str) -> int:
+        token_id: int | None = self.find(token) if isinstance(token, str) else None
+        if token_id is None:
+            raise KeyError(token)
+        return token_id
+
+    def __contains__(self, token: object) -> bool:
+        return isinstance(token, str) and self.find(token) is not None
+
+    def get(self, token: str, default: int | None = None) -> int | None:
+        token_id: int | None = self.find(token) if isinstance(token, str) else None
+        return default if token_id is None else token_id
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.token(i) for i in range(len(self)))
+
+    def items(self) -> Iterator[tuple[str, int]]:  # type: ignore[override]
+        return ((self.token(i), i) for i in range(len(self)))
+
+    def values(self) -> Iterator[int]:  # type: ignore[override]
+        return iter(range(len(self)))
+
+    @property
+    def id2token(self) -> Id2TokenView:
+        return Id2TokenView(self)
+
+    def to_dict(self) -> dict[str, int]:
+        return dict(self.items())
+
+
+def is_regexp_expression(expr: str) -> bool:
+    return len(expr) > 1 and expr.startswith(REGEXP_DELIMITER) and expr.endswith(REGEXP_DELIMITER)
+
+
+def is_wildcard_expression(expr: str) -> bool:
+    return '*' in expr or is_regexp_expression(expr)
+
+
+def is_prefix_expression(expr: str) -> bool:
+    """True if `expr` is a prefix followed by a single '*', e.g. `debatt*`"""
+    return expr.endswith('*') and not any(c in WILDCARDS for c in expr[:-1]) and not is_regexp_expression(expr)
+
+
+def wildcard_literals(expr: str) -> tuple[str, str, list[str]]:
+    """Splits a wildcard expression (fnmatch syntax) into (prefix, suffix, literal runs between wildcards)"""
+    runs: list[str] = []
+    run: list[str] = []
+    i: int = 0
+    while i < len(expr):
+        c: str = expr[i]
+        if c not in WILDCARDS:
+            run.append(c)
+            i += 1
+            continue
+        if c == '[':
+            j: int = i + 1 + (expr[i + 1 : i + 2] == '!')
+            j = expr.find(']', j + (expr[j : j + 1] == ']'))
+            if j < 0:  # unclosed '[' is matched literally
+                run.append(c)
+                i += 1
+                continue
+            i = j
+        runs.append(''.join(run))
+        run = []
+        i += 1
+    runs.append(''.join(run))
+    if len(runs) == 1:
+        return runs[0], runs[0], runs
+    return runs[0], runs[-1], [r for r in runs if r]
+
+
+def regexp_literals(expr: str) -> tuple[str, list[str]]:
+    """Returns (prefix, literal runs) that any token matching `expr` (using `re.match`) must contain"""
+    try:
+        parsed = sre_parse.parse(expr)
+    except re.error:
+        return '', []
+    if parsed.state.flags & re.IGNORECASE:
+        return '', []
+    prefix: list[str] = []
+    runs: list[str] = []
+    run: list[str] = []
+    anchored: bool = True
+    for op, value in parsed:
+        if op == sre_parse.LITERAL:
+            run.append(chr(value))
+            if anchored:
+                prefix.append(chr(value))
+            continue
+        if anchored and op == sre_parse.AT and value == sre_parse.AT_BEGINNING:
+            continue
+        anchored = False
+        runs.append(''.join(run))
+        run = []
+    runs.append(''.join(run))
+    return ''.join(prefix), [r for r in runs if r]
+
+
+def trigrams(token: str) -> set[str]:
+    return {token[i : i + 3] for i in range(0, len(token) - 2)}
+
+
+class VocabularyIndex:
+    """Index for wildcard (`abc*`, `*abc`, `*ab*c*`) and regular expression (`|expr|`) lookups in a vocabulary.
+
+    Prefixes are resolved as ranges in the sorted vocabulary, and suffixes as ranges in the sorted reversed
+    vocabulary. Other expressions are pre-filtered by the tokens containing all trigrams of the expression's
+    literal parts. Candidates are then verified against the expression. Matches are returned most frequent
+    first.
+
+    Autocompletion of short prefixes (`a*`, `de*`) is served from a table of the `top_k` most frequent
+    completions of each prefix of at most `max_prefix_length` characters, i.e. a flattened prefix trie.
+    Longer prefixes have small enough ranges to be ranked on each call.
+
+    Tokens are not copied: the sorted (and reversed sorted) token ids are binary searched by looking up the
+    tokens, so an index over a `MemoryMappedVocabulary` only uses the vocabulary's (shared) arrays. The
+    sorted ids, if not given, and the reversed sorted ids, if not given, the trigram index and the completions
+    table are built on first use.
+    """
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        frequencies: np.ndarray | None = None,
+        top_k: int = 32,
+        max_prefix_length: int = 4,
+        sorted_ids: np.ndarray | None = None,
+        reversed_ids: np.ndarray | None = None,
+    ):
+        """Args:
+        tokens (Sequence[str]): tokens in id order (any object that maps id to token)
+        frequencies (np.ndarray, optional): token frequencies (in id order), used for ordering matches
+        top_k (int, optional): number of completions stored per prefix. Defaults to 32.
+        max_prefix_length (int, optional): longest prefix having stored completions. Defaults to 4.
+        sorted_ids (np.ndarray, optional): token ids sorted by token
+        reversed_ids (np.ndarray, optional): token ids sorted by reversed token
+        """
+        self.tokens: Sequence[str] = tokens
+        self.frequencies: np.ndarray = (
+            np.zeros(len(self.tokens), dtype=np.int64) if frequencies is None else np.asarray(frequencies)
+        )
+        if len(self.frequencies) != len(self.tokens):
+            raise ValueError(f"expected {len(self.tokens)} frequencies, found {len(self.frequencies)}")
+
+        self._sorted_ids: np.ndarray | None = sorted_ids
+        self._reversed_ids: np.ndarray | None = reversed_ids
+        self._rank: np.ndarray = np.empty(len(self.tokens), dtype=np.int64)
+        self._rank[np.argsort(-self.frequencies, kind='stable')] = np.arange(len(self.tokens))
+
+        self.top_k: int = top_k
+        self.max_prefix_length: int = max_prefix_length
+
+        self._trigrams: dict[str, np.ndarray] | None = None
+        self._completions: dict[str, np.ndarray] | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def create(corpus: Any) -> VocabularyIndex:
+        """Creates an index of `corpus`' vocabulary, ordered by (overridden) term frequencies.
+
+        The index of a memory mapped vocabulary uses the vocabulary's (stored) sorted and reversed sorted ids."""
+        token2id: Mapping[str, int] = corpus.token2id
+        if isinstance(token2id, MemoryMappedVocabulary):
+            return VocabularyIndex(
+                token2id.id2token,
+                corpus.term_frequency0,
+                sorted_ids=token2id.order,
+                reversed_ids=token2id.reversed_order,
+            )
+        id2token: Mapping[int, str] = corpus.id2token
+        return VocabularyIndex([id2token[i] for i in range(0, corpus.n_tokens)], corpus.term_frequency0)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def sorted_ids(self) -> np.ndarray:
+        """Token ids sorted by token"""
+        if self._sorted_ids is None:
+            with self._lock:
+                if self._sorted_ids is None:
+                    self._sorted_ids = np.array(
+                        sorted(range(len(self.tokens)), key=self.tokens.__getitem__), dtype=np.int64
+                    )
+        return self._sorted_ids
+
+    @property
+    def reversed_ids(self) -> np.ndarray:
+        """Token ids sorted by reversed token"""
+        if self._reversed_ids is None:
+            with self._lock:
+                if self._reversed_ids is None:
+                    self._reversed_ids = reversed_order(self.tokens)
+        return self._reversed_ids
+
+    def _token(self, token_id: int) -> str:
+        return self.tokens[int(token_id)]
+
+    def _reversed_token(self, token_id: int) -> str:
+        return self.tokens[int(token_id)][::-1]
+
+    @property
+    def trigrams(self) -> dict[str, np.ndarray]:
+        """Trigram to (sorted) ids of tokens containing the trigram"""
+        if self._trigrams is None:
+            with self._lock:
+                if self._trigrams is None:
+                    index: dict[str, list[int]] = {}
+                    for token_id in range(len(self.tokens)):
+                        for trigram in trigrams(self.tokens[token_id]):
+                            index.setdefault(trigram, []).append(token_id)
+                    self._trigrams = {k: np.array(v, dtype=np.int32) for k, v in index.items()}
+        return self._trigrams
+
+    @property
+    def completions(self) -> dict[str, np.ndarray]:
+        """Prefix to ids of its `top_k` most frequent completions (most frequent first).
+
+        Only prefixes having more than `top_k` completions are stored."""
+        if self._completions is None:
+            with self._lock:
+                if self._completions is None:
+                    table: dict[str, list[int]] = {}
+                    for token_id in np.argsort(self._rank):
+                        token: str = self.tokens[token_id]
+                        for n in range(1, min(len(token), self.max_prefix_length) + 1):
+                            ids: list[int] = table.setdefault(token[:n], [])
+                            if len(ids) <= self.top_k:
+                                ids.append(int(token_id))
+                    self._completions = {
+                        prefix: np.array(ids[: self.top_k], dtype=np.int64)
+                        for prefix, ids in table.items()
+                        if len(ids) > self.top_k
+                    }
+        return self._completions
+
+    def complete(self, prefix: str, n_top: int) -> list[str]:
+        """Returns the `n_top` most frequent tokens starting with `prefix`, most frequent first"""
+        if 0 < len(prefix) <= self.max_prefix_length and n_top <= self.top_k:
+            ids: np.ndarray | None = self.completions.get(prefix)
+            if ids is not None:
+                return [self.tokens[i] for i in ids[:n_top]]
+        ids = self.prefixed(prefix)
+        if len(ids) > n_top:
+            ids = ids[np.argpartition(self._rank[ids], n_top)[:n_top]]
+        return [self.tokens[i] for i in ids[np.argsort(self._rank[ids])]]
+
+    def prefixed(self, prefix: str) -> np.ndarray:
+        """Returns ids of tokens starting with `prefix`"""
+        ids: np.ndarray = self.sorted_ids
+        lo: int = bisect.bisect_left(ids, prefix, key=self._token)
+        hi: int = bisect.bisect_left(ids, prefix + MAX_CHAR, lo, key=self._token)
+        return np.asarray(ids[lo:hi], dtype=np.int64)
+
+    def suffixed(self, suffix: str) -> np.ndarray:
+        """Returns ids of tokens ending with `suffix`"""
+        ids: np.ndarray = self.reversed_ids
+        key: str = suffix[::-1]
+        lo: int = bisect.bisect_left(ids, key, key=self._reversed_token)
+        hi: int = bisect.bisect_left(ids, key + MAX_CHAR, lo, key=self._reversed_token)
+        return np.asarray(ids[lo:hi], dtype=np.int64)
+
+    def containing(self, literals: Iterable[str]) -> np.ndarray | None:
+        """Returns ids of tokens that contain all trigrams of `literals`, or None if there are no trigrams"""
+        keys: set[str] = set().union(*(trigrams(x) for x in literals))
+        if not keys:
+            return None
+        index: dict[str, np.ndarray] = self.trigrams
+        postings: list[np.ndarray] = sorted((index.get(k, np.empty(0, dtype=np.int32)) for k in keys), key=len)
+        ids: np.ndarray = postings[0]
+        for other in postings[1:]:
+            if len(ids) == 0:
+                break
+            ids = np.intersect1d(ids, other, assume_unique=True)
+        return ids.astype(np.int64)
+
+    def match(self, expr: str) -> np.ndarray:
+        """Returns ids of tokens matching wildcard or regular expression `expr`, most frequent first"""
+        if is_regexp_expression(expr):
+            pattern: re.Pattern = re.compile(expr.strip(REGEXP_DELIMITER))
+            prefix, literals = regexp_literals(pattern.pattern)
+            suffix, verbatim = '', False
+        else:
+            pattern = re.compile(fnmatch.translate(expr))
+            prefix, suffix, literals = wildcard_literals(expr)
+            verbatim = expr in (prefix + '*', '*' + suffix)
+
+        candidates: np.ndarray | None = None
+        if not verbatim and len(prefix) < 3 and len(suffix) < 3:
+            candidates = self.containing(literals)
+        if candidates is None:
+            candidates = self.prefixed(prefix) if len(prefix) >= len(suffix) else self.suffixed(suffix)
+
+        if not verbatim:
+            candidates = np.array([i for i in candidates if pattern.match(self.tokens[i])], dtype=np.int64)
+
+        return candidates[np.argsort(self._rank[candidates], kind='stable')]
+
+    def find(self, exprs: Iterable[str], n_top: int | None = None) -> list[str]:
+        """Returns tokens in `exprs` and tokens matching wildcard or regular expressions in `exprs`, most frequent first"""
+        exprs = [expr for expr in exprs if expr]
+        if n_top and len(exprs) == 1 and is_prefix_expression(exprs[0]):
+            return self.complete(exprs[0][:-1], n_top)
+
+        ids: list[np.ndarray] = [
+            self.match(expr) if is_wildcard_expression(expr) else np.array(self.token_ids(expr), dtype=np.int64)
+            for expr in exprs
+        ]
+        matches: np.ndarray = np.unique(np.concatenate(ids)) if ids else np.empty(0, dtype=np.int64)
+        matches = matches[np.argsort(self._rank[matches], kind='stable')]
+        return [self.tokens[i] for i in matches[:n_top]]
+
+    def token_ids(self, token: str) -> list[int]:
+        """Returns [id] of `token`, or [] if token is not in vocabulary"""
+        ids: np.ndarray = self.sorted_ids
+        i: int = bisect.bisect_left(ids, token, key=self._token)
+        return [int(ids[i])] if i < len(ids) and self._token(ids[i]) == token else []
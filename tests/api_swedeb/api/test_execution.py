@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from api_swedeb.api.utils.execution import ExecutionPool
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def pool():
+    pool = ExecutionPool(max_threads=4, max_light_threads=2, limits={'default': 2, 'slow': 1})
+    yield pool
+    pool.shutdown()
+
+
+def test_run_returns_result_from_worker_thread(pool: ExecutionPool):
+    async def run():
+        return await pool.run('fast', lambda x: (x * 2, threading.current_thread().name), 21)
+
+    value, thread_name = asyncio.run(run())
+
+    assert value == 42
+    assert thread_name.startswith('swedeb-worker')
+    assert pool.stats()['fast']['completed'] == 1
+
+
+def test_metadata_endpoint_runs_in_light_lane(pool: ExecutionPool):
+    async def run():
+        return await pool.run('metadata', lambda: threading.current_thread().name)
+
+    assert pool.lane('metadata') == 'light'
+    assert asyncio.run(run()).startswith('swedeb-light')
+
+
+def test_run_respects_endpoint_limit(pool: ExecutionPool):
+    running: list[int] = []
+    lock = threading.Lock()
+    counter = {'current': 0}
+
+    def slow_task():
+        with lock:
+            counter['current'] += 1
+            running.append(counter['current'])
+        time.sleep(0.05)
+        with lock:
+            counter['current'] -= 1
+
+    async def run():
+        await asyncio.gather(*[pool.run('slow', slow_task) for _ in range(4)])
+
+    asyncio.run(run())
+
+    assert max(running) == 1
+    stats = pool.stats()['slow']
+    assert stats['completed'] == 4
+    assert stats['waiting'] == 0 and stats['running'] == 0
+    assert stats['max_wait_time'] > 0
+
+
+def test_event_loop_is_not_blocked_by_running_task(pool: ExecutionPool):
+    async def run():
+        ticks: int = 0
+        task = asyncio.ensure_future(pool.run('slow', time.sleep, 0.2))
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks
+
+    assert asyncio.run(run()) > 5
+
+
+def test_failed_task_is_counted_and_reraised(pool: ExecutionPool):
+    def fail():
+        raise ValueError("unknown speech key")
+
+    with pytest.raises(ValueError):
+        asyncio.run(pool.run('fail', fail))
+
+    assert pool.stats()['fail']['failed'] == 1
+
+
+def test_iterate_holds_endpoint_limit_until_exhausted(pool: ExecutionPool):
+    def numbers():
+        for i in range(3):
+            yield i, threading.current_thread().name
+
+    async def consume():
+        return [item async for item in pool.iterate('slow', numbers())]
+
+    async def run():
+        stream = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        other = await pool.run('slow', lambda: pool.stats()['slow']['completed'])
+        return await stream, other
+
+    items, completed_before_other = asyncio.run(run())
+
+    assert [i for i, _ in items] == [0, 1, 2]
+    assert all(name.startswith('swedeb-worker') for _, name in items)
+    assert completed_before_other == 1
+    assert pool.stats()['slow']['completed'] == 2
+
+
+def test_closed_iteration_closes_iterator(pool: ExecutionPool):
+    closed: list[bool] = []
+
+    def numbers():
+        try:
+            yield from range(10)
+        finally:
+            closed.append(True)
+
+    async def run():
+        stream = pool.iterate('fast', numbers())
+        first = await anext(stream)
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(run()) == 0
+    assert closed == [True]
+    assert pool.stats()['fast']['running'] == 0
+
+
+def test_loader_executor_is_shared_and_bounded(pool: ExecutionPool):
+    executor = pool.executor('loader')
+
+    assert pool.executor('loader') is executor
+    assert executor.submit(lambda: threading.current_thread().name).result().startswith('swedeb-loader')
+    assert executor._max_workers == pool.download_workers  # pylint: disable=protected-access
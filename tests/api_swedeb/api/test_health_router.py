@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from api_swedeb.api import health_router
+from api_swedeb.api.utils import warmup
+from api_swedeb.api.utils.warmup import Component, WarmUp
+
+# pylint: disable=redefined-outer-name,protected-access
+
+
+@pytest.fixture
+def components(monkeypatch) -> list[str]:
+    loaded: list[str] = []
+
+    def loader(name: str, delay: float = 0.0):
+        def load():
+            time.sleep(delay)
+            loaded.append(name)
+
+        return load
+
+    def fail():
+        raise FileNotFoundError("dtm not found")
+
+    fake_components: dict[str, Component] = {
+        'a': Component('a', loader('a', 0.05)),
+        'b': Component('b', loader('b')),
+        'c': Component('c', loader('c'), ['a', 'b']),
+        'failing': Component('failing', fail),
+    }
+    monkeypatch.setattr(warmup, 'COMPONENTS', fake_components)
+    return loaded
+
+
+def test_levels_respect_dependencies(components):  # pylint: disable=unused-argument
+    assert WarmUp(['c', 'a', 'b']).levels() == [['a', 'b'], ['c']]
+    assert WarmUp(['c', 'b']).levels() == [['b'], ['c']]
+
+
+def test_unknown_component_raises(components):  # pylint: disable=unused-argument
+    with pytest.raises(ValueError):
+        WarmUp(['x'])
+
+
+def test_run_loads_components_in_dependency_order(components: list[str]):
+    warm_up: WarmUp = WarmUp(['a', 'b', 'c']).run()
+
+    assert warm_up.is_ready
+    assert components.index('c') > components.index('a')
+    assert warm_up.status()['components']['a']['elapsed'] >= 0.05
+
+
+def test_failed_component_is_reported(components):  # pylint: disable=unused-argument
+    warm_up: WarmUp = WarmUp(['b', 'failing']).run()
+
+    assert not warm_up.is_ready
+    assert warm_up.status()['components']['failing'] == {
+        'status': 'failed',
+        'elapsed': warm_up.states['failing'].elapsed,
+        'error': 'dtm not found',
+    }
+
+
+def test_ready_endpoint(components, monkeypatch):  # pylint: disable=unused-argument
+    app = FastAPI()
+    app.include_router(health_router.router)
+    client = TestClient(app)
+
+    warm_up: WarmUp = WarmUp(['a', 'b'])
+    monkeypatch.setattr(health_router, 'get_warm_up', lambda: warm_up)
+
+    response = client.get("/health/ready")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()['components']['a']['status'] == 'pending'
+
+    warm_up.run()
+
+    response = client.get("/health/ready")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['ready']
+
+    assert client.get("/health/live").status_code == status.HTTP_200_OK
@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
@@ -14,7 +15,6 @@ from api_swedeb.schemas.metadata_schema import (
     PartyItem,
     PartyList,
     SpeakerItem,
-    SpeakerResult,
     SubOfficeTypeList,
 )
 
@@ -117,10 +117,12 @@ def test_get_meta_sub_office_types(mock_get_sub_office_types: Mock, fastapi_clie
 
 
 @patch(
-    "api_swedeb.api.metadata_router.get_speakers",
-    return_value=SpeakerResult(
-        speaker_list=[
-            SpeakerItem(name="name", party_abbrev="PA", year_of_birth=1800, year_of_death=1940, person_id="123")
+    "api_swedeb.api.metadata_router.get_speakers_frame",
+    return_value=pd.DataFrame(
+        [
+            SpeakerItem(
+                name="name", party_abbrev="PA", year_of_birth=1800, year_of_death=1940, person_id="123"
+            ).model_dump()
         ]
     ),
 )
@@ -10,7 +10,7 @@ from api_swedeb.api.tool_router import router
 from api_swedeb.api.utils.common_params import CommonQueryParams
 from api_swedeb.schemas.kwic_schema import KeywordInContextResult
 from api_swedeb.schemas.ngrams_schema import NGramResult
-from api_swedeb.schemas.speech_text_schema import SpeechesTextResultItem
+from api_swedeb.schemas.speech_text_schema import SpeechesTextBatchResult, SpeechesTextResultItem
 from api_swedeb.schemas.speeches_schema import SpeechesResult, SpeechesResultWT
 from api_swedeb.schemas.word_trends_schema import SearchHits, WordTrendsResult
 
@@ -154,6 +154,19 @@ class TestGetSpeechByid:
         assert isinstance(result, SpeechesTextResultItem)
 
 
+class TestGetSpeechTexts:
+    def test_get_speech_texts_with_valid_speech_ids(self, speech_ids, fastapi_client):
+        response = fastapi_client.post(f"{version}/tools/speech_texts", json=speech_ids)
+        assert response.status_code == 200
+        result = SpeechesTextBatchResult(**response.json())
+        assert [item.speech_id for item in result.speech_list] == speech_ids
+
+    def test_get_speech_texts_with_invalid_speech_ids_returns_bad_request(self, fastapi_client):
+        response = fastapi_client.post(f"{version}/tools/speech_texts", json=["invalid_id"])
+        assert response.status_code == 400
+        assert "unknown speech key" in response.json()['detail']
+
+
 class TestGetZip:
     def test_get_zip_with_valid_speech_ids(self, speech_ids, fastapi_client):
         response = fastapi_client.post(f"{version}/tools/speech_download/", json=speech_ids)
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pandas as pd
+
+from api_swedeb.core.cache import ResultCache, cached_result, data_version, estimate_size, get_result_cache, make_key
+
+
+def test_make_key_is_independent_of_dict_order():
+    assert make_key("kwic", {'a': [1, 2], 'b': 'x'}, cut_off=10) == make_key(
+        "kwic", {'b': 'x', 'a': [1, 2]}, cut_off=10
+    )
+    assert make_key("kwic", {'a': [1, 2]}) != make_key("kwic", {'a': [2, 1]})
+    assert make_key("kwic", {'a': 1}) != make_key("ngrams", {'a': 1})
+
+
+def test_get_and_put():
+    cache = ResultCache(max_items=2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_lru_eviction_by_count():
+    cache = ResultCache(max_items=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    _ = cache.get('a')
+    cache.put('c', 3)
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    assert cache.stats()['evictions'] == 1
+
+
+def test_clear_resets_stats():
+    cache = ResultCache(max_items=1)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    _ = cache.get('a'), cache.get('b')
+
+    cache.clear()
+
+    assert cache.stats() == {'items': 0, 'nbytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def test_eviction_by_size():
+    cache = ResultCache(max_items=100, max_bytes=10, sizeof=lambda _: 4)
+    for key in 'abc':
+        cache.put(key, key)
+
+    assert len(cache) == 2
+    assert cache.nbytes == 8
+
+
+def test_too_large_value_is_not_cached():
+    cache = ResultCache(max_items=10, max_bytes=10, sizeof=lambda _: 11)
+    assert cache.put('a', 'a') == 'a'
+    assert len(cache) == 0
+
+
+def test_ttl_expiration():
+    cache = ResultCache(max_items=10, ttl=0.01)
+    cache.put('a', 1)
+    time.sleep(0.02)
+    assert cache.get('a') is None
+    assert cache.nbytes == 0
+
+
+def test_get_or_compute_computes_once_for_concurrent_callers():
+    cache = ResultCache(max_items=10)
+    calls: list[int] = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return 42
+
+    results: list[int] = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 5
+    assert len(calls) == 1
+
+
+def test_disabled_cache_always_computes():
+    cache = ResultCache(max_items=0)
+    assert cache.get_or_compute('k', lambda: 1) == 1
+    assert len(cache) == 0
+
+
+def test_estimate_size_of_data_frame():
+    df = pd.DataFrame({'a': range(1000), 'b': ['x'] * 1000})
+    assert estimate_size(df) >= 8000
+
+
+def test_cached_result_uses_shared_cache():
+    get_result_cache().clear()
+    assert len(data_version()) == 5
+    assert cached_result("test", lambda: 'value', 'apa', cut_off=1) == 'value'
+    assert cached_result("test", lambda: 'other', 'apa', cut_off=1) == 'value'
+    assert cached_result("test", lambda: 'other', 'apa', cut_off=2) == 'other'
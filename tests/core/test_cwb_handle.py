@@ -0,0 +1,82 @@
+import os
+from typing import Any
+
+import pytest
+
+from api_swedeb.core.cwb.handle import CorpusHandleCache
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def registry_dir(tmp_path) -> str:
+    (tmp_path / "test_corpus").write_text("NAME \"test\"\n")
+    return str(tmp_path)
+
+
+def create_cache(check_interval: float = 0.0) -> CorpusHandleCache:
+    return CorpusHandleCache(factory=lambda *args: object(), check_interval=check_interval)
+
+
+def test_handle_is_reused(registry_dir: str):
+    cache: CorpusHandleCache = create_cache()
+
+    first: Any = cache.get(registry_dir, "TEST_CORPUS", "/tmp/data")
+    second: Any = cache.get(registry_dir, "TEST_CORPUS", "/tmp/data")
+
+    assert first is second
+    assert cache.stats() == {'handles': 1, 'created': 1, 'reused': 1, 'recreated': 0}
+
+
+def test_handles_are_keyed_on_data_dir(registry_dir: str):
+    cache: CorpusHandleCache = create_cache()
+
+    assert cache.get(registry_dir, "TEST_CORPUS", "/tmp/a") is not cache.get(registry_dir, "TEST_CORPUS", "/tmp/b")
+
+
+def test_handle_is_recreated_when_registry_changes(registry_dir: str):
+    cache: CorpusHandleCache = create_cache()
+    first: Any = cache.get(registry_dir, "TEST_CORPUS", "/tmp/data")
+
+    registry_file: str = os.path.join(registry_dir, "test_corpus")
+    stat = os.stat(registry_file)
+    os.utime(registry_file, (stat.st_atime, stat.st_mtime + 10))
+
+    assert cache.get(registry_dir, "TEST_CORPUS", "/tmp/data") is not first
+    assert cache.stats()['recreated'] == 1
+
+
+def test_health_is_not_checked_within_interval(registry_dir: str):
+    cache: CorpusHandleCache = create_cache(check_interval=3600)
+    first: Any = cache.get(registry_dir, "TEST_CORPUS", "/tmp/data")
+
+    os.unlink(os.path.join(registry_dir, "test_corpus"))
+
+    assert cache.get(registry_dir, "TEST_CORPUS", "/tmp/data") is first
+
+
+def test_invalidate_drops_handle(registry_dir: str):
+    cache: CorpusHandleCache = create_cache()
+    first: Any = cache.get(registry_dir, "TEST_CORPUS", "/tmp/data")
+
+    cache.invalidate(registry_dir, "TEST_CORPUS", "/tmp/data")
+
+    assert cache.get(registry_dir, "TEST_CORPUS", "/tmp/data") is not first
+
+
+def test_guard_drops_handle_when_query_fails(registry_dir: str):
+    cache: CorpusHandleCache = create_cache(check_interval=3600)
+    first: Any = cache.get(registry_dir, "TEST_CORPUS", "/tmp/data")
+
+    with pytest.raises(ValueError):
+        with cache.guard(registry_dir, "TEST_CORPUS", "/tmp/data"):
+            raise ValueError("invalid search")
+
+    assert cache.get(registry_dir, "TEST_CORPUS", "/tmp/data") is first
+
+    with pytest.raises(BrokenPipeError):
+        with cache.guard(registry_dir, "TEST_CORPUS", "/tmp/data"):
+            raise BrokenPipeError("cqp died")
+
+    assert cache.get(registry_dir, "TEST_CORPUS", "/tmp/data") is not first
+    assert cache.stats()['recreated'] == 1
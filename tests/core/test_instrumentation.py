@@ -0,0 +1,63 @@
+import asyncio
+
+from api_swedeb.core import instrumentation
+from api_swedeb.core.instrumentation import MetricsRegistry, server_timing_header, span
+
+
+def test_span_records_request_timings():
+    token = instrumentation.start_request_timing()
+    try:
+        with span("stage_a"):
+            pass
+
+        @span("stage_b")
+        def stage_b() -> int:
+            return 42
+
+        assert stage_b() == 42
+        assert [name for name, _ in instrumentation.request_timings()] == ["stage_a", "stage_b"]
+    finally:
+        instrumentation.stop_request_timing(token)
+
+    assert instrumentation.request_timings() == []
+
+
+def test_registry_renders_prometheus_histogram():
+    registry: MetricsRegistry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe("x_seconds", 0.05, "Test", span="a")
+    registry.observe("x_seconds", 0.5, "Test", span="a")
+
+    lines: list[str] = registry.render()
+
+    assert "# TYPE x_seconds histogram" in lines
+    assert 'x_seconds_bucket{span="a",le="0.1"} 1' in lines
+    assert 'x_seconds_bucket{span="a",le="1"} 2' in lines
+    assert 'x_seconds_bucket{span="a",le="+Inf"} 2' in lines
+    assert 'x_seconds_count{span="a"} 2' in lines
+
+
+def test_server_timing_header_sums_repeated_spans():
+    header: str = server_timing_header([("decode", 0.001), ("query", 0.010), ("decode", 0.002)], total=0.02)
+    assert header == "decode;dur=3.0, query;dur=10.0, total;dur=20.0"
+
+
+def test_server_timing_middleware_adds_header():
+    from api_swedeb.api.utils.server_timing import ServerTimingMiddleware  # pylint: disable=import-outside-toplevel
+
+    async def app(scope, receive, send):  # pylint: disable=unused-argument
+        with span("work"):
+            pass
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages: list[dict] = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope: dict = {"type": "http", "method": "GET", "path": "/", "headers": [(b"x-server-timing", b"1")]}
+    asyncio.run(ServerTimingMiddleware(app, server_timing="request")(scope, None, send))
+
+    headers: dict[bytes, bytes] = dict(messages[0]["headers"])
+    assert headers[b"server-timing"].startswith(b"work;dur=")
+    assert b"total;dur=" in headers[b"server-timing"]
@@ -0,0 +1,191 @@
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from api_swedeb.core import instrumentation
+from api_swedeb.core.cache import ResultCache
+from api_swedeb.core.load import PATH_CACHE_METRIC, Loader, ZipLoader
+from api_swedeb.core.speech_store import SpeechStore
+from api_swedeb.core.speech_text import SpeechTextRepository, SpeechTextService, build_speech_store
+
+# pylint: disable=redefined-outer-name
+
+
+def utterance(u_id: str, who: str, page_number: int) -> dict:
+    return {
+        'u_id': u_id,
+        'who': who,
+        'speaker_note_id': f'note-{who}',
+        'paragraphs': [f'{u_id} first', f'{u_id} second'],
+        'num_tokens': 4,
+        'num_words': 4,
+        'page_number': page_number,
+    }
+
+
+PROTOCOLS: dict[str, tuple[dict, list[dict]]] = {
+    'prot-1970--ak--001': (
+        {'name': 'prot-1970--ak--001', 'date': '1970-01-01'},
+        [utterance('i-1', 'A', 1), utterance('i-2', 'A', 2), utterance('i-3', 'B', 2)],
+    ),
+    'prot-1970--ak--002': (
+        {'name': 'prot-1970--ak--002', 'date': '1970-01-02'},
+        [utterance('i-4', 'C', 5)],
+    ),
+}
+
+
+class MemoryLoader(Loader):
+    def __init__(self, protocols: dict[str, tuple[dict, list[dict]]]):
+        self.protocols = protocols
+        self.loaded: list[str] = []
+
+    def load(self, protocol_name: str) -> tuple[dict, list[dict]]:
+        self.loaded.append(protocol_name)
+        if protocol_name not in self.protocols:
+            raise FileNotFoundError(protocol_name)
+        return self.protocols[protocol_name]
+
+
+@pytest.fixture
+def document_index() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            'document_id': [0, 1, 2],
+            'document_name': ['prot-1970--ak--001_001', 'prot-1970--ak--001_002', 'prot-1970--ak--002_001'],
+            'speech_id': ['i-1', 'i-3', 'i-4'],
+            'speech_index': [1, 2, 1],
+            'speaker_note_id': ['note-A', 'note-B', 'note-C'],
+            'n_utterances': [2, 1, 1],
+        }
+    )
+
+
+def test_build_speech_store(document_index: pd.DataFrame, tmp_path):
+    filename: str = str(tmp_path / 'speeches.db')
+    service: SpeechTextService = SpeechTextService(document_index.copy())
+
+    assert build_speech_store(filename, source=MemoryLoader(PROTOCOLS), document_index=document_index) == 3
+
+    store: SpeechStore = SpeechStore(filename)
+    assert len(store) == 3
+    for protocol_name, speech_nr in [('prot-1970--ak--001', 1), ('prot-1970--ak--001', 2), ('prot-1970--ak--002', 1)]:
+        metadata, utterances = PROTOCOLS[protocol_name]
+        assert store.get(protocol_name, speech_nr) == service.nth(
+            metadata=metadata, utterances=utterances, n=speech_nr - 1
+        )
+    assert store.get('prot-1970--ak--001', 3) is None
+    assert store.get('prot-1970--ak--003', 1) is None
+
+
+def test_repository_loads_speech_from_store(document_index: pd.DataFrame, tmp_path):
+    filename: str = str(tmp_path / 'speeches.db')
+    build_speech_store(
+        filename,
+        source=MemoryLoader({'prot-1970--ak--001': PROTOCOLS['prot-1970--ak--001']}),
+        document_index=document_index,
+    )
+    loader: MemoryLoader = MemoryLoader(PROTOCOLS)
+    repository: SpeechTextRepository = SpeechTextRepository(
+        source=loader, person_codecs=None, document_index=document_index, store=SpeechStore(filename)
+    )
+
+    speech, has_utterances = repository._load_speech('prot-1970--ak--001', 2)  # pylint: disable=protected-access
+
+    assert has_utterances and speech['u_id'] == 'i-3' and speech['paragraphs'] == ['i-3 first', 'i-3 second']
+    assert not loader.loaded
+
+    speech, _ = repository._load_speech('prot-1970--ak--002', 1)  # pylint: disable=protected-access
+
+    assert speech['u_id'] == 'i-4'
+    assert loader.loaded == ['prot-1970--ak--002']
+
+
+def test_repository_reports_empty_stored_speech_as_missing_utterances(document_index: pd.DataFrame, tmp_path):
+    filename: str = str(tmp_path / 'speeches.db')
+    metadata, _ = PROTOCOLS['prot-1970--ak--002']
+    build_speech_store(
+        filename, source=MemoryLoader({'prot-1970--ak--002': (metadata, [])}), document_index=document_index
+    )
+    loader: MemoryLoader = MemoryLoader(PROTOCOLS)
+    repository: SpeechTextRepository = SpeechTextRepository(
+        source=loader, person_codecs=None, document_index=document_index, store=SpeechStore(filename)
+    )
+
+    speech, has_utterances = repository._load_speech('prot-1970--ak--002', 1)  # pylint: disable=protected-access
+
+    assert speech == {} and not has_utterances
+    assert not loader.loaded
+
+
+def test_zip_loader_caches_parsed_protocols_and_filenames(tmp_path):
+    metadata, utterances = PROTOCOLS['prot-1970--ak--001']
+    (tmp_path / '1970').mkdir()
+    with zipfile.ZipFile(tmp_path / '1970' / 'prot-1970--ak--001.zip', 'w') as fp:
+        fp.writestr('prot-1970--ak--001.json', json.dumps(utterances))
+        fp.writestr('metadata.json', json.dumps(metadata))
+
+    cache: ResultCache = ResultCache(max_items=1, name="protocol")
+    loader: ZipLoader = ZipLoader(str(tmp_path), cache=cache)
+    instrumentation.registry.clear()
+
+    assert loader.load('prot-1970--ak--001') == (metadata, utterances)
+    assert loader.load('prot-1970--ak--001') is loader.load('prot-1970--ak--001')
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+
+    cache.clear()
+    assert loader.load('prot-1970--ak--001') == (metadata, utterances)
+    lookups: dict = instrumentation.registry.counters()[PATH_CACHE_METRIC]
+    assert lookups == {(('result', 'miss'),): 1.0, (('result', 'hit'),): 1.0}
+
+    with pytest.raises(FileNotFoundError):
+        loader.load('prot-1970--ak--002')
+
+
+def test_speech_utterances_are_offsets_within_protocol(document_index: pd.DataFrame):
+    service: SpeechTextService = SpeechTextService(document_index.copy())
+
+    assert service.speech_utterances == {
+        'prot-1970--ak--001_001': ('prot-1970--ak--001', 0, 2),
+        'prot-1970--ak--001_002': ('prot-1970--ak--001', 2, 3),
+        'prot-1970--ak--002_001': ('prot-1970--ak--002', 0, 1),
+    }
+    assert service.protocol2names['prot-1970--ak--001'] == ['prot-1970--ak--001_001', 'prot-1970--ak--001_002']
+
+
+def test_nth_speech(document_index: pd.DataFrame):
+    service: SpeechTextService = SpeechTextService(document_index.copy())
+    metadata, utterances = PROTOCOLS['prot-1970--ak--001']
+
+    speech: dict = service.nth(metadata=metadata, utterances=utterances, n=0)
+
+    assert speech['u_id'] == 'i-1' and speech['paragraphs'] == ['i-1 first', 'i-1 second', 'i-2 first', 'i-2 second']
+    assert (speech['num_tokens'], speech['page_number'], speech['page_number2']) == (8, 1, 2)
+    assert service.nth(metadata=metadata, utterances=utterances, n=1)['u_id'] == 'i-3'
+    assert service.speeches(metadata=metadata, utterances=utterances) == [
+        service.nth(metadata=metadata, utterances=utterances, n=n) for n in range(2)
+    ]
+    with pytest.raises(IndexError):
+        service.nth(metadata=metadata, utterances=utterances, n=2)
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_repository_loads_each_protocol_once_for_batch_of_speeches(document_index: pd.DataFrame, max_workers: int):
+    loader: MemoryLoader = MemoryLoader(PROTOCOLS)
+    repository: SpeechTextRepository = SpeechTextRepository(
+        source=loader, person_codecs=None, document_index=document_index
+    )
+    keys: list[str] = ['prot-1970--ak--001_002', 'i-4', '0', 'i-404']
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        speeches = repository.speeches(keys, executor=executor, max_workers=max_workers)
+
+        assert not loader.loaded
+        assert [key for key, _ in speeches] == ['prot-1970--ak--001_002', '0', 'i-4', 'i-404']
+    assert sorted(loader.loaded) == ['prot-1970--ak--001', 'prot-1970--ak--002']
+
+    with pytest.raises(ValueError, match="unknown speech key"):
+        repository.speeches(['i-1', 'invalid_id'])
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from api_swedeb.api.utils.corpus import Corpus
+from api_swedeb.core.trend_cubes import TrendCubes
+from api_swedeb.core.word_trends import compute_word_trends
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def cubes(api_corpus: Corpus) -> TrendCubes:
+    return TrendCubes(api_corpus.vectorized_corpus)
+
+
+def test_find_keys(cubes: TrendCubes):
+    assert cubes.find_keys([], {}) == frozenset()
+    assert cubes.find_keys(['party_id'], {'party_id': [1], 'year': (1970, 1980)}) == frozenset({'party_id'})
+    assert cubes.find_keys(['person_id'], {'person_id': ['Q1']}) is None
+
+
+def test_cube_sums_equal_corpus_sums(cubes: TrendCubes):
+    corpus = cubes.corpus
+    for keys in cubes.keys:
+        cube = cubes.get(keys)
+        assert cube.n_tokens == corpus.n_tokens
+        assert cube.document_index['n_documents'].sum() <= corpus.n_docs
+        if cubes.is_complete(cube):
+            assert (cube.term_frequency == corpus.term_frequency).all()
+
+
+@pytest.mark.parametrize(
+    'filter_opts',
+    [
+        {},
+        {'year': (1970, 1980)},
+        {'party_id': [1, 2]},
+        {'gender_id': [1, 2], 'chamber_abbrev': ['ek']},
+    ],
+)
+def test_word_trends_from_cubes_equal_word_trends_from_corpus(api_corpus: Corpus, cubes: TrendCubes, filter_opts):
+    terms: list[str] = ['debatt', 'riksdagsdebatt']
+
+    expected: pd.DataFrame = compute_word_trends(
+        api_corpus.vectorized_corpus, api_corpus.person_codecs, terms, dict(filter_opts)
+    )
+    trends: pd.DataFrame = compute_word_trends(
+        api_corpus.vectorized_corpus, api_corpus.person_codecs, terms, dict(filter_opts), cubes=cubes
+    )
+
+    pd.testing.assert_frame_equal(trends, expected, check_dtype=False)
+
+
+def test_stored_cubes_are_loaded(api_corpus: Corpus, cubes: TrendCubes, tmp_path):
+    cubes.store(folder=str(tmp_path), tag='test')
+
+    loaded: TrendCubes = TrendCubes(api_corpus.vectorized_corpus, folder=str(tmp_path), tag='test')
+    keys: frozenset[str] = frozenset({'party_id'})
+
+    assert (loaded.get(keys).bag_term_matrix != cubes.get(keys).bag_term_matrix).nnz == 0
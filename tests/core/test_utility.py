@@ -1,5 +1,11 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from api_swedeb.core.configuration.inject import ConfigValue
-from api_swedeb.core.utility import Lazy, lazy_property, replace_by_patterns
+from api_swedeb.core.utility import Lazy, init_stats, lazy_property, replace_by_patterns
 
 
 def test_lazy_property():
@@ -28,6 +34,71 @@ def test_lazy():
     assert result.value == 42
 
 
+def test_lazy_is_initialized_once_by_concurrent_callers():
+    calls: list[int] = []
+    barrier: threading.Barrier = threading.Barrier(8)
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    lazy: Lazy = Lazy(factory, name="test_concurrent_lazy")
+
+    def get_value():
+        barrier.wait()
+        return lazy.value
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(lambda _: get_value(), range(8)))
+
+    assert len(calls) == 1
+    assert all(v is values[0] for v in values)
+
+    stats = init_stats()["test_concurrent_lazy"]
+    assert stats["initializations"] == 1
+    assert stats["waits"] == 7
+    assert stats["max_wait_seconds"] > 0
+
+
+def test_lazy_retries_after_failed_factory():
+    outcomes: list = [ValueError("boom"), 42]
+
+    def factory():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    lazy: Lazy = Lazy(factory, name="test_failing_lazy")
+
+    with pytest.raises(ValueError):
+        _ = lazy.value
+
+    assert not lazy.is_initialized()
+    assert lazy.value == 42
+    assert init_stats()["test_failing_lazy"]["failures"] == 1
+
+
+def test_lazy_property_is_evaluated_once_by_concurrent_callers():
+    class Test:
+        def __init__(self):
+            self.calls = 0
+
+        @lazy_property
+        def value(self):
+            self.calls += 1
+            time.sleep(0.05)
+            return self.calls
+
+    t = Test()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values = list(executor.map(lambda _: t.value, range(4)))
+
+    assert values == [1, 1, 1, 1]
+    assert t.calls == 1
+
+
 def test_replace_by_patterns():
     assert replace_by_patterns(["apa", " baa "], {"a": "b"}) == ["bpb", " bbb "]
 
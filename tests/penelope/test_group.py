@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+
+from penelope.corpus.dtm.group import (
+    group_DTM_by_category_indices_mapping,
+    group_DTM_by_category_series,
+    group_DTM_by_indices_mapping,
+)
+
+# Reference (row by row) implementations that the sparse indicator matrix versions replaced
+
+
+def reference_group_by_indices_mapping(dtm, n_docs, category_indices, aggregate, dtype) -> np.ndarray:
+    matrix: np.ndarray = np.zeros((n_docs, dtm.shape[1]), dtype=dtype)
+    for document_id, indices in category_indices.items():
+        if len(indices) > 0:
+            rows = dtm[indices, :]
+            matrix[document_id, :] = rows.mean(axis=0) if aggregate == 'mean' else rows.sum(axis=0)
+    return matrix
+
+
+def reference_group_by_category_series(dtm, category_series, categories, aggregate) -> np.ndarray:
+    dtype = np.int64 if aggregate == 'sum' else np.float64
+    matrix: np.ndarray = np.zeros((len(categories), dtm.shape[1]), dtype=dtype)
+    for i, value in enumerate(categories):
+        indices = category_series[category_series == value].index.tolist()
+        if len(indices) > 0:
+            rows = dtm[indices, :]
+            matrix[i, :] = rows.mean(axis=0) if aggregate == 'mean' else rows.sum(axis=0)
+    return matrix
+
+
+@pytest.fixture
+def dtm() -> sp.csr_matrix:
+    rng: np.random.Generator = np.random.default_rng(42)
+    return sp.csr_matrix((rng.integers(1, 10, size=(40, 25)) * (rng.random((40, 25)) < 0.2)).astype(np.int32))
+
+
+@pytest.mark.parametrize('aggregate', ['sum', 'mean'])
+def test_group_by_indices_mapping(dtm: sp.csr_matrix, aggregate: str):
+    category_indices: dict[int, list[int]] = {0: [0, 5, 7], 1: [], 2: [1, 2, 3, 39], 4: [10]}
+    dtype = np.int32 if aggregate == 'sum' else np.float64
+
+    matrix: sp.csr_matrix = group_DTM_by_indices_mapping(dtm, 5, category_indices, aggregate=aggregate)
+
+    assert sp.isspmatrix_csr(matrix)
+    assert matrix.dtype == dtype
+    assert np.allclose(matrix.toarray(), reference_group_by_indices_mapping(dtm, 5, category_indices, aggregate, dtype))
+
+
+@pytest.mark.parametrize('aggregate', ['sum', 'mean'])
+def test_group_by_category_series(dtm: sp.csr_matrix, aggregate: str):
+    category_series: pd.Series = pd.Series(np.random.default_rng(1).integers(1970, 1975, size=dtm.shape[0]))
+    categories: list[int] = list(range(1969, 1976))
+
+    matrix: sp.csr_matrix = group_DTM_by_category_series(
+        dtm, category_series=category_series, categories=categories, aggregate=aggregate
+    )
+
+    assert sp.issparse(matrix)
+    assert np.allclose(
+        matrix.toarray(), reference_group_by_category_series(dtm, category_series, categories, aggregate)
+    )
+
+
+@pytest.mark.parametrize('aggregate', ['sum', 'mean'])
+def test_group_by_category_indices_mapping(dtm: sp.csr_matrix, aggregate: str):
+    document_index: pd.DataFrame = pd.DataFrame({'decade': [1970, 1980, 1990]})
+    category_indices: dict[int, list[int]] = {1970: list(range(0, 10)), 1990: list(range(20, 40))}
+
+    matrix: sp.csr_matrix = group_DTM_by_category_indices_mapping(
+        bag_term_matrix=dtm,
+        category_indices=category_indices,
+        aggregate=aggregate,
+        document_index=document_index,
+        pivot_column_name='decade',
+    )
+
+    expected: np.ndarray = reference_group_by_indices_mapping(
+        dtm, 3, {0: category_indices[1970], 1: [], 2: category_indices[1990]}, aggregate, np.float64
+    )
+    assert np.allclose(matrix.toarray(), expected)
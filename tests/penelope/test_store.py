@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+import scipy
+
+from penelope.corpus import VectorizedCorpus
+from penelope.corpus.dtm.store import load_memory_mapped, memory_mapped_exists
+from penelope.corpus.dtm.vocabulary import MemoryMappedVocabulary
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def corpus() -> VectorizedCorpus:
+    bag_term_matrix = scipy.sparse.csr_matrix(np.array([[2, 1, 0, 0], [0, 3, 0, 1], [1, 0, 4, 0]], dtype=np.int32))
+    token2id: dict[str, int] = {'öl': 0, 'abc': 1, 'ab': 2, 'zebra': 3}
+    document_index: pd.DataFrame = pd.DataFrame(
+        {'document_id': [0, 1, 2], 'document_name': ['a', 'b', 'c'], 'filename': ['a', 'b', 'c'], 'year': [1970] * 3}
+    )
+    return VectorizedCorpus(bag_term_matrix=bag_term_matrix, token2id=token2id, document_index=document_index)
+
+
+def test_memory_mapped_vocabulary_lookup():
+    vocabulary: MemoryMappedVocabulary = MemoryMappedVocabulary.create(['öl', 'abc', 'ab', 'zebra'])
+
+    assert len(vocabulary) == 4
+    assert [vocabulary[t] for t in ['öl', 'abc', 'ab', 'zebra']] == [0, 1, 2, 3]
+    assert 'a' not in vocabulary and 'zz' not in vocabulary and 'ab' in vocabulary
+    assert vocabulary.get('missing') is None
+    assert list(vocabulary) == ['öl', 'abc', 'ab', 'zebra']
+    assert vocabulary.id2token[3] == 'zebra'
+    assert vocabulary.to_dict() == {'öl': 0, 'abc': 1, 'ab': 2, 'zebra': 3}
+
+    with pytest.raises(KeyError):
+        _ = vocabulary['a']
+
+
+def test_dump_and_load_memory_mapped(corpus: VectorizedCorpus, tmp_path):
+    corpus.dump(tag='test', folder=str(tmp_path), memory_mapped=True)
+
+    assert memory_mapped_exists(tag='test', folder=str(tmp_path))
+    assert VectorizedCorpus.dump_exists(tag='test', folder=str(tmp_path))
+    assert VectorizedCorpus.find_tags(str(tmp_path)) == ['test']
+
+    loaded: VectorizedCorpus = VectorizedCorpus.load(tag='test', folder=str(tmp_path))
+
+    assert isinstance(loaded.token2id, MemoryMappedVocabulary)
+    assert loaded.source == (str(tmp_path), 'test') and corpus.source is None
+    assert loaded.slice_by_indices([0, 1]).source is None
+    assert isinstance(loaded.bag_term_matrix.data, np.memmap)
+    assert dict(loaded.token2id) == corpus.token2id
+    assert loaded.id2token[0] == 'öl'
+    assert (loaded.bag_term_matrix != corpus.bag_term_matrix).nnz == 0
+    assert loaded.get_word_vector('abc').tolist() == [1, 3, 0]
+    assert isinstance(loaded.token2id.reversed_order, np.memmap)
+    assert isinstance(loaded.vocabulary_index.sorted_ids, np.memmap)
+    assert set(loaded.vocabulary_index.find(['ab*', '*l'])) == {'ab', 'abc', 'öl'}
+
+    in_memory: VectorizedCorpus = VectorizedCorpus.load(tag='test', folder=str(tmp_path), memory_mapped=False)
+    assert isinstance(in_memory.token2id, dict)
+    assert not isinstance(in_memory.bag_term_matrix.data, np.memmap)
+    assert (in_memory.bag_term_matrix != corpus.bag_term_matrix).nnz == 0
+
+
+def test_load_memory_mapped_does_not_copy_arrays(corpus: VectorizedCorpus, tmp_path):
+    corpus.dump(tag='test', folder=str(tmp_path), memory_mapped=True)
+
+    matrix, _ = load_memory_mapped(tag='test', folder=str(tmp_path))
+
+    assert all(isinstance(x, np.memmap) for x in (matrix.data, matrix.indices, matrix.indptr))
+    assert matrix.shape == corpus.bag_term_matrix.shape
+
+
+def test_word_postings(corpus: VectorizedCorpus):
+    document_ids, counts = corpus.get_word_postings('abc')
+
+    assert document_ids.tolist() == [0, 1]
+    assert counts.tolist() == [1, 3]
+    assert corpus.get_word_postings('zebra')[0].tolist() == [1]
+    assert corpus.get_word_vector('ab').tolist() == [0, 0, 4]
+    assert corpus.get_columns([2, 0]).tolist() == [[0, 2], [0, 0], [4, 1]]
+
+
+def test_word_postings_and_columns_without_postings_are_read_from_matrix(corpus: VectorizedCorpus):
+    words: list[str] = ['öl', 'abc', 'ab', 'zebra']
+    from_matrix: list[tuple[list, list]] = [tuple(x.tolist() for x in corpus.get_word_postings(w)) for w in words]
+
+    from_matrix_columns: list[list[int]] = corpus.get_columns([2, 0]).tolist()
+
+    assert not corpus.has_postings
+    _ = corpus.postings
+    assert corpus.has_postings
+    assert from_matrix == [tuple(x.tolist() for x in corpus.get_word_postings(w)) for w in words]
+    assert from_matrix_columns == corpus.get_columns([2, 0]).tolist()
+
+    other: VectorizedCorpus = corpus.slice_by_indices([0, 1])
+    assert other._postings_lock is not corpus._postings_lock  # pylint: disable=protected-access
+
+
+def test_postings_are_stored_and_memory_mapped(corpus: VectorizedCorpus, tmp_path):
+    corpus.dump(tag='test', folder=str(tmp_path), memory_mapped=True)
+
+    loaded: VectorizedCorpus = VectorizedCorpus.load(tag='test', folder=str(tmp_path))
+
+    assert isinstance(loaded.postings.indices, np.memmap)
+    assert (loaded.postings != corpus.bag_term_matrix.tocsc()).nnz == 0
+    assert loaded.get_word_postings('öl')[0].tolist() == [0, 2]
+
+
+def test_derived_statistics_are_cached_until_matrix_is_replaced(corpus: VectorizedCorpus):
+    assert corpus.term_frequency.tolist() == [3, 4, 4, 1]
+    assert corpus.document_frequency.tolist() == [2, 2, 1, 1]
+    assert corpus.document_token_counts.tolist() == [3, 4, 5]
+    assert corpus.vocabulary == ['öl', 'abc', 'ab', 'zebra']
+    assert corpus.term_frequency is corpus.term_frequency
+    assert set(corpus.derived_stats_info()) >= {'term_frequency', 'document_frequency', 'document_token_counts'}
+
+    corpus.slice_by_indices([1, 3], inplace=True)
+
+    assert 'term_frequency' not in corpus.derived_stats_info()
+    assert corpus.term_frequency.tolist() == [4, 1]
+    assert corpus.document_frequency.tolist() == [2, 1]
+    assert corpus.vocabulary == ['abc', 'zebra']
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from penelope.corpus.dtm.corpus import find_matching_words_in_vocabulary
+from penelope.corpus.dtm.vocabulary import MemoryMappedVocabulary, VocabularyIndex, regexp_literals, wildcard_literals
+
+# pylint: disable=redefined-outer-name
+
+TOKENS: list[str] = [
+    'debatt',
+    'debatten',
+    'debatter',
+    'remissdebatt',
+    'generaldebatt',
+    'sakdebatt',
+    'debattör',
+    'bat',
+    'abc',
+    'abcd',
+    'cab',
+    'sverige',
+    'sveriges',
+    'övrigt',
+]
+
+
+@pytest.fixture(scope="module")
+def index() -> VocabularyIndex:
+    frequencies: np.ndarray = np.arange(len(TOKENS)) * 7 % len(TOKENS)
+    return VocabularyIndex(TOKENS, frequencies)
+
+
+def test_wildcard_literals():
+    assert wildcard_literals('abc*') == ('abc', '', ['abc'])
+    assert wildcard_literals('*abc') == ('', 'abc', ['abc'])
+    assert wildcard_literals('a*bc?d[ef]g') == ('a', 'g', ['a', 'bc', 'd', 'g'])
+
+
+def test_regexp_literals():
+    assert regexp_literals('^abc+d.*ef$') == ('ab', ['ab', 'd', 'ef'])
+    assert regexp_literals('ab|cd') == ('', [])
+    assert regexp_literals('(?i)abc') == ('', [])
+
+
+@pytest.mark.parametrize(
+    'expr',
+    [
+        'debatt*',
+        '*debatt',
+        '*debatt*',
+        '*bat*',
+        'sverige?',
+        's*e',
+        '[ab]*',
+        '*',
+        '|.*debatt$|',
+        '|^deb.*r$|',
+        '|sv|ab|',
+        'debatt',
+        'saknas',
+        'saknas*',
+    ],
+)
+def test_index_matches_vocabulary_scan(index: VocabularyIndex, expr: str):
+    token2id: dict[str, int] = {t: i for i, t in enumerate(TOKENS)}
+
+    words: list[str] = index.find([expr])
+
+    assert set(words) == find_matching_words_in_vocabulary(token2id, {expr})
+    assert set(words) == find_matching_words_in_vocabulary(token2id, {expr}, index=index)
+    frequencies: list[int] = [index.frequencies[token2id[w]] for w in words]
+    assert frequencies == sorted(frequencies, reverse=True)
+
+
+@pytest.mark.parametrize('expr', ['debatt*', '*debatt', '*bat*', 's*e', '|^deb.*r$|', 'debatt', 'saknas*'])
+def test_index_of_memory_mapped_vocabulary_equals_index_of_token_list(index: VocabularyIndex, expr: str):
+    vocabulary: MemoryMappedVocabulary = MemoryMappedVocabulary.create(TOKENS)
+    mmap_index: VocabularyIndex = VocabularyIndex(
+        vocabulary.id2token, index.frequencies, sorted_ids=vocabulary.order, reversed_ids=vocabulary.reversed_order
+    )
+
+    assert mmap_index.find([expr]) == index.find([expr])
+    assert mmap_index.complete(expr.strip('*|^'), 3) == index.complete(expr.strip('*|^'), 3)
+
+
+def test_find_returns_n_top_most_frequent(index: VocabularyIndex):
+    words: list[str] = index.find(['*debatt*', 'sverige'], n_top=3)
+
+    assert len(words) == 3
+    assert index.find(['*debatt*', 'sverige'])[:3] == words
+
+
+@pytest.mark.parametrize('prefix', ['d', 'de', 'deb', 'debatt', 's', 'x', ''])
+@pytest.mark.parametrize('n_top', [1, 2, 5])
+def test_complete_equals_ranked_prefix_matches(prefix: str, n_top: int):
+    index: VocabularyIndex = VocabularyIndex(
+        TOKENS, np.arange(len(TOKENS)) * 7 % len(TOKENS), top_k=2, max_prefix_length=3
+    )
+    expected: list[str] = index.find([f'{prefix}*'])[:n_top] if prefix else index.find(['*'])[:n_top]
+
+    assert index.complete(prefix, n_top) == expected
+    assert index.find([f'{prefix}*'], n_top=n_top) == expected
+
+
+def test_completions_are_stored_for_frequent_short_prefixes():
+    index: VocabularyIndex = VocabularyIndex(TOKENS, np.arange(len(TOKENS)), top_k=2, max_prefix_length=3)
+
+    assert set(index.completions) == {'d', 'de', 'deb', 's'}
+    assert all(len(ids) == 2 for ids in index.completions.values())
@@ -0,0 +1,75 @@
+"""Compares per-row pydantic serialization with vectorized serialization of a 100k row KWIC result.
+
+Usage: PYTHONPATH=. python tests/profile_serialization.py
+"""
+
+import json
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from api_swedeb.api.utils.serialization import frame_to_json
+from api_swedeb.schemas.kwic_schema import KeywordInContextItem, KeywordInContextResult
+
+
+def create_kwic_frame(n_rows: int) -> pd.DataFrame:
+    rng: np.random.Generator = np.random.default_rng(seed=42)
+    words: np.ndarray = np.array(['det', 'är', 'vi', 'som', 'skatt', 'försvar', 'regeringen', 'riksdagen'])
+    return pd.DataFrame(
+        {
+            'left_word': [' '.join(x) for x in rng.choice(words, size=(n_rows, 2))],
+            'node_word': rng.choice(words, size=n_rows),
+            'right_word': [' '.join(x) for x in rng.choice(words, size=(n_rows, 2))],
+            'year': rng.integers(1867, 2022, size=n_rows),
+            'name': rng.choice(['Anna Andersson', 'Bo Berg', 'Cecilia Ceder'], size=n_rows),
+            'party_abbrev': rng.choice(['S', 'M', 'C', 'L'], size=n_rows),
+            'gender': rng.choice(['Kvinna', 'Man'], size=n_rows),
+            'person_id': rng.choice(['i-1', 'i-2', 'i-3'], size=n_rows),
+            'link': 'https://www.wikidata.org/wiki/Q1',
+            'speech_name': 'Andra kammaren 1970:29 001',
+            'speech_link': 'https://pdf.swedeb.se/riksdagen-records-pdf/1970/prot-1970--ak--029.pdf#page=1',
+            'gender_abbrev': rng.choice(['K', 'M'], size=n_rows),
+            'document_name': 'prot-1970--ak--029_001',
+            'chamber_abbrev': 'ak',
+            'speech_id': 'i-1',
+            'wiki_id': 'Q1',
+            'document_id': np.arange(n_rows),
+            'party': 'Socialdemokraterna',
+        }
+    )
+
+
+def per_row_pydantic(data: pd.DataFrame) -> bytes:
+    rows: list[KeywordInContextItem] = [KeywordInContextItem(**row) for row in data.to_dict(orient="records")]
+    return KeywordInContextResult(kwic_list=rows).model_dump_json().encode("utf-8")
+
+
+def vectorized(data: pd.DataFrame) -> bytes:
+    return frame_to_json(data, KeywordInContextItem, "kwic_list")
+
+
+def timeit(fx, data: pd.DataFrame, repeats: int = 3) -> tuple[float, bytes]:
+    timings: list[float] = []
+    for _ in range(repeats):
+        start: float = perf_counter()
+        result: bytes = fx(data)
+        timings.append(perf_counter() - start)
+    return min(timings), result
+
+
+def run_benchmark(n_rows: int = 100_000) -> None:
+    data: pd.DataFrame = create_kwic_frame(n_rows)
+
+    elapsed_pydantic, expected = timeit(per_row_pydantic, data)
+    elapsed_vectorized, result = timeit(vectorized, data)
+
+    assert json.loads(result)['kwic_list'] == json.loads(expected)['kwic_list']
+
+    logger.info(f"{n_rows} rows: per-row pydantic {elapsed_pydantic:.3f}s, vectorized {elapsed_vectorized:.3f}s")
+    logger.info(f"speedup: {elapsed_pydantic / elapsed_vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
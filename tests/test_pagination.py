@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from api_swedeb.api.utils.common_params import CommonQueryParams
+from api_swedeb.api.utils.pagination import paginate
+from api_swedeb.core.cache import get_cursor_cache
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame({'year': [1970, 1960, 1980, 1950, 1990], 'name': ['a', 'b', 'c', 'd', 'e']})
+
+
+def create_params(**kwargs) -> CommonQueryParams:
+    return CommonQueryParams(**kwargs).resolve()
+
+
+def test_paginate_without_paging_returns_all_rows(data: pd.DataFrame):
+    page, info = paginate(data, create_params(), key="test")
+    assert len(page) == 5
+    assert info == {'total': 5, 'offset': None, 'limit': None}
+    assert page.year.tolist() == data.year.tolist()
+
+
+def test_paginate_slices_rows(data: pd.DataFrame):
+    page, info = paginate(data, create_params(limit=2, offset=1), key="test")
+    assert page.name.tolist() == ['b', 'c']
+    assert info == {'total': 5, 'offset': 1, 'limit': 2}
+
+
+def test_paginate_offset_beyond_end_returns_empty_page(data: pd.DataFrame):
+    page, info = paginate(data, create_params(limit=2, offset=10), key="test")
+    assert len(page) == 0
+    assert info['total'] == 5
+
+
+@pytest.mark.parametrize('sort_order,expected', [('asc', [1950, 1960]), ('desc', [1990, 1980])])
+def test_paginate_sorts_by_column(data: pd.DataFrame, sort_order: str, expected: list[int]):
+    get_cursor_cache().clear()
+    page, _ = paginate(data, create_params(limit=2, offset=0, sort_by='year', sort_order=sort_order), key="test")
+    assert page.year.tolist() == expected
+
+
+def test_paginate_ignores_unknown_sort_column(data: pd.DataFrame):
+    page, _ = paginate(data, create_params(limit=5, sort_by='year_title'), key="test")
+    assert page.year.tolist() == data.year.tolist()
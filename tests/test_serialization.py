@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from api_swedeb.api.utils.serialization import conform_frame, frame_to_json
+from api_swedeb.schemas.kwic_schema import KeywordInContextItem, KeywordInContextResult
+from api_swedeb.schemas.metadata_schema import SpeakerItem, SpeakerResult
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def kwic_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            'left_word': ['det är', 'vi har'],
+            'node_word': ['skatt', 'skatter'],
+            'right_word': ['som vi', 'på arbete'],
+            'year': [1970.0, 1971.0],
+            'name': ['Anna', 'Bo'],
+            'document_id': np.array([1, 2], dtype=np.int32),
+            'chamber_abbrev': pd.Categorical(['ak', 'fk']),
+            'extra_column': [1, 2],
+        }
+    )
+
+
+def test_frame_to_json_has_same_shape_as_model(kwic_data: pd.DataFrame):
+    expected = KeywordInContextResult(
+        kwic_list=[KeywordInContextItem(**row) for row in kwic_data.to_dict(orient="records")], total=2
+    ).model_dump()
+
+    result = json.loads(frame_to_json(kwic_data, KeywordInContextItem, "kwic_list", total=2, offset=None, limit=None))
+
+    assert result == expected
+
+
+def test_conform_frame_converts_integral_floats_to_int():
+    data = pd.DataFrame(
+        {'name': ['a', 'b'], 'party_abbrev': ['S', 'M'], 'year_of_birth': [1900.0, np.nan], 'person_id': ['p1', 'p2']}
+    )
+
+    frame = conform_frame(data, SpeakerItem)
+
+    assert list(frame.columns) == list(SpeakerItem.model_fields)
+    assert json.loads(frame_to_json(data, SpeakerItem, "speaker_list")) == {
+        'speaker_list': [
+            {'name': 'a', 'party_abbrev': 'S', 'year_of_birth': 1900, 'year_of_death': None, 'person_id': 'p1'},
+            {'name': 'b', 'party_abbrev': 'M', 'year_of_birth': None, 'year_of_death': None, 'person_id': 'p2'},
+        ]
+    }
+    assert SpeakerResult(
+        **json.loads(frame_to_json(data.assign(year_of_death=[1980, 1990]).iloc[:1], SpeakerItem, "speaker_list"))
+    )
+
+
+def test_conform_frame_raises_on_missing_required_column():
+    with pytest.raises(ValueError):
+        conform_frame(pd.DataFrame({'name': ['a']}), SpeakerItem)
+
+
+def test_conform_frame_raises_on_non_integer_values():
+    data = pd.DataFrame({'name': ['a'], 'party_abbrev': ['S'], 'year_of_birth': [1900.5]})
+    with pytest.raises(ValueError):
+        conform_frame(data, SpeakerItem)
+
+
+def test_conform_frame_raises_on_non_string_values():
+    data = pd.DataFrame({'name': ['a', 1], 'party_abbrev': ['S', None], 'person_id': ['p1', 'p2']})
+    with pytest.raises(ValueError):
+        conform_frame(data, SpeakerItem)
+    assert conform_frame(data.assign(name=['a', None]), SpeakerItem)['name'].isna().tolist() == [False, True]
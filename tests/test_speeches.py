@@ -1,3 +1,6 @@
+import io
+import zipfile
+
 import pandas as pd
 import pytest
 import requests
@@ -8,11 +11,11 @@ from loguru import logger
 
 from api_swedeb.api.utils.common_params import CommonQueryParams
 from api_swedeb.api.utils.corpus import Corpus
-from api_swedeb.api.utils.speech import get_speeches
+from api_swedeb.api.utils.speech import get_speech_texts_by_ids, get_speeches_frame, zip_speeches
 from api_swedeb.core.configuration.inject import ConfigValue
 from api_swedeb.core.speech import Speech
 from api_swedeb.core.utility import format_protocol_id
-from api_swedeb.schemas.speeches_schema import SpeechesResult
+from api_swedeb.schemas.speech_text_schema import SpeechesTextBatchResult
 
 # these tests mainly check that the endpoints are reachable and returns something
 # the actual content of the response is not checked
@@ -108,6 +111,13 @@ def test_get_speaker_name_for_non_existing_speech(api_corpus: Corpus):
     assert speaker == unknown
 
 
+def test_get_speaker_names_equals_get_speaker(api_corpus: Corpus):
+    dockument_name, speech_id = find_a_speech_id(api_corpus)
+    ids: list[str] = [dockument_name, speech_id, "prot-1974--136_032", "prot-made_up_and_missing"]
+
+    assert api_corpus.get_speaker_names(ids) == {x: api_corpus.get_speaker(x) for x in ids}
+
+
 def test_format_speech_id():
     prot = 'prot-1966-höst-fk--38_044'
     assert format_protocol_id(prot) == 'Första kammaren 1966:38 044'
@@ -283,8 +293,37 @@ def test_get_speech_party_bug():
 
     args: CommonQueryParams = CommonQueryParams(from_year=1867, to_year=1900).resolve()
 
-    result: SpeechesResult = get_speeches(commons=args, corpus=corpus)
+    speeches, page_info = get_speeches_frame(commons=args, corpus=corpus)
 
-    assert len(df) == len(result.speech_list)
+    assert len(df) == len(speeches) == page_info['total']
 
     assert df.year.between(1867, 1900).all()
+
+
+def test_zip_speeches_streams_one_entry_per_speech():
+    speeches = [(f"i-{i}", Speech({"paragraphs": [f"text {i}"]})) for i in range(3)]
+
+    chunks: list[bytes] = list(zip_speeches(speeches, {f"i-{i}": "Olof Palme" for i in range(3)}))
+
+    assert len(chunks) == 4
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+        assert zip_file.namelist() == ["Olof Palme_i-0.txt", "Olof Palme_i-1.txt", "Olof Palme_i-2.txt"]
+        assert zip_file.read("Olof Palme_i-2.txt").decode("utf-8") == "text 2"
+
+
+def test_get_speech_texts_by_ids_returns_texts_in_request_order():
+    class BatchCorpus:
+        def __init__(self):
+            self.requested: list[str] = []
+
+        def get_speeches_by_ids(self, ids: list[str], executor=None, max_workers: int = 1):
+            self.requested.extend(ids)
+            return [(speech_id, Speech({"paragraphs": [speech_id], "page_number": 3})) for speech_id in sorted(ids)]
+
+    corpus: BatchCorpus = BatchCorpus()
+    result: SpeechesTextBatchResult = get_speech_texts_by_ids(["i-2", "i-1", "i-2"], corpus)
+
+    assert corpus.requested == ["i-2", "i-1"]
+
+    assert [item.speech_id for item in result.speech_list] == ["i-2", "i-1", "i-2"]
+    assert [(item.speech_text, item.page_number, item.speaker_note) for item in result.speech_list][1] == ("i-1", 3, "")
@@ -0,0 +1,61 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from api_swedeb.api.utils.streaming import encode_frame, model_columns, stream_frame
+from api_swedeb.schemas.kwic_schema import KeywordInContextItem
+from api_swedeb.schemas.response_format import ResponseFormat
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            'left_word': ['a', 'b', 'c'],
+            'node_word': ['skatt', 'skatt', 'skatter'],
+            'right_word': ['x', 'y', 'z'],
+            'year': [1970, 1971, 1972],
+            'not_in_model': [1, 2, 3],
+        }
+    )
+
+
+def test_model_columns(data: pd.DataFrame):
+    assert model_columns(data, KeywordInContextItem) == ['left_word', 'node_word', 'right_word', 'year']
+
+
+def test_encode_ndjson_in_chunks(data: pd.DataFrame):
+    chunks = list(encode_frame(data, ResponseFormat.ndjson, chunk_size=2))
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b''.join(chunks).decode('utf-8').splitlines()]
+    assert [row['node_word'] for row in rows] == ['skatt', 'skatt', 'skatter']
+
+
+def test_encode_csv_writes_header_once(data: pd.DataFrame):
+    text: str = b''.join(encode_frame(data, ResponseFormat.csv, chunk_size=2)).decode('utf-8')
+    assert pd.read_csv(io.StringIO(text)).equals(data)
+
+
+def test_encode_arrow_stream(data: pd.DataFrame):
+    pa = pytest.importorskip("pyarrow")
+    buffer: bytes = b''.join(encode_frame(data, ResponseFormat.arrow, chunk_size=2))
+    table = pa.ipc.open_stream(buffer).read_all()
+    assert table.to_pandas().equals(data)
+
+
+def test_stream_frame_restricts_columns_to_model(data: pd.DataFrame):
+    response = stream_frame(data, ResponseFormat.ndjson, model=KeywordInContextItem, total=10)
+    assert response.headers['X-Total-Count'] == '10'
+    assert response.media_type == 'application/x-ndjson'
+
+
+def test_kwic_endpoint_streams_ndjson(fastapi_client):
+    response = fastapi_client.get("v1/tools/kwic/debatt?format=ndjson")
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    for line in response.text.splitlines():
+        assert 'node_word' in json.loads(line)
@@ -6,8 +6,13 @@ from fastapi.testclient import TestClient
 
 from api_swedeb.api.utils.common_params import CommonQueryParams
 from api_swedeb.api.utils.corpus import Corpus
+from api_swedeb.core.cache import get_corpus_cache
+from api_swedeb.core.word_trends import SweDebComputeOpts, SweDebTrendsData, compute_word_trends
 from api_swedeb.schemas.speeches_schema import SpeechesResultItemWT, SpeechesResultWT
 from api_swedeb.schemas.word_trends_schema import WordTrendsItem, WordTrendsResult
+from penelope.common.keyness import KeynessMetric
+from penelope.corpus import VectorizedCorpus
+from penelope.utility import PropertyValueMaskingOpts
 
 # pylint: disable=redefined-outer-name
 
@@ -393,3 +398,76 @@ def test_word_trends_by_year_and_chamber_bug(fastapi_client: TestClient):
     assert all(y in range(1970, 1976) for y in [wt['year'] for wt in word_res])
     assert all(all(w.startswith('sverige') for w in wt['count']) for wt in word_res)
     assert all(all(isinstance(w, int) for w in wt['count'].values()) for wt in word_res)
+
+
+def test_transformed_corpus_is_shared_between_requests(api_corpus: Corpus):
+    def transformed(words: list[str]) -> VectorizedCorpus:
+        trends_data: SweDebTrendsData = SweDebTrendsData(
+            corpus=api_corpus.vectorized_corpus, person_codecs=api_corpus.person_codecs
+        )
+        opts: SweDebComputeOpts = SweDebComputeOpts(
+            normalize=False,
+            keyness=KeynessMetric.TF,
+            temporal_key="year",
+            pivot_keys_id_names=['party_id'],
+            filter_opts=PropertyValueMaskingOpts(party_id=[1, 2]),
+            words=words,
+        )
+        return trends_data.transform(opts).transformed_corpus
+
+    get_corpus_cache().clear()
+
+    assert transformed(['debatt']) is transformed(['sverige'])
+    assert get_corpus_cache().stats()['items'] == 1
+
+
+def test_column_sliced_transformed_corpus_is_cached_per_column_set(api_corpus: Corpus):
+    def transformed(words: list[str]) -> VectorizedCorpus:
+        trends_data: SweDebTrendsData = SweDebTrendsData(
+            corpus=api_corpus.vectorized_corpus, person_codecs=api_corpus.person_codecs
+        )
+        opts: SweDebComputeOpts = SweDebComputeOpts(
+            normalize=False,
+            keyness=KeynessMetric.TF,
+            temporal_key="year",
+            pivot_keys_id_names=['party_id'],
+            words=words,
+            column_slice=True,
+        )
+        return trends_data.transform(opts).transformed_corpus
+
+    get_corpus_cache().clear()
+
+    assert transformed(['debatt']).vocabulary == ['debatt']
+    assert transformed(['sverige']).vocabulary == ['sverige']
+    assert sorted(transformed(['sverige', 'debatt']).vocabulary) == ['debatt', 'sverige']
+    assert transformed(['debatt', 'sverige']) is transformed(['sverige', 'debatt'])
+    assert get_corpus_cache().stats() | {'nbytes': 0} == {
+        'items': 3,
+        'nbytes': 0,
+        'hits': 2,
+        'misses': 3,
+        'evictions': 0,
+    }
+
+
+@pytest.mark.parametrize(
+    'filter_opts',
+    [
+        {},
+        {'year': (1970, 1980)},
+        {'party_id': [1, 2]},
+        {'gender_id': [1, 2], 'chamber_abbrev': ['ek']},
+    ],
+)
+def test_column_sliced_word_trends_equal_full_word_trends(api_corpus: Corpus, filter_opts):
+    terms: list[str] = ['debatt', 'riksdagsdebatt', 'sverige*']
+
+    expected: pd.DataFrame = compute_word_trends(
+        api_corpus.vectorized_corpus, api_corpus.person_codecs, terms, dict(filter_opts), column_slice=False
+    )
+    trends: pd.DataFrame = compute_word_trends(
+        api_corpus.vectorized_corpus, api_corpus.person_codecs, terms, dict(filter_opts), column_slice=True
+    )
+
+    pd.testing.assert_frame_equal(trends[sorted(trends.columns)], expected[sorted(expected.columns)], check_dtype=False)